@@ -21,6 +21,29 @@ options:
     default: https://api.hetzner.cloud/v1
     type: str
     aliases: [endpoint]
+  shared_rate_limit:
+    description:
+      - Share the API rate limit with the other module processes using the same API Token on this host.
+      - Requests of parallel tasks (e.g. using C(delegate_to=localhost) with many forks) are then spread
+        across the processes, instead of all processes hitting the rate limit and backing off together.
+      - You can also set this option by using the C(HCLOUD_SHARED_RATE_LIMIT) environment variable.
+    default: false
+    type: bool
+  catalog_cache_dir:
+    description:
+      - Directory used to cache the rarely changing resources (server types, system and app images, locations,
+        datacenters, load balancer types and ISOs) between the module invocations, using the same API Endpoint and
+        API Token.
+      - The cache is invalidated when a module changes a cached resource, e.g. when creating an image.
+      - When not set, the resources are only cached during each module invocation.
+      - You can also set this option by using the C(HCLOUD_CATALOG_CACHE_DIR) environment variable.
+    type: path
+  catalog_cache_ttl:
+    description:
+      - Time to live in seconds of the resources cached in O(catalog_cache_dir).
+      - You can also set this option by using the C(HCLOUD_CATALOG_CACHE_TTL) environment variable.
+    default: 3600
+    type: int
 
 requirements:
   - python-dateutil >= 2.7.5
@@ -31,3 +54,39 @@ seealso:
     description: Complete reference for the Hetzner Cloud API.
     link: https://docs.hetzner.cloud
 """
+
+    RESOURCE_LOCK = """
+options:
+  resource_lock:
+    description:
+      - Serialize the changes on the same resource with the other module processes using the same API Token on this host.
+      - Parallel tasks changing the same resource (e.g. using C(delegate_to=localhost) with many forks) then wait for
+        each other, instead of retrying the requests that failed with a conflict.
+      - The actions started while holding the lock are always waited for before releasing it, even when using
+        O(wait=false).
+      - You can also set this option by using the C(HCLOUD_RESOURCE_LOCK) environment variable.
+    default: false
+    type: bool
+"""
+
+    WAIT = """
+options:
+  wait:
+    description:
+      - Wait for the actions started by the module to finish.
+      - When V(false), the module only waits for an action before starting the next one, and returns the IDs of
+        the actions still running in RV(action_ids), e.g. to wait for them later using M(hetzner.hcloud.action_wait).
+      - The returned resource reflects its state when the last actions were started.
+    default: true
+    type: bool
+  wait_timeout:
+    description:
+      - Time in seconds to wait for the actions started by the module to finish, before failing with a timeout.
+      - With O(wait=false), only applies to the actions the module waits for before starting the next one.
+      - The actions are polled based on their progress, less often for long running actions and more often
+        near their completion.
+      - Defaults to the expected duration of each action, e.g. 1800 seconds to create a server, and 120 seconds
+        for most actions.
+      - You can also set this option by using the C(HCLOUD_WAIT_TIMEOUT) environment variable.
+    type: int
+"""
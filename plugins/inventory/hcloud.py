@@ -43,6 +43,23 @@ options:
     default: https://api.hetzner.cloud/v1
     env:
       - name: HCLOUD_ENDPOINT
+  catalog_cache_dir:
+    description:
+      - Directory used to cache the rarely changing resources (server types, images, locations, datacenters,
+        load balancer types and ISOs), shared with the modules using the same API Endpoint and API Token.
+      - See the O(hetzner.hcloud.server#module:catalog_cache_dir) module option.
+    type: path
+    env:
+      - name: HCLOUD_CATALOG_CACHE_DIR
+    version_added: 4.3.0
+  catalog_cache_ttl:
+    description:
+      - Time to live in seconds of the resources cached in O(catalog_cache_dir).
+    type: int
+    default: 3600
+    env:
+      - name: HCLOUD_CATALOG_CACHE_TTL
+    version_added: 4.3.0
 
   group:
     description: The group all servers are automatically added to.
@@ -188,6 +205,7 @@ hostname: "my-prefix-{{ datacenter }}-{{ name }}-{{ server_type }}"
 """
 
 import sys
+from collections.abc import Iterator
 from ipaddress import IPv6Network
 
 from ansible.errors import AnsibleError
@@ -197,15 +215,18 @@ from ansible.plugins.inventory import BaseInventoryPlugin, Cacheable, Constructa
 from ansible.utils.display import Display
 from ansible.utils.vars import combine_vars
 
+from ..module_utils.catalog_cache import CatalogCache
 from ..module_utils.client import (
     Client,
     ClientException,
+    ClientResourceIndex,
     client_check_required_lib,
     client_get_by_name_or_id,
+    client_iter_all,
 )
+from ..module_utils.projection import Record
 from ..module_utils.vendor.hcloud import APIException
 from ..module_utils.vendor.hcloud.networks import Network
-from ..module_utils.vendor.hcloud.servers import Server
 from ..module_utils.version import version
 
 if sys.version_info >= (3, 11):
@@ -255,6 +276,27 @@ else:
     InventoryServer = dict
 
 
+# Fields of the servers used to build the inventory
+SERVER_FIELDS = [
+    "id",
+    "name",
+    "status",
+    "server_type.name",
+    "server_type.architecture",
+    "public_net.ipv4.ip",
+    "public_net.ipv4.dns_ptr",
+    "public_net.ipv6.ip",
+    "private_net",
+    "datacenter.name",
+    "datacenter.location.name",
+    "image.id",
+    "image.name",
+    "image.description",
+    "image.os_flavor",
+    "labels",
+]
+
+
 def first_ipv6_address(network: str) -> str:
     """
     Return the first address for a ipv6 network.
@@ -273,6 +315,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
     client: Client
 
     network: Network | None
+    networks: ClientResourceIndex
 
     def _configure_hcloud_client(self):
         api_token = self.get_option("api_token")
@@ -294,6 +337,17 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         except APIException as exception:
             raise AnsibleError("Invalid Hetzner Cloud API Token.") from exception
 
+    def _get_catalog_cache(self) -> CatalogCache | None:
+        if not self.get_option("catalog_cache_dir"):
+            return None
+
+        return CatalogCache(
+            self.templar.template(self.get_option("api_token")),
+            self.get_option("api_endpoint"),
+            self.get_option("catalog_cache_dir"),
+            ttl=self.get_option("catalog_cache_ttl"),
+        )
+
     def _validate_options(self) -> None:
         if self.get_option("network"):
             network_param: str = self.get_option("network")
@@ -304,7 +358,7 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             except (ClientException, APIException) as exception:
                 raise AnsibleError(to_native(exception)) from exception
 
-    def _fetch_servers(self) -> list[Server]:
+    def _fetch_servers(self) -> Iterator[Record]:
         self._validate_options()
 
         get_servers_params = {}
@@ -314,65 +368,66 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
         if self.get_option("status"):
             get_servers_params["status"] = self.get_option("status")
 
-        servers = self.client.servers.get_all(**get_servers_params)
+        servers = client_iter_all(self.client, "servers", fields=SERVER_FIELDS, **get_servers_params)
 
         if self.get_option("network"):
-            servers = [s for s in servers if self.network.id in [p.network.id for p in s.private_net]]
+            servers = (s for s in servers if self.network.id in [p["network"] for p in s.private_net])
 
         if self.get_option("locations"):
             locations: list[str] = self.get_option("locations")
-            servers = [s for s in servers if s.datacenter.location.name in locations]
+            servers = (s for s in servers if s["datacenter.location.name"] in locations)
 
         if self.get_option("types"):
             server_types: list[str] = self.get_option("types")
-            servers = [s for s in servers if s.server_type.name in server_types]
+            servers = (s for s in servers if s["server_type.name"] in server_types)
 
         if self.get_option("images"):
             images: list[str] = self.get_option("images")
-            servers = [s for s in servers if s.image is not None and s.image.os_flavor in images]
+            servers = (s for s in servers if s["image.id"] is not None and s["image.os_flavor"] in images)
 
         return servers
 
-    def _build_inventory_server(self, server: Server) -> InventoryServer:
+    def _build_inventory_server(self, server: Record) -> InventoryServer:
         server_dict: InventoryServer = {}
         server_dict["id"] = server.id
         server_dict["name"] = server.name
         server_dict["status"] = server.status
 
         # Server Type
-        server_dict["type"] = server.server_type.name
-        server_dict["server_type"] = server.server_type.name
-        server_dict["architecture"] = server.server_type.architecture
+        server_dict["type"] = server["server_type.name"]
+        server_dict["server_type"] = server["server_type.name"]
+        server_dict["architecture"] = server["server_type.architecture"]
 
         # Network
-        if server.public_net.ipv4:
-            server_dict["ipv4"] = server.public_net.ipv4.ip
+        if server["public_net.ipv4.ip"]:
+            server_dict["ipv4"] = server["public_net.ipv4.ip"]
 
-        if server.public_net.ipv6:
-            server_dict["ipv6"] = first_ipv6_address(server.public_net.ipv6.ip)
-            server_dict["ipv6_network"] = server.public_net.ipv6.network
-            server_dict["ipv6_network_mask"] = server.public_net.ipv6.network_mask
+        if server["public_net.ipv6.ip"]:
+            server_dict["ipv6"] = first_ipv6_address(server["public_net.ipv6.ip"])
+            # 2001:db8::/64 to 2001:db8:: and 64
+            server_dict["ipv6_network"], server_dict["ipv6_network_mask"] = server["public_net.ipv6.ip"].split("/")
 
         server_dict["private_networks"] = [
-            {"id": v.network.id, "name": v.network.name, "ip": v.ip} for v in server.private_net
+            {"id": v["network"], "name": self.networks.get(v["network"]).name, "ip": v["ip"]}
+            for v in server.private_net
         ]
 
         if self.get_option("network"):
             for private_net in server.private_net:
                 # Set private_ipv4 if user filtered for one network
-                if private_net.network.id == self.network.id:
-                    server_dict["private_ipv4"] = private_net.ip
+                if private_net["network"] == self.network.id:
+                    server_dict["private_ipv4"] = private_net["ip"]
                     break
 
         # Datacenter
-        server_dict["datacenter"] = server.datacenter.name
-        server_dict["location"] = server.datacenter.location.name
+        server_dict["datacenter"] = server["datacenter.name"]
+        server_dict["location"] = server["datacenter.location.name"]
 
         # Image
-        if server.image is not None:
-            server_dict["image_id"] = server.image.id
-            server_dict["image_os_flavor"] = server.image.os_flavor
-            server_dict["image_name"] = server.image.name or server.image.description
+        if server["image.id"] is not None:
+            server_dict["image_id"] = server["image.id"]
+            server_dict["image_os_flavor"] = server["image.os_flavor"]
+            server_dict["image_name"] = server["image.name"] or server["image.description"]
 
         # Labels
         server_dict["labels"] = dict(server.labels)
@@ -388,15 +443,15 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         return server_dict
 
-    def _get_server_ansible_host(self, server: Server):
+    def _get_server_ansible_host(self, server: Record):
         if self.get_option("connect_with") == "public_ipv4":
-            if server.public_net.ipv4:
-                return server.public_net.ipv4.ip
+            if server["public_net.ipv4.ip"]:
+                return server["public_net.ipv4.ip"]
             raise AnsibleError("Server has no public ipv4, but connect_with=public_ipv4 was specified")
 
         if self.get_option("connect_with") == "public_ipv6":
-            if server.public_net.ipv6:
-                return first_ipv6_address(server.public_net.ipv6.ip)
+            if server["public_net.ipv6.ip"]:
+                return first_ipv6_address(server["public_net.ipv6.ip"])
             raise AnsibleError("Server has no public ipv6, but connect_with=public_ipv6 was specified")
 
         if self.get_option("connect_with") == "hostname":
@@ -404,15 +459,15 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
             return server.name
 
         if self.get_option("connect_with") == "ipv4_dns_ptr":
-            if server.public_net.ipv4:
-                return server.public_net.ipv4.dns_ptr
+            if server["public_net.ipv4.ip"]:
+                return server["public_net.ipv4.dns_ptr"]
             raise AnsibleError("Server has no public ipv4, but connect_with=ipv4_dns_ptr was specified")
 
         if self.get_option("connect_with") == "private_ipv4":
             if self.get_option("network"):
                 for private_net in server.private_net:
-                    if private_net.network.id == self.network.id:
-                        return private_net.ip
+                    if private_net["network"] == self.network.id:
+                        return private_net["ip"]
 
             else:
                 raise AnsibleError("You can only connect via private IPv4 if you specify a network")
@@ -469,8 +524,9 @@ class InventoryModule(BaseInventoryPlugin, Constructable, Cacheable):
 
         servers, cached = self._get_cached_result(path, cache)
         if not cached:
-            with self.client.cached_session():
-                servers = [self._build_inventory_server(s) for s in self._fetch_servers()]
+            with self.client.cached_session(catalog_cache=self._get_catalog_cache()):
+                self.networks = ClientResourceIndex(self.client, "networks", fields=["id", "name"])
+                servers = [self._build_inventory_server(server) for server in self._fetch_servers()]
 
         # Add a top group
         self.inventory.add_group(group=self.get_option("group"))
@@ -0,0 +1,74 @@
+# Copyright: (c) 2026, Hetzner Cloud GmbH <info@hetzner-cloud.de>
+
+from __future__ import annotations
+
+from datetime import datetime, timezone
+
+from .vendor.hcloud import HCloudException
+from .vendor.hcloud.actions import Action, ActionException, BoundAction
+
+POLL_INTERVAL_MIN = 1.0
+"""Shortest interval in seconds between the polls of the actions, with adaptive polling"""
+POLL_INTERVAL_MAX = 10.0
+"""Longest interval in seconds between the polls of the actions, with adaptive polling"""
+
+COMMAND_DURATIONS: dict[str, float] = {
+    "create_server": 30.0,
+    "rebuild_server": 60.0,
+    "change_server_type": 90.0,
+    "create_image": 120.0,
+    "create_volume": 10.0,
+    "resize_volume": 10.0,
+    "issue_certificate": 60.0,
+    "renew_certificate": 60.0,
+}
+"""Typical durations in seconds of the long running commands, used to estimate the
+remaining duration of an action that did not report any progress yet"""
+
+
+class ActionGroupException(HCloudException):
+    """The pending actions failed or timed out"""
+
+    def __init__(self, exceptions: list[ActionException]):
+        message = self.__doc__
+        details = [
+            f"{exception.action.command} ({exception.action.id}): {exception.message}" for exception in exceptions
+        ]
+        if details:
+            message += f": {'; '.join(details)}"
+
+        super().__init__(message)
+        self.message = message
+        self.exceptions = exceptions
+
+    @property
+    def actions(self) -> list[Action | BoundAction]:
+        """Actions that failed or timed out."""
+        return [exception.action for exception in self.exceptions]
+
+
+def action_estimate_remaining(action: Action | BoundAction, now: datetime | None = None) -> float | None:
+    """
+    Estimate the time in seconds until an action finishes.
+
+    The estimate is extrapolated from the progress reported since the action started, or
+    from the typical duration of the command if no progress was reported yet.
+
+    :param action: Running action.
+    :param now: Point in time of the estimate, defaults to now.
+    :return: The estimated time in seconds, or None if it cannot be estimated.
+    """
+    if action.status != Action.STATUS_RUNNING or action.started is None:
+        return None
+
+    if now is None:
+        now = datetime.now(timezone.utc)
+    elapsed = max(0.0, (now - action.started).total_seconds())
+
+    if action.progress and 0 < action.progress < 100:
+        return elapsed * (100 - action.progress) / action.progress
+
+    duration = COMMAND_DURATIONS.get(action.command or "")
+    if duration is None:
+        return None
+    return duration - elapsed
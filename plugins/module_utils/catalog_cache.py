@@ -0,0 +1,106 @@
+# Copyright: (c) 2026, Hetzner Cloud GmbH <info@hetzner-cloud.de>
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import tempfile
+import time
+
+from .client import client_token_digest
+
+
+class CatalogCache:
+    """
+    File backed cache of the responses of rarely changing resources (e.g. server types or
+    locations), shared between the module processes and the inventory plugin using the
+    same API endpoint and API token.
+
+    Each response is stored in its own file, and written atomically, so concurrent
+    processes never read a partially written response.
+    """
+
+    def __init__(self, token: str, api_endpoint: str, directory: str, ttl: float = 3600.0) -> None:
+        """
+        :param token: API token, used to only share the cache between the clients using the same token.
+        :param api_endpoint: API endpoint, used to only share the cache between the clients using the same endpoint.
+        :param directory: Directory holding the cache files.
+        :param ttl: Time to live in seconds of the cached responses.
+        """
+        digest = hashlib.sha256(api_endpoint.encode()).hexdigest()[:16]
+        self.path = os.path.join(directory, f"hcloud-catalog-{digest}-{client_token_digest(token)}")
+        self.ttl = ttl
+
+    def _file(self, resource: str, url: str) -> str:
+        return os.path.join(self.path, f"{resource}-{hashlib.sha256(url.encode()).hexdigest()}.json")
+
+    def get(self, resource: str, url: str) -> tuple[int, bytes] | None:
+        """
+        Read a cached response.
+
+        :param resource: Resource of the request, e.g. `server_types`.
+        :param url: URL of the request.
+        :return: Status code and content of the response, or None if not cached or expired.
+        """
+        try:
+            with open(self._file(resource, url), encoding="utf-8") as file:
+                entry = json.load(file)
+        except (OSError, ValueError):
+            return None
+
+        if entry.get("url") != url or entry.get("expires_at", 0.0) <= time.time():
+            return None
+
+        return entry["status_code"], entry["content"].encode("utf-8")
+
+    def set(self, resource: str, url: str, status_code: int, content: bytes) -> None:
+        """
+        Write a response to the cache.
+
+        :param resource: Resource of the request, e.g. `server_types`.
+        :param url: URL of the request.
+        :param status_code: Status code of the response.
+        :param content: Content of the response.
+        """
+        if self.ttl <= 0:
+            return
+
+        try:
+            entry = {
+                "url": url,
+                "expires_at": time.time() + self.ttl,
+                "status_code": status_code,
+                "content": content.decode("utf-8"),
+            }
+
+            os.makedirs(self.path, mode=0o700, exist_ok=True)
+            fd, tmp_path = tempfile.mkstemp(dir=self.path, prefix=".tmp-")
+            try:
+                with os.fdopen(fd, "w", encoding="utf-8") as file:
+                    json.dump(entry, file)
+                os.replace(tmp_path, self._file(resource, url))
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        except (OSError, UnicodeDecodeError):
+            # The cache is an optimization, failing to write it must not fail the caller.
+            pass
+
+    def invalidate(self, resource: str) -> None:
+        """
+        Invalidate the cached responses of a resource.
+
+        :param resource: Resource to invalidate, e.g. `images`.
+        """
+        try:
+            names = os.listdir(self.path)
+        except OSError:
+            return
+
+        for name in names:
+            if name.startswith(f"{resource}-"):
+                try:
+                    os.unlink(os.path.join(self.path, name))
+                except OSError:
+                    pass
@@ -2,17 +2,46 @@
 
 from __future__ import annotations
 
+import hashlib
+import threading
+import time
+from collections import OrderedDict, deque
+from collections.abc import Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
 from contextlib import contextmanager
+from datetime import datetime, timezone
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, NamedTuple
+from urllib.parse import parse_qs, urlparse
 
 from ansible.module_utils.basic import missing_required_lib
 
+from .actions import (
+    POLL_INTERVAL_MAX,
+    POLL_INTERVAL_MIN,
+    ActionGroupException,
+    action_estimate_remaining,
+)
+from .projection import record_type
 from .vendor.hcloud import APIException, Client as ClientBase
+from .vendor.hcloud.actions import (
+    Action,
+    ActionException,
+    ActionFailedException,
+    ActionTimeoutException,
+    BoundAction,
+)
+from .vendor.hcloud.core import BaseDomain, BoundModelBase, Meta
+
+if TYPE_CHECKING:
+    from .catalog_cache import CatalogCache
 
 HAS_REQUESTS = True
 HAS_DATEUTIL = True
 
 try:
     import requests  # pylint: disable=unused-import
+    from requests.adapters import HTTPAdapter
 except ImportError:
     HAS_REQUESTS = False
 
@@ -33,10 +62,200 @@ def client_check_required_lib():
         raise ClientException(missing_required_lib("python-dateutil"))
 
 
+def client_token_digest(token: str) -> str:
+    """
+    Return a short digest of an API token, used to share state between the clients
+    using the same token, without exposing the token.
+
+    :param token: API token
+    """
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()[:16]
+
+
 def _client_resource_not_found(resource: str, param: str | int):
     return ClientException(f"resource ({resource.rstrip('s')}) does not exist: {param}")
 
 
+def _client_iter_pages(
+    list_function: Callable,
+    per_page: int,
+    page_workers: Callable[[], int],
+    **kwargs,
+) -> Iterator[list]:
+    """
+    Yield the results of each page of a list function, in order.
+
+    The first page is fetched alone, once the last page is known from its pagination,
+    the remaining pages are fetched concurrently, by up to `page_workers()` pages.
+    """
+
+    def fetch(page: int):
+        # The *PageResult tuples have the following structure `(result: List[Bound*], meta: Meta)`
+        return list_function(page=page, per_page=per_page, **kwargs)
+
+    result, meta = fetch(1)
+    if result:
+        yield result
+
+    pagination = meta.pagination if meta else None
+    if pagination is None or not pagination.next_page:
+        return
+
+    max_workers = page_workers()
+    if pagination.last_page is None or max_workers <= 1:
+        page = pagination.next_page
+        while page:
+            result, meta = fetch(page)
+            if result:
+                yield result
+
+            if meta and meta.pagination and meta.pagination.next_page:
+                page = meta.pagination.next_page
+            else:
+                page = 0
+        return
+
+    pages = iter(range(pagination.next_page, pagination.last_page + 1))
+    pages_left = pagination.last_page - pagination.next_page + 1
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        pending: deque[Future] = deque()
+        while True:
+            while pages_left and len(pending) < page_workers():
+                pending.append(executor.submit(fetch, next(pages)))
+                pages_left -= 1
+
+            if not pending:
+                break
+
+            result, _ = pending.popleft().result()
+            if result:
+                yield result
+
+
+def client_iter_all(
+    client: Client,
+    resource: str,
+    max_workers: int = 4,
+    rate_limit_reserve: int = 100,
+    raw: bool = False,
+    fields: list[str] | None = None,
+    **kwargs,
+) -> Iterator:
+    """
+    Iterate over all the resources of a type, without keeping the previous pages in memory.
+
+    The first page is fetched alone, once the number of pages is known, the remaining
+    pages are fetched concurrently, unless the remaining rate limit runs low.
+
+    :param client: Client to use to make the calls
+    :param resource: Name of the resource client that implements the `get_list` method
+    :param max_workers: Maximum number of pages fetched concurrently
+    :param rate_limit_reserve: Remaining rate limit below which the pages are fetched one after another
+    :param raw: Yield the API JSON dicts of the resources instead of bound models
+    :param fields: Yield records of these fields of the resources instead of bound models,
+        e.g. `["id", "datacenter.location.name"]`
+    :param kwargs: Filters passed to the `get_list` method, e.g. `label_selector`
+    """
+    resource_client = getattr(client, resource)
+    if raw or fields is not None:
+        list_function = partial(_client_get_list_raw, client, resource)
+    else:
+        list_function = resource_client.get_list
+
+    items = _client_iter_all(
+        client,
+        list_function,
+        resource_client.max_per_page,
+        max_workers,
+        rate_limit_reserve,
+        **kwargs,
+    )
+    if fields is not None:
+        record = record_type(fields)
+        return (record.from_dict(item) for item in items)
+    return items
+
+
+def _client_iter_all(
+    client: Client,
+    list_function: Callable,
+    per_page: int,
+    max_workers: int,
+    rate_limit_reserve: int,
+    **kwargs,
+) -> Iterator:
+    def page_workers() -> int:
+        rate_limit = client.rate_limit
+        if rate_limit is not None and rate_limit.remaining < rate_limit_reserve:
+            return 1
+        return max_workers
+
+    for result in _client_iter_pages(list_function, per_page, page_workers, **kwargs):
+        yield from result
+
+
+def _client_get_list_raw(
+    client: Client,
+    resource: str,
+    page: int,
+    per_page: int,
+    **kwargs,
+) -> tuple[list[dict], Meta | None]:
+    params = {key: value for key, value in kwargs.items() if value is not None}
+    params.update(page=page, per_page=per_page)
+
+    response = client.request(url=f"/{resource}", method="GET", params=params)
+    return response[resource], Meta.parse_meta(response)
+
+
+def client_get_by_id(
+    client: Client,
+    resource: str,
+    resource_id: int,
+    raw: bool = False,
+    fields: list[str] | None = None,
+) -> Any:
+    """
+    Get a resource by its ID.
+
+    :param client: Client to use to make the call
+    :param resource: Name of the resource client that implements the `get_by_id` method
+    :param resource_id: ID of the resource
+    :param raw: Return the API JSON dict of the resource instead of a bound model
+    :param fields: Return a record of these fields of the resource instead of a bound model
+    """
+    if raw or fields is not None:
+        response = client.request(url=f"/{resource}/{resource_id}", method="GET")
+        item = response[resource[:-1]]
+        return record_type(fields).from_dict(item) if fields is not None else item
+    return getattr(client, resource).get_by_id(resource_id)
+
+
+def client_get_by_name(
+    client: Client,
+    resource: str,
+    name: str,
+    raw: bool = False,
+    fields: list[str] | None = None,
+) -> Any | None:
+    """
+    Get a resource by its name, or None if the resource does not exist.
+
+    :param client: Client to use to make the call
+    :param resource: Name of the resource client that implements the `get_by_name` method
+    :param name: Name of the resource
+    :param raw: Return the API JSON dict of the resource instead of a bound model
+    :param fields: Return a record of these fields of the resource instead of a bound model
+    """
+    if raw or fields is not None:
+        result, _ = _client_get_list_raw(client, resource, page=1, per_page=1, name=name)
+        if not result:
+            return None
+        return record_type(fields).from_dict(result[0]) if fields is not None else result[0]
+    return getattr(client, resource).get_by_name(name)
+
+
 def client_get_by_name_or_id(client: Client, resource: str, param: str | int):
     """
     Get a resource by name, and if not found by its ID.
@@ -65,44 +284,902 @@ def client_get_by_name_or_id(client: Client, resource: str, param: str | int):
         raise exception
 
 
+def client_find_many(
+    client: Client,
+    resource: str,
+    params: list[str | int],
+    threshold: int = 10,
+    max_workers: int = 4,
+    by_id: bool = True,
+) -> dict[str, Any]:
+    """
+    Find many resources by name, and if not found by their ID.
+
+    Below the threshold, each resource is looked up using :func:`client_get_by_name_or_id`,
+    concurrently. Above the threshold, all the resources are listed once, and looked up
+    using an index of their names and IDs.
+
+    :param client: Client to use to make the calls
+    :param resource: Name of the resource client that implements the `get_by_name`, `get_by_id` and `get_list` methods
+    :param params: Names or IDs of the resources to query
+    :param threshold: Number of resources above which all the resources are listed
+    :param max_workers: Maximum number of concurrent calls below the threshold
+    :param by_id: Whether to look up the resources not found by name by their ID
+    :return: Resources found, by their param
+    """
+    unique_params = list(dict.fromkeys(str(param) for param in params))
+
+    found: dict[str, Any] = {}
+    if len(unique_params) > threshold:
+        by_name: dict[str, Any] = {}
+        ids: dict[str, Any] = {}
+        for item in client_iter_all(client, resource):
+            by_name[item.name] = item
+            ids[str(item.id)] = item
+
+        for param in unique_params:
+            item = by_name.get(param)
+            if item is None and by_id:
+                item = ids.get(param)
+            if item is not None:
+                found[param] = item
+
+    elif unique_params:
+
+        def get(param: str):
+            if not by_id:
+                return getattr(client, resource).get_by_name(param)
+            try:
+                return client_get_by_name_or_id(client, resource, param)
+            except ClientException:
+                return None
+
+        with ThreadPoolExecutor(max_workers=max(min(max_workers, len(unique_params)), 1)) as executor:
+            for param, item in zip(unique_params, executor.map(get, unique_params)):
+                if item is not None:
+                    found[param] = item
+
+    return found
+
+
+def client_resolve_many(
+    client: Client,
+    resource: str,
+    params: list[str | int],
+    threshold: int = 10,
+    max_workers: int = 4,
+) -> list:
+    """
+    Get many resources by name, and if not found by their ID, see :func:`client_find_many`.
+
+    :param client: Client to use to make the calls
+    :param resource: Name of the resource client that implements the `get_by_name`, `get_by_id` and `get_list` methods
+    :param params: Names or IDs of the resources to query
+    :param threshold: Number of resources above which all the resources are listed
+    :param max_workers: Maximum number of concurrent calls below the threshold
+    :return: Resources, in the order of the params
+    """
+    found = client_find_many(client, resource, params, threshold=threshold, max_workers=max_workers)
+
+    missing = [param for param in dict.fromkeys(str(param) for param in params) if param not in found]
+    if missing:
+        if len(missing) == 1:
+            raise _client_resource_not_found(resource, missing[0])
+        raise ClientException(f"resources ({resource.rstrip('s')}) do not exist: {', '.join(missing)}")
+
+    return [found[str(param)] for param in params]
+
+
+def _client_find_bound_models(value: Any, found: list[BoundModelBase], seen: set[int]) -> None:
+    """
+    Collect the bound models held by a value, walking through the domain objects, lists
+    and dicts, but not through the bound models themselves.
+    """
+    if isinstance(value, BoundModelBase):
+        if id(value) not in seen:
+            seen.add(id(value))
+            found.append(value)
+    elif isinstance(value, BaseDomain):
+        for name in value.__api_properties__:
+            _client_find_bound_models(getattr(value, name, None), found, seen)
+    elif isinstance(value, (list, tuple)):
+        for item in value:
+            _client_find_bound_models(item, found, seen)
+    elif isinstance(value, dict):
+        for item in value.values():
+            _client_find_bound_models(item, found, seen)
+
+
+class ClientResourceIndex:
+    """
+    Index of all the resources of a type, used to complete the incomplete references to
+    these resources (e.g. the networks of the servers private networks), instead of
+    reloading each reference on its first attribute access, or to look up the resources
+    referenced by ID in the API JSON dicts.
+
+    The resources are listed once, when the first unknown reference is found, unless
+    the referenced resources were prefetched.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        resource: str,
+        raw: bool = False,
+        fields: list[str] | None = None,
+    ) -> None:
+        """
+        :param client: Client to use to make the call
+        :param resource: Name of the resource client that implements the `get_list` method
+        :param raw: Index the API JSON dicts of the resources instead of bound models,
+            to look them up with `get`
+        :param fields: Index records of these fields of the resources instead of bound
+            models, to look them up with `get`, the fields must include `id`
+        """
+        self._client = client
+        self._resource = resource
+        self._raw = raw
+        self._fields = fields
+        self._index: dict[int, Any] = {}
+        self._listed = False
+
+    def _load(self) -> dict[int, Any]:
+        if not self._listed:
+            items = client_iter_all(self._client, self._resource, raw=self._raw, fields=self._fields)
+            if self._raw:
+                self._index.update((item["id"], item) for item in items)
+            else:
+                self._index.update((item.id, item) for item in items)
+            self._listed = True
+        return self._index
+
+    def _get_by_id(self, resource_id: int) -> Any:
+        return client_get_by_id(self._client, self._resource, resource_id, raw=self._raw, fields=self._fields)
+
+    def prefetch(self, ids: Iterable[int], threshold: int = 10, max_workers: int = 4) -> None:
+        """
+        Fetch the resources that will be looked up, before looking them up.
+
+        Below the threshold, each resource is fetched by ID, concurrently. Above the
+        threshold, all the resources are listed once.
+
+        :param ids: IDs of the resources
+        :param threshold: Number of resources above which all the resources are listed
+        :param max_workers: Maximum number of concurrent calls below the threshold
+        """
+        if self._listed:
+            return
+
+        missing = [resource_id for resource_id in dict.fromkeys(ids) if resource_id not in self._index]
+        if len(missing) > threshold:
+            self._load()
+        elif missing:
+            with ThreadPoolExecutor(max_workers=max(min(max_workers, len(missing)), 1)) as executor:
+                self._index.update(zip(missing, executor.map(self._get_by_id, missing)))
+
+    def add(self, items: Iterable[Any]) -> None:
+        """
+        Add resources already fetched to the index, e.g. the resources returned by
+        :func:`client_resolve_many`.
+
+        :param items: Resources to add, bound models, API JSON dicts or records
+        """
+        for item in items:
+            self._index[item["id"] if isinstance(item, dict) else item.id] = item
+
+    def get(self, resource_id: int) -> Any:
+        """
+        Return a resource from the index, or fetch it if it was created after the
+        resources were listed.
+
+        :param resource_id: ID of the resource
+        """
+        if resource_id not in self._index:
+            self._load()
+        if resource_id not in self._index:
+            self._index[resource_id] = self._get_by_id(resource_id)
+        return self._index[resource_id]
+
+    def hydrate(self, models: Iterable[BoundModelBase]) -> None:
+        """
+        Complete the incomplete models, using the index of the resources.
+
+        Models that are not found in the index are left incomplete, and will be reloaded
+        on their first attribute access.
+
+        :param models: Models to complete
+        """
+        incomplete = [model for model in models if not model.complete]
+        if not incomplete:
+            return
+
+        if any(model.data_model.id not in self._index for model in incomplete):
+            self._load()
+        for model in incomplete:
+            item = self._index.get(model.data_model.id)
+            if item is not None:
+                model.data_model = item.data_model
+                model.complete = True
+
+
+class RateLimit(NamedTuple):
+    """
+    Rate limit state of the API token, as seen by the client.
+    """
+
+    limit: int
+    """Maximum number of requests in the rate limit window."""
+    remaining: int
+    """Estimated number of requests that can currently be made."""
+    reset: datetime
+    """Point in time when the rate limit will be fully replenished."""
+
+
+class RateLimiter:
+    """
+    Token bucket pacing the outgoing requests, using the `RateLimit-Limit`,
+    `RateLimit-Remaining` and `RateLimit-Reset` headers returned by the API.
+
+    The bucket holds the remaining requests, and is refilled at the rate the API
+    replenishes the rate limit. Once the bucket is empty, each request waits for a new
+    token, instead of hitting the rate limit and backing off.
+
+    Until the API returned rate limit headers, requests are not paced.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._limit: int | None = None
+        self._tokens: float = 0.0
+        self._rate: float = 0.0
+        self._updated_at: float = 0.0
+
+    @contextmanager
+    def _synchronized(self) -> Iterator[None]:
+        """
+        Guard the access to the bucket state.
+        """
+        with self._lock:
+            yield
+
+    @staticmethod
+    def _clock() -> float:
+        """
+        Clock used to refill the bucket.
+        """
+        return time.monotonic()
+
+    @property
+    def rate_limit(self) -> RateLimit | None:
+        """
+        Current rate limit state, or None if the API did not return it yet.
+        """
+        with self._synchronized():
+            if self._limit is None:
+                return None
+
+            self._refill()
+            tokens = max(self._tokens, 0.0)
+            missing = self._limit - tokens
+            reset = time.time() + (missing / self._rate if self._rate > 0 else 0.0)
+
+            return RateLimit(
+                limit=self._limit,
+                remaining=int(tokens),
+                reset=datetime.fromtimestamp(reset, timezone.utc),
+            )
+
+    def update(self, headers: Mapping[str, str]) -> None:
+        """
+        Synchronize the bucket with the rate limit headers of an API response.
+
+        :param headers: Response headers.
+        """
+        try:
+            limit = int(headers["RateLimit-Limit"])
+            remaining = int(headers["RateLimit-Remaining"])
+            reset = int(headers["RateLimit-Reset"])
+        except (KeyError, TypeError, ValueError):
+            return
+
+        with self._synchronized():
+            self._limit = limit
+            self._tokens = float(remaining)
+            self._updated_at = self._clock()
+
+            # The API replenishes the missing requests until the reset time.
+            if remaining < limit:
+                self._rate = (limit - remaining) / max(reset - time.time(), 1.0)
+
+    def acquire(self) -> float:
+        """
+        Take a token from the bucket, and wait until it is available.
+
+        :return: Time waited in seconds.
+        """
+        with self._synchronized():
+            if self._limit is None:
+                return 0.0
+
+            self._refill()
+            self._tokens -= 1
+            if self._tokens >= 0 or self._rate <= 0:
+                return 0.0
+
+            wait = -self._tokens / self._rate
+
+        time.sleep(wait)
+        return wait
+
+    def _refill(self) -> None:
+        now = self._clock()
+        self._tokens = min(float(self._limit), self._tokens + (now - self._updated_at) * self._rate)
+        self._updated_at = now
+
+
+class CachedResponse(NamedTuple):
+    response: requests.Response
+    expires_at: float
+    size: int
+
+
 if HAS_REQUESTS:
 
     class CachedSession(requests.Session):
-        cache: dict[str, requests.Response]
+        """
+        Session caching the successful GET responses, with a time to live per resource and
+        a least recently used eviction once the cache is full.
+
+        Any other request (POST, PUT, DELETE) invalidates the cached responses of all the
+        resources, except the catalog resources it does not target, as a change might
+        affect other resources than the one it targets, e.g. deleting a primary IP changes
+        the public network of its server. The resources listed in the polled actions are
+        invalidated as well, as their state changes while the actions are running.
+
+        The actions endpoints are never cached.
+
+        The responses of the catalog resources may also be stored in a persistent
+        :class:`CatalogCache`, shared with the other processes. The images are only
+        catalog resources when filtered by the system or app types, the snapshots and
+        backups are created at any time.
+        """
+
+        cache: OrderedDict[str, CachedResponse]
+
+        catalog_ttl: float = 3600.0
+        """Time to live in seconds of the responses of rarely changing resources."""
+        catalog_resources: tuple[str, ...] = (
+            "datacenters",
+            "images",
+            "isos",
+            "load_balancer_types",
+            "locations",
+            "server_types",
+        )
+        catalog_filters: dict[str, tuple[str, tuple[str, ...]]] = {
+            # Snapshots and backups are created at any time, only the system and app images
+            # are rarely changing.
+            "images": ("type", ("system", "app")),
+        }
+        """Query param and values the requests of a catalog resource must be filtered by."""
+
+        default_ttl: float = 30.0
+        """Time to live in seconds of the responses of the other resources."""
 
-        def __init__(self) -> None:
+        def __init__(
+            self,
+            api_endpoint: str = "",
+            max_entries: int | None = 1000,
+            max_bytes: int | None = 64 * 1024 * 1024,
+            catalog_cache: CatalogCache | None = None,
+        ) -> None:
+            """
+            :param api_endpoint: API endpoint, used to find the resource of a request URL.
+            :param max_entries: Maximum number of cached responses.
+            :param max_bytes: Maximum size of the cached responses content.
+            :param catalog_cache: Persistent cache for the responses of the catalog resources.
+            """
             super().__init__()
-            self.cache = {}
+            self.catalog_cache = catalog_cache
+            self.cache = OrderedDict()
+            self.cache_bytes = 0
+            self.max_entries = max_entries
+            self.max_bytes = max_bytes
+            self._base_path = urlparse(api_endpoint).path.rstrip("/")
+            self._lock = threading.Lock()
+
+        def _resource(self, url: str) -> tuple[str, str | None, bool]:
+            """
+            Return the resource of a request URL, the ID of the targeted resource if any, and
+            whether the URL is an actions endpoint, e.g. `("servers", "42", True)` for
+            `https://api.hetzner.cloud/v1/servers/42/actions/poweron`.
+            """
+            path = urlparse(url).path
+            if path.startswith(self._base_path):
+                path = path.replace(self._base_path, "", 1)
+            segments = path.strip("/").split("/")
+
+            resource = segments[0]
+            resource_id = segments[1] if len(segments) > 1 and segments[1].isdigit() else None
+            return resource, resource_id, "actions" in segments
+
+        def _is_catalog(self, url: str) -> bool:
+            """
+            Return whether a request URL targets a rarely changing resource, e.g.
+            `/server_types/1` or `/images?type=system`, but not `/images/1`.
+            """
+            resource = self._resource(url)[0]
+            if resource not in self.catalog_resources:
+                return False
+            if resource in self.catalog_filters:
+                key, values = self.catalog_filters[resource]
+                found = parse_qs(urlparse(url).query).get(key)
+                return bool(found) and all(value in values for value in found)
+            return True
+
+        def _ttl(self, url: str) -> float:
+            if self._is_catalog(url):
+                return self.catalog_ttl
+            return self.default_ttl
+
+        def _get(self, url: str) -> requests.Response | None:
+            with self._lock:
+                entry = self.cache.get(url)
+                if entry is None:
+                    return None
+
+                if entry.expires_at <= time.monotonic():
+                    self._delete(url)
+                    return None
+
+                self.cache.move_to_end(url)
+                return entry.response
+
+        def _set(self, url: str, response: requests.Response) -> None:
+            ttl = self._ttl(url)
+            if ttl <= 0:
+                return
+
+            size = len(response.content)
+            with self._lock:
+                if url in self.cache:
+                    self._delete(url)
+
+                self.cache[url] = CachedResponse(response, time.monotonic() + ttl, size)
+                self.cache_bytes += size
+
+                while self.cache and (
+                    (self.max_entries is not None and len(self.cache) > self.max_entries)
+                    or (self.max_bytes is not None and self.cache_bytes > self.max_bytes)
+                ):
+                    self._delete(next(iter(self.cache)))
+
+        def _delete(self, url: str) -> None:
+            entry = self.cache.pop(url)
+            self.cache_bytes -= entry.size
+
+        def invalidate(self, resource: str, resource_id: int | str | None = None) -> None:
+            """
+            Invalidate the cached responses of a resource.
+
+            :param resource: Resource to invalidate, e.g. `servers`.
+            :param resource_id: ID of the resource to invalidate, the responses of the other
+                resources of the same type are kept, except the list responses. When None, all
+                the responses of the resource are invalidated.
+            """
+            if self.catalog_cache is not None and resource in self.catalog_resources:
+                self.catalog_cache.invalidate(resource)
+
+            if resource_id is not None:
+                resource_id = str(resource_id)
+
+            with self._lock:
+                for url in list(self.cache):
+                    url_resource, url_resource_id, _ = self._resource(url)
+                    if url_resource != resource:
+                        continue
+                    if resource_id is None or url_resource_id is None or url_resource_id == resource_id:
+                        self._delete(url)
+
+        def _invalidate_actions_resources(self, response: requests.Response) -> None:
+            """
+            Invalidate the resources listed in the actions of a response.
+            """
+            if not response.ok or not response.content:
+                return
+            try:
+                body = response.json()
+            except ValueError:
+                return
+            if not isinstance(body, dict):
+                return
+
+            actions = [body.get("action"), *(body.get("actions") or []), *(body.get("next_actions") or [])]
+            for action in actions:
+                if not isinstance(action, dict):
+                    continue
+                for resource in action.get("resources") or []:
+                    # Action resources types are singular, e.g. `server` or `floating_ip`
+                    self.invalidate(f"{resource['type']}s", resource["id"])
 
         def send(self, request: requests.PreparedRequest, **kwargs) -> requests.Response:  # type: ignore[no-untyped-def]
             """
             Send a given PreparedRequest.
             """
-            if request.method != "GET" or request.url is None:
+            if request.url is None:
                 return super().send(request, **kwargs)
 
-            if request.url in self.cache:
-                return self.cache[request.url]
+            resource, resource_id, is_action = self._resource(request.url)
+
+            if request.method != "GET":
+                response = super().send(request, **kwargs)
+                self.invalidate(resource, resource_id)
+                self._invalidate_actions_resources(response)
+                with self._lock:
+                    for url in list(self.cache):
+                        if not self._is_catalog(url):
+                            self._delete(url)
+                return response
+
+            if is_action:
+                response = super().send(request, **kwargs)
+                self._invalidate_actions_resources(response)
+                return response
+
+            response = self._get(request.url)
+            if response is not None:
+                return response
+
+            use_catalog_cache = self.catalog_cache is not None and self._is_catalog(request.url)
+            if use_catalog_cache:
+                entry = self.catalog_cache.get(resource, request.url)
+                if entry is not None:
+                    response = self._build_response(request, *entry)
+                    self._set(request.url, response)
+                    return response
 
             response = super().send(request, **kwargs)
             if response.ok:
-                self.cache[request.url] = response
+                self._set(request.url, response)
+                if use_catalog_cache:
+                    self.catalog_cache.set(resource, request.url, response.status_code, response.content)
+
+            return response
+
+        @staticmethod
+        def _build_response(request: requests.PreparedRequest, status_code: int, content: bytes) -> requests.Response:
+            """
+            Build a response from the content stored in the catalog cache.
+            """
+            response = requests.Response()
+            response.request = request
+            response.url = request.url
+            response.status_code = status_code
+            response.headers["Content-Type"] = "application/json"
+            response.encoding = "utf-8"
+            response._content = content  # pylint: disable=protected-access
+            return response
+
+    class RateLimitedAdapter(HTTPAdapter):
+        """
+        Transport adapter pacing the requests sent to the API using a rate limiter.
+
+        The adapter sits below any caching layer of the session, only the requests actually
+        sent over the network take a token from the rate limiter, and only their responses
+        update the rate limiter with the `RateLimit-*` headers.
+        """
+
+        def __init__(self, rate_limiter: RateLimiter) -> None:
+            super().__init__()
+            self.rate_limiter = rate_limiter
 
+        def send(self, request: requests.PreparedRequest, *args, **kwargs) -> requests.Response:  # type: ignore[no-untyped-def]
+            self.rate_limiter.acquire()
+            response = super().send(request, *args, **kwargs)
+            self.rate_limiter.update(response.headers)
             return response
 
 
 class Client(ClientBase):
+    """
+    Client for the Hetzner Cloud API, see the vendored :class:`hcloud.Client`.
+
+    The client reads the `RateLimit-*` headers of the API responses, and paces the
+    outgoing requests before the rate limit is exceeded. The estimated headroom is
+    available using :attr:`Client.rate_limit`.
+    """
+
+    def __init__(  # type: ignore[no-untyped-def]
+        self,
+        *args,
+        rate_limiter: RateLimiter | None = None,
+        session: requests.Session | None = None,
+        poll_timeout: float | None = None,
+        poll_adaptive: bool = False,
+        **kwargs,
+    ) -> None:
+        """
+        :param rate_limiter: Rate limiter pacing the requests, it may be shared with other
+            clients using the same token.
+        :param session: Session used to send the requests, e.g. a :class:`CachedSession`.
+        :param poll_timeout: Time in seconds to wait for the actions before they time out,
+            takes precedence over the poll max retries.
+        :param poll_adaptive: Poll the actions based on their progress, less often for long
+            running actions and more often near their completion. Falls back to the poll
+            interval if the completion of the actions cannot be estimated.
+        """
+        self.rate_limiter = rate_limiter or RateLimiter()
+        self._rate_limit_paced = threading.local()
+        super().__init__(*args, **kwargs)
+        if session is not None:
+            self._requests_session = session
+        self._poll_timeout = poll_timeout
+        self._poll_adaptive = poll_adaptive
+
+    @property
+    def rate_limit(self) -> RateLimit | None:
+        """
+        Current rate limit headroom of the API token, estimated from the last `RateLimit-*`
+        response headers. None until the API returned them.
+        """
+        return self.rate_limiter.rate_limit
+
+    @property
+    def _requests_session(self) -> requests.Session:
+        return self._session
+
+    @_requests_session.setter
+    def _requests_session(self, session: requests.Session) -> None:
+        # Pace the requests to the API of any session, including the sessions swapped
+        # after the client creation.
+        session.mount(self._api_endpoint, RateLimitedAdapter(self.rate_limiter))
+        self._session = session
+
+    def _read_response(self, response) -> dict:  # type: ignore[no-untyped-def]
+        try:
+            return super()._read_response(response)
+        except APIException as exception:
+            # When the response returned the rate limit state, the rate limiter already
+            # paces the next request until the rate limit is replenished.
+            self._rate_limit_paced.value = (
+                exception.code == "rate_limit_exceeded" and "RateLimit-Reset" in response.headers
+            )
+            raise
+
+    def _retry_interval(self, retries: int) -> float:  # pylint: disable=arguments-differ
+        paced, self._rate_limit_paced.value = getattr(self._rate_limit_paced, "value", False), False
+        if paced:
+            return 0.0
+        return super()._retry_interval(retries)
+
+    def invalidate(self, resource: str, resource_id: int | str | None = None) -> None:
+        """
+        Invalidate the cached responses of a resource, when the client session caches them,
+        e.g. after the resource was modified by another process.
+
+        :param resource: Resource to invalidate, e.g. `servers`.
+        :param resource_id: ID of the resource to invalidate, the responses of the other
+            resources of the same type are invalidated as well.
+        """
+        if isinstance(self._requests_session, CachedSession):
+            self._requests_session.invalidate(resource, resource_id)
+
     @contextmanager
-    def cached_session(self):
+    def cached_session(self, catalog_cache: CatalogCache | None = None):
         """
         Swap the client session during the scope of the context. The session will cache
-        all GET requests.
+        the GET requests, see :class:`CachedSession`.
 
-        Cached response will not expire, therefore the cached client must not be used
-        for long living scopes.
+        :param catalog_cache: Persistent cache for the responses of the catalog resources.
         """
-        self._requests_session = CachedSession()
+        self._requests_session = CachedSession(self._api_endpoint, catalog_cache=catalog_cache)
         try:
             yield
         finally:
             self._requests_session = requests.Session()
+
+    _deferred_actions: list[BoundAction] | None = None
+    _deferred_timeout: float | None = None
+
+    @property
+    def deferred_actions(self) -> list[BoundAction]:
+        """
+        Actions deferred using :meth:`defer_actions`, not waited for yet.
+        """
+        return list(self._deferred_actions or [])
+
+    def defer_actions(self, actions: Iterable[BoundAction], timeout: float | None = None) -> None:
+        """
+        Defer waiting for the actions until the next change request (POST, PUT, DELETE),
+        as the change might conflict with the running actions, e.g. when powering on a
+        server that is still being created.
+
+        :param actions: Actions to wait for.
+        :param timeout: Time in seconds to wait for the actions, defaults to the poll timeout of the client.
+        """
+        if self._deferred_actions is None:
+            self._deferred_actions = []
+        self._deferred_actions.extend(actions)
+        if timeout is not None:
+            self._deferred_timeout = max(self._deferred_timeout or 0.0, timeout)
+
+    def wait_for_deferred_actions(self) -> None:
+        """
+        Wait for the deferred actions, see :meth:`defer_actions`.
+        """
+        actions, self._deferred_actions = self.deferred_actions, None
+        timeout, self._deferred_timeout = self._deferred_timeout, None
+        if actions:
+            self.wait_for_actions(actions, timeout=timeout)
+
+    def get_actions_by_ids(self, ids: list[int]) -> list[BoundAction]:
+        """
+        Get the actions matching the IDs, using as few requests as possible. Unknown IDs
+        are ignored.
+
+        :param ids: IDs of the actions.
+        """
+        per_page = self.actions.max_per_page
+
+        actions: list[BoundAction] = []
+        while ids:
+            chunk, ids = ids[:per_page], ids[per_page:]
+            response = self.request(url="/actions", method="GET", params={"id": chunk, "per_page": per_page})
+            actions.extend(BoundAction(self.actions, data) for data in response["actions"])
+        return actions
+
+    def wait_for_actions(
+        self,
+        actions: list[Action | BoundAction],
+        timeout: float | None = None,
+        max_retries: int | None = None,
+    ) -> list[BoundAction]:
+        """
+        Wait until all the actions finished.
+
+        The running actions are polled together, with a single request per poll interval,
+        and the finished actions are no longer polled.
+
+        :param actions: Actions to wait for.
+        :param timeout: Time in seconds to wait before the running actions time out,
+            defaults to the poll timeout of the client.
+        :param max_retries: Number of polls before the running actions time out, only used without timeout.
+        :raises ActionGroupException: When at least one action failed or timed out.
+        :return: The finished actions, in the given order.
+        """
+        if timeout is None and max_retries is None:
+            timeout = self._poll_timeout
+        if max_retries is None:
+            max_retries = self._poll_max_retries
+
+        deadline = None if timeout is None else time.monotonic() + timeout
+
+        ids = list(dict.fromkeys(action.id for action in actions))
+        latest: dict[int, Action | BoundAction] = {action.id: action for action in actions}
+
+        # Actions already known to be finished are not polled
+        running = [
+            action_id
+            for action_id in ids
+            if latest[action_id].status not in (Action.STATUS_SUCCESS, Action.STATUS_ERROR)
+        ]
+        retries = 0
+        while running:
+            for action in self.get_actions_by_ids(running):
+                latest[action.id] = action
+            running = [action_id for action_id in running if latest[action_id].status == Action.STATUS_RUNNING]
+            if not running:
+                break
+
+            retries += 1
+            interval = self._actions_poll_interval([latest[action_id] for action_id in running], retries)
+            if deadline is not None:
+                remaining = deadline - time.monotonic()
+                if remaining > 0:
+                    time.sleep(min(interval, remaining))
+                    continue
+            elif retries < max_retries:
+                time.sleep(interval)
+                continue
+            break
+
+        exceptions: list[ActionException] = []
+        for action_id in ids:
+            if action_id in running:
+                exceptions.append(ActionTimeoutException(action=latest[action_id]))
+            elif latest[action_id].status == Action.STATUS_ERROR:
+                exceptions.append(ActionFailedException(action=latest[action_id]))
+
+        if exceptions:
+            raise ActionGroupException(exceptions)
+
+        return [latest[action_id] for action_id in ids]
+
+    def _actions_poll_interval(self, actions: list[Action | BoundAction], retries: int) -> float:
+        """
+        Return the time in seconds to wait before polling the running actions again.
+
+        With adaptive polling, the actions are polled halfway to the earliest estimated
+        completion, so long running actions are polled less often, and actions close to
+        their completion more often.
+        """
+        interval = self._poll_interval_func(retries)
+        if not self._poll_adaptive:
+            return interval
+
+        now = datetime.now(timezone.utc)
+        estimates = [action_estimate_remaining(action, now) for action in actions]
+        remaining = [estimate for estimate in estimates if estimate and estimate > 0]
+        if not remaining:
+            # Unknown or overdue completion
+            return interval
+
+        return min(max(min(remaining) / 2, POLL_INTERVAL_MIN), POLL_INTERVAL_MAX)
+
+    def hydrate(self, objects: Any, depth: int = 1, threshold: int = 5, max_workers: int = 4) -> None:
+        """
+        Fetch the data of the incomplete bound models found in the objects, in place,
+        instead of reloading each of them on their first attribute access.
+
+        The incomplete bound models are grouped by resource, each group is fetched with a
+        single listing of the resources, or with concurrent `get_by_id` calls for small
+        groups.
+
+        :param objects: Bound models, domain objects, or lists of them.
+        :param depth: Number of levels of nested bound models to walk through. With a depth
+            of 0, only the given bound models are fetched. With a depth of 1, the bound
+            models they reference are fetched as well, and so on.
+        :param threshold: Size of a group above which the resources are listed.
+        :param max_workers: Maximum number of concurrent `get_by_id` calls.
+        """
+        seen: set[int] = set()
+        level: list[BoundModelBase] = []
+        _client_find_bound_models(objects, level, seen)
+
+        for current_depth in range(depth + 1):
+            groups: dict[int, tuple[Any, list[BoundModelBase]]] = {}
+            for model in level:
+                if not model.complete:
+                    resource_client = model._client  # pylint: disable=protected-access
+                    groups.setdefault(id(resource_client), (resource_client, []))[1].append(model)
+
+            for resource_client, models in groups.values():
+                ids = list(dict.fromkeys(model.data_model.id for model in models))
+                if len(ids) > threshold:
+                    wanted = set(ids)
+                    found = {
+                        item.id: item
+                        for item in _client_iter_all(
+                            self,
+                            resource_client.get_list,
+                            resource_client.max_per_page,
+                            max_workers,
+                            rate_limit_reserve=100,
+                        )
+                        if item.id in wanted
+                    }
+                else:
+                    with ThreadPoolExecutor(max_workers=max(min(max_workers, len(ids)), 1)) as executor:
+                        found = dict(zip(ids, executor.map(resource_client.get_by_id, ids)))
+
+                for model in models:
+                    item = found.get(model.data_model.id)
+                    if item is not None:
+                        model.data_model = item.data_model
+                        model.complete = True
+
+            if current_depth == depth:
+                break
+
+            # Only walk through the loaded models, to not reload the missing ones
+            next_level: list[BoundModelBase] = []
+            for model in level:
+                if model.complete:
+                    for name in model.model.__api_properties__:
+                        _client_find_bound_models(getattr(model, name, None), next_level, seen)
+            level = next_level
+
+    def request(self, method: str, url: str, **kwargs) -> dict:  # type: ignore[no-untyped-def]
+        if method != "GET" and self._deferred_actions:
+            self.wait_for_deferred_actions()
+        return super().request(method, url, **kwargs)
@@ -6,7 +6,8 @@
 from __future__ import annotations
 
 import traceback
-from typing import Any, NoReturn
+from contextlib import contextmanager
+from typing import Any, Iterator, NoReturn
 
 from ansible.module_utils.basic import AnsibleModule as AnsibleModuleBase, env_fallback
 from ansible.module_utils.common.text.converters import to_native
@@ -15,14 +16,25 @@ from ansible.module_utils.common.validation import (
     check_required_one_of,
 )
 
-from .client import ClientException, client_check_required_lib, client_get_by_name_or_id
+from .actions import ActionGroupException
+from .catalog_cache import CatalogCache
+from .client import (
+    CachedSession,
+    Client,
+    ClientException,
+    client_check_required_lib,
+    client_get_by_name_or_id,
+    client_resolve_many,
+)
+from .lock import ResourceLock
+from .rate_limit import SharedRateLimiter
+from .state import state_directory
 from .vendor.hcloud import (
     APIException,
-    Client,
     HCloudException,
     exponential_backoff_function,
 )
-from .vendor.hcloud.actions import ActionException
+from .vendor.hcloud.actions import ActionException, BoundAction
 from .version import version
 
 
@@ -36,7 +48,7 @@ class AnsibleHCloud:
 
     module: AnsibleModule
 
-    def __init__(self, module: AnsibleModule):
+    def __init__(self, module: AnsibleModule, client: Client | None = None):
         if not self.represent:
             raise NotImplementedError(f"represent property is not defined for {self.__class__.__name__}")
 
@@ -48,7 +60,10 @@ class AnsibleHCloud:
         except ClientException as exception:
             module.fail_json(msg=to_native(exception))
 
-        self._build_client()
+        if client is not None:
+            self.client = client
+        else:
+            self._build_client()
 
     def fail_json_hcloud(
         self,
@@ -70,7 +85,12 @@ class AnsibleHCloud:
             failure["details"] = exception.details
 
         elif isinstance(exception, ActionException):
-            failure["action"] = {k: getattr(exception.action, k) for k in exception.action.__slots__}
+            failure["action"] = {k: getattr(exception.action, k) for k in exception.action.__api_properties__}
+
+        elif isinstance(exception, ActionGroupException):
+            failure["actions"] = [
+                {k: getattr(action, k) for k in action.__api_properties__} for action in exception.actions
+            ]
 
         exception_message = to_native(exception)
         if msg is not None:
@@ -81,16 +101,69 @@ class AnsibleHCloud:
         self.module.fail_json(msg=msg, exception=last_traceback, failure=failure, **kwargs)
 
     def _build_client(self) -> None:
+        rate_limiter = None
+        if self.module.params.get("shared_rate_limit"):
+            try:
+                rate_limiter = SharedRateLimiter(self.module.params["api_token"], state_directory())
+            except OSError as exception:
+                self.module.warn(f"Failed to share the rate limit with other processes: {to_native(exception)}")
+
+        catalog_cache = None
+        if self.module.params.get("catalog_cache_dir"):
+            catalog_cache = CatalogCache(
+                self.module.params["api_token"],
+                self.module.params["api_endpoint"],
+                self.module.params["catalog_cache_dir"],
+                ttl=self.module.params["catalog_cache_ttl"],
+            )
+
         self.client = Client(
             token=self.module.params["api_token"],
             api_endpoint=self.module.params["api_endpoint"],
             application_name="ansible-module",
             application_version=version,
-            # Total waiting time before timeout is > 117.0
+            # Used when the completion of the actions cannot be estimated from their progress
             poll_interval=exponential_backoff_function(base=1.0, multiplier=2, cap=5.0),
-            poll_max_retries=25,
+            poll_timeout=self._wait_timeout(120.0),
+            poll_adaptive=True,
+            rate_limiter=rate_limiter,
+            # Modules fetch the same resources repeatedly, cache the GET requests for the
+            # duration of the module run. The cache is invalidated by the mutations.
+            session=CachedSession(self.module.params["api_endpoint"], catalog_cache=catalog_cache),
         )
 
+    def _wait_timeout(self, default: float) -> float:
+        """
+        Get the time in seconds to wait for an action, the `wait_timeout` module argument
+        takes precedence over the default of the action.
+
+        :param default: Time in seconds to wait for the action, when not set in the module arguments
+        """
+        wait_timeout = self.module.params.get("wait_timeout")
+        return default if wait_timeout is None else float(wait_timeout)
+
+    def _wait_for_actions(self, *actions: BoundAction, timeout: float | None = None) -> None:
+        """
+        Wait until the actions finished.
+
+        With the `wait=false` module argument, waiting for the actions is deferred until
+        the next change, and the actions still running once the module is done are
+        returned in the `action_ids` of the result.
+
+        :param actions: Actions to wait for
+        :param timeout: Time in seconds to wait for the actions, defaults to the `wait_timeout` module argument
+        """
+        if not self.module.params.get("wait", True):
+            self.client.defer_actions(actions, timeout)
+        else:
+            try:
+                self.client.wait_for_actions(list(actions), timeout=timeout)
+            except ActionGroupException as exception:
+                if len(exception.exceptions) == 1:
+                    # Report a single failed action on its own
+                    raise exception.exceptions[0] from exception
+                raise
+
     def _client_get_by_name_or_id(self, resource: str, param: str | int):
         """
         Get a resource by name, and if not found by its ID.
@@ -101,7 +174,45 @@ class AnsibleHCloud:
         try:
             return client_get_by_name_or_id(self.client, resource, param)
         except ClientException as exception:
-            self.module.fail_json(msg=to_native(exception))
+            return self.module.fail_json(msg=to_native(exception))
+
+    def _client_resolve_many(self, resource: str, params: list[str | int]) -> list:
+        """
+        Get many resources by name, and if not found by their ID.
+
+        :param resource: Name of the resource client that implements the `get_by_name`, `get_by_id`
+            and `get_list` methods
+        :param params: Names or IDs of the resources to query
+        """
+        try:
+            return client_resolve_many(self.client, resource, params)
+        except ClientException as exception:
+            return self.module.fail_json(msg=to_native(exception))
+
+    @contextmanager
+    def _resource_lock(self, resource: str, resource_id: int) -> Iterator[bool]:
+        """
+        Serialize the mutations of a resource with the other module processes on this host,
+        when enabled using the `resource_lock` module argument.
+
+        The time spent waiting for the lock is reported in the result.
+
+        :param resource: Type of the resource to lock, e.g. load_balancers
+        :param resource_id: ID of the resource to lock
+        :return: Whether the lock is held, the resource state must then be fetched again.
+        """
+        if not self.module.params.get("resource_lock"):
+            yield False
+            return
+
+        with ResourceLock(self.module.params["api_token"], state_directory(), resource, resource_id) as lock:
+            self.result["lock_wait_time"] = round(self.result.get("lock_wait_time", 0.0) + lock.wait_time, 3)
+            # The resource might have been modified by another process while waiting for the lock
+            self.client.invalidate(resource, resource_id)
+            yield True
+            # The actions deferred using `wait=false` must finish before releasing the lock,
+            # the next process holding the lock would otherwise conflict with them.
+            self.client.wait_for_deferred_actions()
 
     def _mark_as_changed(self) -> None:
         self.result["changed"] = True
@@ -144,6 +255,43 @@ class AnsibleHCloud:
                 "default": "https://api.hetzner.cloud/v1",
                 "aliases": ["endpoint"],
             },
+            "shared_rate_limit": {
+                "type": "bool",
+                "fallback": (env_fallback, ["HCLOUD_SHARED_RATE_LIMIT"]),
+                "default": False,
+            },
+            "catalog_cache_dir": {
+                "type": "path",
+                "fallback": (env_fallback, ["HCLOUD_CATALOG_CACHE_DIR"]),
+            },
+            "catalog_cache_ttl": {
+                "type": "int",
+                "fallback": (env_fallback, ["HCLOUD_CATALOG_CACHE_TTL"]),
+                "default": 3600,
+            },
+        }
+
+    @classmethod
+    def resource_lock_module_arguments(cls):
+        return {
+            "resource_lock": {
+                "type": "bool",
+                "fallback": (env_fallback, ["HCLOUD_RESOURCE_LOCK"]),
+                "default": False,
+            },
+        }
+
+    @classmethod
+    def wait_module_arguments(cls):
+        return {
+            "wait": {
+                "type": "bool",
+                "default": True,
+            },
+            "wait_timeout": {
+                "type": "int",
+                "fallback": (env_fallback, ["HCLOUD_WAIT_TIMEOUT"]),
+            },
         }
 
     def _prepare_result(self) -> dict[str, Any]:
@@ -152,5 +300,11 @@ class AnsibleHCloud:
 
     def get_result(self) -> dict[str, Any]:
         if getattr(self, self.represent) is not None:
-            self.result[self.represent] = self._prepare_result()
+            try:
+                self.result[self.represent] = self._prepare_result()
+            except HCloudException as exception:
+                # Resources might be lazily fetched while preparing the result
+                self.fail_json_hcloud(exception)
+        if not self.module.params.get("wait", True):
+            self.result["action_ids"] = [action.id for action in self.client.deferred_actions]
         return self.result
@@ -0,0 +1,72 @@
+# Copyright: (c) 2026, Hetzner Cloud GmbH <info@hetzner-cloud.de>
+
+from __future__ import annotations
+
+import fcntl
+import os
+import time
+
+from .client import client_token_digest
+from .state import open_state_file
+
+
+class ResourceLock:
+    """
+    Lock serializing the mutations of a single resource across the processes using the
+    same API token on this host, e.g. the forks of a playbook running modules on localhost.
+
+    Waiting processes block on the lock file, until the process holding the lock
+    releases it, instead of retrying API requests that failed with a conflict.
+    """
+
+    wait_time: float
+    """Time in seconds spent waiting for the lock."""
+
+    def __init__(self, token: str, directory: str, resource: str, resource_id: int) -> None:
+        """
+        :param token: API token, used to share the lock between the clients using the same token.
+        :param directory: Directory holding the lock file.
+        :param resource: Type of the locked resource, e.g. load_balancers.
+        :param resource_id: ID of the locked resource.
+        """
+        self.path = os.path.join(directory, f"hcloud-lock-{client_token_digest(token)}-{resource}-{resource_id}")
+        self.wait_time = 0.0
+        self._fd: int | None = None
+
+    def acquire(self) -> None:
+        start = time.monotonic()
+        while True:
+            fd = open_state_file(self.path)
+            try:
+                fcntl.flock(fd, fcntl.LOCK_EX)
+                # The lock file is removed when released, the lock is only held if the
+                # locked file is still the one at the lock path.
+                if os.fstat(fd).st_ino == os.stat(self.path).st_ino:
+                    break
+            except FileNotFoundError:
+                pass
+            except OSError:
+                os.close(fd)
+                raise
+            os.close(fd)
+
+        self.wait_time = time.monotonic() - start
+        self._fd = fd
+
+    def release(self) -> None:
+        if self._fd is None:
+            return
+
+        try:
+            os.unlink(self.path)
+            fcntl.flock(self._fd, fcntl.LOCK_UN)
+        finally:
+            os.close(self._fd)
+            self._fd = None
+
+    def __enter__(self) -> ResourceLock:
+        self.acquire()
+        return self
+
+    def __exit__(self, *args) -> None:
+        self.release()
@@ -0,0 +1,150 @@
+# Copyright: (c) 2026, Hetzner Cloud GmbH <info@hetzner-cloud.de>
+
+from __future__ import annotations
+
+from collections.abc import Sequence
+from datetime import datetime
+from functools import lru_cache
+from typing import Any
+
+
+def get_path(data: dict | None, path: str, default: Any = None) -> Any:
+    """
+    Return the value at a dotted path of an API JSON dict, e.g. `datacenter.location.name`.
+
+    :param data: API JSON dict of a resource.
+    :param path: Dotted path of the value.
+    :param default: Value returned if a part of the path is missing or null.
+    """
+    value: Any = data
+    for key in path.split("."):
+        if not isinstance(value, dict):
+            return default
+        value = value.get(key)
+    return default if value is None else value
+
+
+class Record(tuple):
+    """
+    Compact record of the fields projected from an API JSON dict, see the `fields`
+    argument of :func:`client_iter_all <.client.client_iter_all>`.
+
+    The fields are read by name, including the dotted paths, e.g.
+    `record["datacenter.location.name"]`, or as attributes for the plain names, e.g.
+    `record.name`, unless shadowed by a tuple method (`count`, `index`). A field missing
+    from the data, or below a value that is not a dict, is None.
+    """
+
+    __slots__ = ()
+
+    _fields: tuple[str, ...] = ()
+    _paths: tuple[tuple[str, ...], ...] = ()
+    _index: dict[str, int] = {}
+
+    @classmethod
+    def from_dict(cls, data: dict) -> Record:
+        """
+        Build the record from an API JSON dict.
+
+        :param data: API JSON dict of a resource.
+        """
+        values = []
+        for path in cls._paths:
+            value: Any = data
+            for key in path:
+                if not isinstance(value, dict):
+                    value = None
+                    break
+                value = value.get(key)
+            values.append(value)
+        return tuple.__new__(cls, values)
+
+    def __getitem__(self, key):
+        if isinstance(key, str):
+            return tuple.__getitem__(self, self._index[key])
+        return tuple.__getitem__(self, key)
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            return tuple.__getitem__(self, self._index[name])
+        except KeyError:
+            raise AttributeError(f"'{self.__class__.__name__}' object has no attribute '{name}'") from None
+
+    def _asdict(self) -> dict[str, Any]:
+        return dict(zip(self._fields, self))
+
+    def __repr__(self) -> str:
+        kwargs = [f"{key}={value!r}" for key, value in zip(self._fields, self)]
+        return f"{self.__class__.__qualname__}({', '.join(kwargs)})"
+
+    def __reduce__(self):
+        return (_build_record, (self._fields, tuple(self)))
+
+
+@lru_cache(maxsize=None)
+def _record_type(fields: tuple[str, ...]) -> type[Record]:
+    return type(
+        "Record",
+        (Record,),
+        {
+            "__slots__": (),
+            "_fields": fields,
+            "_paths": tuple(tuple(field.split(".")) for field in fields),
+            "_index": {field: i for i, field in enumerate(fields)},
+        },
+    )
+
+
+def record_type(fields: Sequence[str]) -> type[Record]:
+    """
+    Return the record type of a list of fields, created once per list of fields.
+
+    :param fields: Names of the fields, dotted paths for the nested fields, e.g. `datacenter.location.name`.
+    """
+    return _record_type(tuple(fields))
+
+
+def _build_record(fields: tuple[str, ...], values: tuple) -> Record:
+    return tuple.__new__(_record_type(fields), values)
+
+
+def project(data: dict | Record, fields: dict[str, str]) -> dict[str, Any]:
+    """
+    Project an API JSON dict, or a record, to the result of a module.
+
+    :param data: API JSON dict, or record, of a resource.
+    :param fields: Dotted paths of the values, by result key.
+    """
+    if isinstance(data, Record):
+        return {key: data[path] for key, path in fields.items()}
+    return {key: get_path(data, path) for key, path in fields.items()}
+
+
+def parse_timestamp(value: str) -> datetime:
+    """
+    Parse a RFC 3339 timestamp returned by the API, e.g. `2016-01-30T23:55:00+00:00`.
+
+    The fixed format of the API is parsed with :meth:`datetime.fromisoformat`, other
+    formats fall back to `dateutil`, which is only imported when needed.
+
+    :param value: Timestamp returned by the API.
+    """
+    try:
+        if value.endswith("Z"):
+            return datetime.fromisoformat(value[:-1] + "+00:00")
+        return datetime.fromisoformat(value)
+    except ValueError:
+        # pylint: disable=import-outside-toplevel
+        from dateutil.parser import isoparse
+
+        return isoparse(value)
+
+
+def isoformat(value: str | None) -> str | None:
+    """
+    Return an API timestamp formatted like :meth:`datetime.isoformat`, as done for the
+    timestamps of the bound models.
+
+    :param value: Timestamp returned by the API.
+    """
+    return parse_timestamp(value).isoformat() if value else None
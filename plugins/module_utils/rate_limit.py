@@ -0,0 +1,82 @@
+# Copyright: (c) 2026, Hetzner Cloud GmbH <info@hetzner-cloud.de>
+
+from __future__ import annotations
+
+import fcntl
+import mmap
+import os
+import struct
+import time
+from contextlib import contextmanager
+from typing import Iterator
+
+from .client import RateLimiter, client_token_digest
+from .state import open_state_file, remove_stale_state_files
+
+
+class SharedRateLimiter(RateLimiter):
+    """
+    Rate limiter sharing its token bucket with every process using the same API token
+    on this host, e.g. the forks of a playbook running modules on localhost.
+
+    The bucket state is stored in a small memory mapped file, and the access to the
+    state is guarded by a lock on that file. The requests of all processes are spread
+    using the shared bucket, and the last rate limit headers seen by any process are
+    shared with the others.
+    """
+
+    # limit, tokens, rate, updated_at
+    _state = struct.Struct("<qddd")
+
+    max_age: float = 86400.0
+    """Time in seconds after which the unused state files are removed."""
+
+    def __init__(self, token: str, directory: str) -> None:
+        """
+        :param token: API token, used to share the state between the clients using the same token.
+        :param directory: Directory holding the state file.
+        """
+        super().__init__()
+
+        # The rate limit is fully replenished within an hour, older states are useless.
+        remove_stale_state_files(directory, "hcloud-rate-limit-", self.max_age)
+
+        self.path = os.path.join(directory, f"hcloud-rate-limit-{client_token_digest(token)}")
+
+        self._fd = open_state_file(self.path)
+        try:
+            os.utime(self._fd)
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                if os.fstat(self._fd).st_size < self._state.size:
+                    os.ftruncate(self._fd, self._state.size)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+            self._mmap = mmap.mmap(self._fd, self._state.size)
+        except OSError:
+            os.close(self._fd)
+            raise
+
+    def close(self) -> None:
+        self._mmap.close()
+        os.close(self._fd)
+
+    @contextmanager
+    def _synchronized(self) -> Iterator[None]:
+        with self._lock:
+            fcntl.flock(self._fd, fcntl.LOCK_EX)
+            try:
+                limit, self._tokens, self._rate, self._updated_at = self._state.unpack_from(self._mmap)
+                self._limit = limit or None
+
+                yield
+
+                self._state.pack_into(self._mmap, 0, self._limit or 0, self._tokens, self._rate, self._updated_at)
+            finally:
+                fcntl.flock(self._fd, fcntl.LOCK_UN)
+
+    @staticmethod
+    def _clock() -> float:
+        # The clock must be comparable between processes.
+        return time.time()
@@ -0,0 +1,66 @@
+# Copyright: (c) 2026, Hetzner Cloud GmbH <info@hetzner-cloud.de>
+
+from __future__ import annotations
+
+import os
+import stat
+import time
+
+
+def state_directory() -> str:
+    """
+    Return the directory holding the state shared between the module processes of the
+    current user on this host, e.g. the rate limit or the resource locks.
+
+    The directory is created if missing, and must only be accessible by the current user.
+    """
+    path = os.path.join(os.path.expanduser("~"), ".ansible", "tmp", "hcloud")
+    os.makedirs(path, mode=0o700, exist_ok=True)
+
+    info = os.lstat(path)
+    if not stat.S_ISDIR(info.st_mode) or info.st_uid != os.geteuid() or info.st_mode & 0o077:
+        raise OSError(f"state directory must be a directory only accessible by the current user: {path}")
+    return path
+
+
+def open_state_file(path: str) -> int:
+    """
+    Open, or create, a state file without following symlinks, and make sure it is a
+    regular file owned by the current user.
+
+    :param path: Path of the state file.
+    :return: File descriptor of the state file.
+    """
+    fd = os.open(path, os.O_RDWR | os.O_CREAT | os.O_NOFOLLOW, 0o600)
+    try:
+        info = os.fstat(fd)
+        if not stat.S_ISREG(info.st_mode) or info.st_uid != os.geteuid():
+            raise OSError(f"state file must be a regular file owned by the current user: {path}")
+    except OSError:
+        os.close(fd)
+        raise
+    return fd
+
+
+def remove_stale_state_files(directory: str, prefix: str, max_age: float) -> None:
+    """
+    Remove the state files that were not used for a while.
+
+    :param directory: Directory holding the state files.
+    :param prefix: Prefix of the state files to remove.
+    :param max_age: Time in seconds since the last modification, after which a state file is removed.
+    """
+    try:
+        names = os.listdir(directory)
+    except OSError:
+        return
+
+    for name in names:
+        if not name.startswith(prefix):
+            continue
+        path = os.path.join(directory, name)
+        try:
+            if os.lstat(path).st_mtime < time.time() - max_age:
+                os.unlink(path)
+        except OSError:
+            pass
@@ -0,0 +1,171 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Hetzner Cloud GmbH <info@hetzner-cloud.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import annotations
+
+DOCUMENTATION = """
+---
+module: action_wait
+short_description: Wait for Hetzner Cloud Actions to finish.
+
+description:
+    - Wait for Hetzner Cloud Actions to finish, e.g. the actions returned by the modules using O(wait=false).
+    - The actions are polled together, with a single request per poll interval.
+
+author:
+    - Jonas Lammler (@jooola)
+
+version_added: 4.3.0
+options:
+    ids:
+        description:
+            - List of Action IDs to wait for.
+            - The module will fail if an action does not exist.
+        type: list
+        elements: int
+        required: true
+    wait_timeout:
+        description:
+            - Time in seconds to wait for the actions to finish, before failing with a timeout.
+            - The actions are polled based on their progress, less often for long running actions and more often
+              near their completion.
+            - You can also set this option by using the C(HCLOUD_WAIT_TIMEOUT) environment variable.
+        default: 1800
+        type: int
+
+extends_documentation_fragment:
+    - hetzner.hcloud.hcloud
+"""
+
+EXAMPLES = """
+- name: Create servers without waiting for them
+  hetzner.hcloud.server:
+    name: "{{ item }}"
+    server_type: cpx22
+    image: debian-12
+    wait: false
+  loop: [my-server1, my-server2, my-server3]
+  register: servers
+
+- name: Wait for the servers to be created
+  hetzner.hcloud.action_wait:
+    ids: "{{ servers.results | map(attribute='action_ids') | flatten }}"
+"""
+
+RETURN = """
+hcloud_action_wait:
+    description: The finished actions
+    returned: always
+    type: list
+    elements: dict
+    contains:
+        id:
+            description: Numeric identifier of the action
+            returned: always
+            type: int
+            sample: 1937415
+        command:
+            description: Command executed in the action
+            returned: always
+            type: str
+            sample: create_server
+        status:
+            description: Status of the action
+            returned: always
+            type: str
+            sample: success
+        progress:
+            description: Progress of the action in percent
+            returned: always
+            type: int
+            sample: 100
+        started:
+            description: Point in time when the action was started
+            returned: always
+            type: str
+            sample: "2024-01-01T12:00:00+00:00"
+        finished:
+            description: Point in time when the action was finished
+            returned: always
+            type: str
+            sample: "2024-01-01T12:00:30+00:00"
+        resources:
+            description: Resources the action relates to
+            returned: always
+            type: list
+            elements: dict
+            sample: [{"id": 42, "type": "server"}]
+"""
+
+from ansible.module_utils.basic import AnsibleModule, env_fallback
+
+from ..module_utils.hcloud import AnsibleHCloud
+from ..module_utils.vendor.hcloud import HCloudException
+from ..module_utils.vendor.hcloud.actions import BoundAction
+
+
+class AnsibleHCloudActionWait(AnsibleHCloud):
+    represent = "hcloud_action_wait"
+
+    hcloud_action_wait: list[BoundAction] | None = None
+
+    def _prepare_result(self):
+        return [
+            {
+                "id": action.id,
+                "command": action.command,
+                "status": action.status,
+                "progress": action.progress,
+                "started": action.started.isoformat() if action.started is not None else None,
+                "finished": action.finished.isoformat() if action.finished is not None else None,
+                "resources": action.resources,
+            }
+            for action in self.hcloud_action_wait
+        ]
+
+    def wait_for_actions(self):
+        ids = list(dict.fromkeys(self.module.params.get("ids")))
+        try:
+            actions = self.client.get_actions_by_ids(ids)
+
+            missing = set(ids) - {action.id for action in actions}
+            if missing:
+                self.module.fail_json(msg=f"resource (action) does not exist: {', '.join(map(str, sorted(missing)))}")
+
+            self.hcloud_action_wait = self.client.wait_for_actions(
+                actions,
+                timeout=self.module.params.get("wait_timeout"),
+            )
+        except HCloudException as exception:
+            self.fail_json_hcloud(exception)
+
+    @classmethod
+    def define_module(cls):
+        return AnsibleModule(
+            argument_spec=dict(
+                ids={"type": "list", "elements": "int", "required": True},
+                wait_timeout={
+                    "type": "int",
+                    "fallback": (env_fallback, ["HCLOUD_WAIT_TIMEOUT"]),
+                    "default": 1800,
+                },
+                **super().base_module_arguments(),
+            ),
+            supports_check_mode=True,
+        )
+
+
+def main():
+    module = AnsibleHCloudActionWait.define_module()
+
+    hcloud = AnsibleHCloudActionWait(module)
+    hcloud.wait_for_actions()
+
+    module.exit_json(**hcloud.get_result())
+
+
+if __name__ == "__main__":
+    main()
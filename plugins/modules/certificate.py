@@ -65,6 +65,7 @@ options:
         type: str
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 
 """
 
@@ -143,6 +144,12 @@ hcloud_certificate:
             description: User-defined labels (key-value pairs)
             returned: always
             type: dict
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -204,7 +211,7 @@ class AnsibleHCloudCertificate(AnsibleHCloud):
                     resp = self.client.certificates.create_managed(**params)
                     # Action should take 60 to 90 seconds on average, wait for 5m to
                     # allow DNS or Let's Encrypt slowdowns.
-                    resp.action.wait_until_finished(max_retries=62)  # 62 retries >= 302 seconds
+                    self._wait_for_actions(resp.action, timeout=self._wait_timeout(300))
                 except HCloudException as exception:
                     self.fail_json_hcloud(exception)
 
@@ -266,6 +273,7 @@ class AnsibleHCloudCertificate(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             required_one_of=[["id", "name"]],
             required_if=[["state", "present", ["name"]]],
@@ -86,8 +86,11 @@ hcloud_certificate_info:
             type: dict
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.certificates import BoundCertificate
@@ -96,7 +99,7 @@ from ..module_utils.vendor.hcloud.certificates import BoundCertificate
 class AnsibleHCloudCertificateInfo(AnsibleHCloud):
     represent = "hcloud_certificate_info"
 
-    hcloud_certificate_info: list[BoundCertificate] | None = None
+    hcloud_certificate_info: Iterable[BoundCertificate] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -126,11 +129,11 @@ class AnsibleHCloudCertificateInfo(AnsibleHCloud):
             elif self.module.params.get("name") is not None:
                 self.hcloud_certificate_info = [self.client.certificates.get_by_name(self.module.params.get("name"))]
             elif self.module.params.get("label_selector") is not None:
-                self.hcloud_certificate_info = self.client.certificates.get_all(
-                    label_selector=self.module.params.get("label_selector")
+                self.hcloud_certificate_info = client_iter_all(
+                    self.client, "certificates", label_selector=self.module.params.get("label_selector")
                 )
             else:
-                self.hcloud_certificate_info = self.client.certificates.get_all()
+                self.hcloud_certificate_info = client_iter_all(self.client, "certificates")
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
@@ -117,8 +117,11 @@ hcloud_datacenter_info:
                     sample: [1, 2, 3]
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.datacenters import BoundDatacenter
@@ -127,7 +130,7 @@ from ..module_utils.vendor.hcloud.datacenters import BoundDatacenter
 class AnsibleHCloudDatacenterInfo(AnsibleHCloud):
     represent = "hcloud_datacenter_info"
 
-    hcloud_datacenter_info: list[BoundDatacenter] | None = None
+    hcloud_datacenter_info: Iterable[BoundDatacenter] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -159,7 +162,7 @@ class AnsibleHCloudDatacenterInfo(AnsibleHCloud):
             elif self.module.params.get("name") is not None:
                 self.hcloud_datacenter_info = [self.client.datacenters.get_by_name(self.module.params.get("name"))]
             else:
-                self.hcloud_datacenter_info = self.client.datacenters.get_all()
+                self.hcloud_datacenter_info = client_iter_all(self.client, "datacenters")
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
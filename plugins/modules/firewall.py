@@ -88,6 +88,7 @@ options:
 
 extends_documentation_fragment:
     - hetzner.hcloud.hcloud
+    - hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -214,6 +215,12 @@ hcloud_firewall:
                             description: ID of the Server.
                             type: int
                             sample: 12345
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 import time
@@ -355,8 +362,7 @@ class AnsibleHCloudFirewall(AnsibleHCloud):
                 if self.hcloud_firewall.applied_to:
                     if self.module.params.get("force"):
                         actions = self.hcloud_firewall.remove_from_resources(self.hcloud_firewall.applied_to)
-                        for action in actions:
-                            action.wait_until_finished()
+                        self._wait_for_actions(*actions)
                     else:
                         self.module.warn(
                             f"Firewall {self.hcloud_firewall.name} is currently used by "
@@ -411,6 +417,7 @@ class AnsibleHCloudFirewall(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             required_one_of=[["id", "name"]],
             required_if=[["state", "present", ["name"]]],
@@ -141,8 +141,11 @@ hcloud_firewall_info:
                             sample: 12345
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.firewalls import (
@@ -155,7 +158,7 @@ from ..module_utils.vendor.hcloud.firewalls import (
 class AnsibleHCloudFirewallInfo(AnsibleHCloud):
     represent = "hcloud_firewall_info"
 
-    hcloud_firewall_info: list[BoundFirewall] | None = None
+    hcloud_firewall_info: Iterable[BoundFirewall] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -209,11 +212,11 @@ class AnsibleHCloudFirewallInfo(AnsibleHCloud):
             elif self.module.params.get("name") is not None:
                 self.hcloud_firewall_info = [self.client.firewalls.get_by_name(self.module.params.get("name"))]
             elif self.module.params.get("label_selector") is not None:
-                self.hcloud_firewall_info = self.client.firewalls.get_all(
-                    label_selector=self.module.params.get("label_selector")
+                self.hcloud_firewall_info = client_iter_all(
+                    self.client, "firewalls", label_selector=self.module.params.get("label_selector")
                 )
             else:
-                self.hcloud_firewall_info = self.client.firewalls.get_all()
+                self.hcloud_firewall_info = client_iter_all(self.client, "firewalls")
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
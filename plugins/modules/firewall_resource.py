@@ -43,6 +43,8 @@ options:
 
 extends_documentation_fragment:
     - hetzner.hcloud.hcloud
+    - hetzner.hcloud.hcloud.resource_lock
+    - hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -100,10 +102,22 @@ hcloud_firewall_resource:
             type: list
             elements: str
             sample: [env=prod]
+lock_wait_time:
+    description: Time in seconds spent waiting for the resource lock.
+    returned: when O(resource_lock=true)
+    type: float
+    sample: 1.234
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import ClientResourceIndex
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.firewalls import (
@@ -118,19 +132,22 @@ class AnsibleHCloudFirewallResource(AnsibleHCloud):
     represent = "hcloud_firewall_resource"
 
     hcloud_firewall_resource: BoundFirewall | None = None
+    hcloud_servers: ClientResourceIndex | None = None
 
     def _prepare_result(self):
-        servers = []
+        server_ids = []
         label_selectors = []
         for resource in self.hcloud_firewall_resource.applied_to:
             if resource.type == FirewallResource.TYPE_SERVER:
-                servers.append(resource.server.name)
+                server_ids.append(resource.server.id)
             elif resource.type == FirewallResource.TYPE_LABEL_SELECTOR:
                 label_selectors.append(resource.label_selector.selector)
 
+        self.hcloud_servers.prefetch(server_ids)
+
         return {
             "firewall": self.hcloud_firewall_resource.name,
-            "servers": servers,
+            "servers": [self.hcloud_servers.get(server_id).name for server_id in server_ids],
             "label_selectors": label_selectors,
         }
 
@@ -140,23 +157,32 @@ class AnsibleHCloudFirewallResource(AnsibleHCloud):
                 "firewalls",
                 self.module.params.get("firewall"),
             )
+            # Servers the firewall is applied to, fetched at once to render the result
+            self.hcloud_servers = ClientResourceIndex(self.client, "servers", fields=["id", "name"])
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
 
     def _diff_firewall_resources(self, operator) -> list[FirewallResource]:
-        before = self._prepare_result()
+        before_server_ids = set()
+        before_label_selectors = set()
+        for resource in self.hcloud_firewall_resource.applied_to:
+            if resource.type == FirewallResource.TYPE_SERVER:
+                before_server_ids.add(resource.server.id)
+            elif resource.type == FirewallResource.TYPE_LABEL_SELECTOR:
+                before_label_selectors.add(resource.label_selector.selector)
 
         resources: list[FirewallResource] = []
 
         servers: list[str] | None = self.module.params.get("servers")
         if servers:
-            for server_param in servers:
-                try:
-                    server: BoundServer = self._client_get_by_name_or_id("servers", server_param)
-                except HCloudException as exception:
-                    self.fail_json_hcloud(exception)
-
-                if operator(server.name, before["servers"]):
+            try:
+                wanted: list[BoundServer] = self._client_resolve_many("servers", servers)
+            except HCloudException as exception:
+                self.fail_json_hcloud(exception)
+
+            self.hcloud_servers.add(wanted)
+            for server in wanted:
+                if operator(server.id, before_server_ids):
                     resources.append(
                         FirewallResource(
                             type=FirewallResource.TYPE_SERVER,
@@ -167,7 +193,7 @@ class AnsibleHCloudFirewallResource(AnsibleHCloud):
         label_selectors = self.module.params.get("label_selectors")
         if label_selectors:
             for label_selector in label_selectors:
-                if operator(label_selector, before["label_selectors"]):
+                if operator(label_selector, before_label_selectors):
                     resources.append(
                         FirewallResource(
                             type=FirewallResource.TYPE_LABEL_SELECTOR,
@@ -179,33 +205,37 @@ class AnsibleHCloudFirewallResource(AnsibleHCloud):
 
     def present_firewall_resources(self):
         self._get_firewall()
-        resources = self._diff_firewall_resources(
-            lambda to_add, before: to_add not in before,
-        )
-        if resources:
-            if not self.module.check_mode:
-                actions = self.hcloud_firewall_resource.apply_to_resources(resources=resources)
-                for action in actions:
-                    action.wait_until_finished()
+        with self._resource_lock("firewalls", self.hcloud_firewall_resource.id) as locked:
+            if locked:
+                self._get_firewall()
+            resources = self._diff_firewall_resources(
+                lambda to_add, before: to_add not in before,
+            )
+            if resources:
+                if not self.module.check_mode:
+                    actions = self.hcloud_firewall_resource.apply_to_resources(resources=resources)
+                    self._wait_for_actions(*actions)
 
-                self.hcloud_firewall_resource.reload()
+                    self.hcloud_firewall_resource.reload()
 
-            self._mark_as_changed()
+                self._mark_as_changed()
 
     def absent_firewall_resources(self):
         self._get_firewall()
-        resources = self._diff_firewall_resources(
-            lambda to_remove, before: to_remove in before,
-        )
-        if resources:
-            if not self.module.check_mode:
-                actions = self.hcloud_firewall_resource.remove_from_resources(resources=resources)
-                for action in actions:
-                    action.wait_until_finished()
+        with self._resource_lock("firewalls", self.hcloud_firewall_resource.id) as locked:
+            if locked:
+                self._get_firewall()
+            resources = self._diff_firewall_resources(
+                lambda to_remove, before: to_remove in before,
+            )
+            if resources:
+                if not self.module.check_mode:
+                    actions = self.hcloud_firewall_resource.remove_from_resources(resources=resources)
+                    self._wait_for_actions(*actions)
 
-                self.hcloud_firewall_resource.reload()
+                    self.hcloud_firewall_resource.reload()
 
-            self._mark_as_changed()
+                self._mark_as_changed()
 
     @classmethod
     def define_module(cls):
@@ -219,6 +249,8 @@ class AnsibleHCloudFirewallResource(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().resource_lock_module_arguments(),
+                **super().wait_module_arguments(),
             },
             required_one_of=[["servers", "label_selectors"]],
             supports_check_mode=True,
@@ -71,6 +71,7 @@ options:
 
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -157,6 +158,12 @@ hcloud_floating_ip:
             sample:
                 key: value
                 mylabel: 123
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -217,7 +224,7 @@ class AnsibleHCloudFloatingIP(AnsibleHCloud):
                 delete_protection = self.module.params.get("delete_protection")
                 if delete_protection is not None:
                     action = self.hcloud_floating_ip.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
         self._mark_as_changed()
@@ -263,7 +270,7 @@ class AnsibleHCloudFloatingIP(AnsibleHCloud):
             if delete_protection is not None and delete_protection != self.hcloud_floating_ip.protection["delete"]:
                 if not self.module.check_mode:
                     action = self.hcloud_floating_ip.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 self._mark_as_changed()
 
             self._get_floating_ip()
@@ -313,6 +320,7 @@ class AnsibleHCloudFloatingIP(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             required_one_of=[["id", "name"]],
             mutually_exclusive=[["home_location", "server"]],
@@ -99,8 +99,11 @@ hcloud_floating_ip_info:
             type: dict
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.floating_ips import BoundFloatingIP
@@ -109,7 +112,7 @@ from ..module_utils.vendor.hcloud.floating_ips import BoundFloatingIP
 class AnsibleHCloudFloatingIPInfo(AnsibleHCloud):
     represent = "hcloud_floating_ip_info"
 
-    hcloud_floating_ip_info: list[BoundFloatingIP] | None = None
+    hcloud_floating_ip_info: Iterable[BoundFloatingIP] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -141,11 +144,11 @@ class AnsibleHCloudFloatingIPInfo(AnsibleHCloud):
             elif self.module.params.get("name") is not None:
                 self.hcloud_floating_ip_info = [self.client.floating_ips.get_by_name(self.module.params.get("name"))]
             elif self.module.params.get("label_selector") is not None:
-                self.hcloud_floating_ip_info = self.client.floating_ips.get_all(
-                    label_selector=self.module.params.get("label_selector")
+                self.hcloud_floating_ip_info = client_iter_all(
+                    self.client, "floating_ips", label_selector=self.module.params.get("label_selector")
                 )
             else:
-                self.hcloud_floating_ip_info = self.client.floating_ips.get_all()
+                self.hcloud_floating_ip_info = client_iter_all(self.client, "floating_ips")
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
@@ -111,8 +111,11 @@ hcloud_image_info:
             type: dict
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.images import BoundImage
@@ -121,7 +124,7 @@ from ..module_utils.vendor.hcloud.images import BoundImage
 class AnsibleHCloudImageInfo(AnsibleHCloud):
     represent = "hcloud_image_info"
 
-    hcloud_image_info: list[BoundImage] | None = None
+    hcloud_image_info: Iterable[BoundImage] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -175,7 +178,7 @@ class AnsibleHCloudImageInfo(AnsibleHCloud):
                 if architecture:
                     params["architecture"] = architecture
 
-                self.hcloud_image_info = self.client.images.get_all(**params)
+                self.hcloud_image_info = client_iter_all(self.client, "images", **params)
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
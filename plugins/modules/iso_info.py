@@ -121,8 +121,11 @@ hcloud_iso_info:
                     sample: "2021-12-01T00:00:00+00:00"
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.isos import BoundIso
@@ -131,7 +134,7 @@ from ..module_utils.vendor.hcloud.isos import BoundIso
 class AnsibleHCloudIsoInfo(AnsibleHCloud):
     represent = "hcloud_iso_info"
 
-    hcloud_iso_info: list[BoundIso] | None = None
+    hcloud_iso_info: Iterable[BoundIso] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -170,7 +173,9 @@ class AnsibleHCloudIsoInfo(AnsibleHCloud):
             elif self.module.params.get("name") is not None:
                 self.hcloud_iso_info = [self.client.isos.get_by_name(self.module.params.get("name"))]
             else:
-                self.hcloud_iso_info = self.client.isos.get_all(
+                self.hcloud_iso_info = client_iter_all(
+                    self.client,
+                    "isos",
                     architecture=self.module.params.get("architecture"),
                     include_architecture_wildcard=self.module.params.get("include_wildcard_architecture"),
                 )
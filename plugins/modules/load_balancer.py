@@ -71,6 +71,7 @@ options:
         type: str
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -144,6 +145,12 @@ hcloud_load_balancer:
             type: bool
             returned: always
             sample: false
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -208,13 +215,13 @@ class AnsibleHCloudLoadBalancer(AnsibleHCloud):
 
             if not self.module.check_mode:
                 resp = self.client.load_balancers.create(**params)
-                resp.action.wait_until_finished()
+                self._wait_for_actions(resp.action)
 
                 delete_protection = self.module.params.get("delete_protection")
                 if delete_protection is not None:
                     self._get_load_balancer()
                     action = self.hcloud_load_balancer.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
         self._mark_as_changed()
@@ -232,7 +239,7 @@ class AnsibleHCloudLoadBalancer(AnsibleHCloud):
             if delete_protection is not None and delete_protection != self.hcloud_load_balancer.protection["delete"]:
                 if not self.module.check_mode:
                     action = self.hcloud_load_balancer.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 self._mark_as_changed()
             self._get_load_balancer()
 
@@ -243,10 +250,10 @@ class AnsibleHCloudLoadBalancer(AnsibleHCloud):
                 if not self.module.check_mode:
                     if disable_public_interface is True:
                         action = self.hcloud_load_balancer.disable_public_interface()
-                        action.wait_until_finished()
+                        self._wait_for_actions(action)
                     else:
                         action = self.hcloud_load_balancer.enable_public_interface()
-                        action.wait_until_finished()
+                        self._wait_for_actions(action)
                 self._mark_as_changed()
 
             load_balancer_type = self.module.params.get("load_balancer_type")
@@ -261,14 +268,14 @@ class AnsibleHCloudLoadBalancer(AnsibleHCloud):
                     action = self.hcloud_load_balancer.change_type(
                         load_balancer_type=new_load_balancer_type,
                     )
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
 
                 self._mark_as_changed()
 
             algorithm = self.module.params.get("algorithm")
             if algorithm is not None and self.hcloud_load_balancer.algorithm.type != algorithm:
                 action = self.hcloud_load_balancer.change_algorithm(algorithm=LoadBalancerAlgorithm(type=algorithm))
-                action.wait_until_finished()
+                self._wait_for_actions(action)
                 self._mark_as_changed()
 
             self._get_load_balancer()
@@ -311,6 +318,7 @@ class AnsibleHCloudLoadBalancer(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             required_one_of=[["id", "name"]],
             mutually_exclusive=[["location", "network_zone"]],
@@ -271,113 +271,161 @@ hcloud_load_balancer_info:
                                     sample: false
 """
 
+from collections.abc import Iterable
+from concurrent.futures import ThreadPoolExecutor
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import (
+    ClientResourceIndex,
+    client_get_by_id,
+    client_get_by_name,
+    client_iter_all,
+)
 from ..module_utils.hcloud import AnsibleHCloud
+from ..module_utils.projection import project
 from ..module_utils.vendor.hcloud import HCloudException
-from ..module_utils.vendor.hcloud.load_balancers import (
-    BoundLoadBalancer,
-    LoadBalancerService,
-    LoadBalancerTarget,
-)
+
+LOAD_BALANCER_FIELDS = {
+    "ipv4_address": "public_net.ipv4.ip",
+    "ipv6_address": "public_net.ipv6.ip",
+    "load_balancer_type": "load_balancer_type.name",
+    "location": "location.name",
+}
+SERVICE_HTTP_FIELDS = {
+    "cookie_name": "cookie_name",
+    "cookie_lifetime": "cookie_lifetime",
+    "redirect_http": "redirect_http",
+    "sticky_sessions": "sticky_sessions",
+}
+HEALTH_CHECK_FIELDS = {
+    "protocol": "protocol",
+    "port": "port",
+    "interval": "interval",
+    "timeout": "timeout",
+    "retries": "retries",
+}
+HEALTH_CHECK_HTTP_FIELDS = {
+    "domain": "domain",
+    "path": "path",
+    "response": "response",
+    "certificates": "status_codes",
+    "tls": "tls",
+}
+HEALTH_STATUS_FIELDS = {
+    "listen_port": "listen_port",
+    "status": "status",
+}
 
 
 class AnsibleHCloudLoadBalancerInfo(AnsibleHCloud):
     represent = "hcloud_load_balancer_info"
 
-    hcloud_load_balancer_info: list[BoundLoadBalancer] | None = None
+    hcloud_load_balancer_info: Iterable[dict] | None = None
 
     def _prepare_result(self):
         tmp = []
 
-        for load_balancer in self.hcloud_load_balancer_info:
-            if load_balancer is None:
-                continue
+        load_balancers = [
+            load_balancer for load_balancer in self.hcloud_load_balancer_info if load_balancer is not None
+        ]
+
+        # Fetch the servers and certificates referenced by the load balancers at once,
+        # and join them by ID.
+        servers = ClientResourceIndex(self.client, "servers", fields=["id", "name"])
+        certificates = ClientResourceIndex(self.client, "certificates", fields=["id", "name"])
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            futures = [
+                executor.submit(
+                    servers.prefetch,
+                    [
+                        target["server"]["id"]
+                        for load_balancer in load_balancers
+                        for target in load_balancer["targets"]
+                        if target["type"] == "server"
+                    ],
+                ),
+                executor.submit(
+                    certificates.prefetch,
+                    [
+                        certificate
+                        for load_balancer in load_balancers
+                        for service in load_balancer["services"]
+                        if service["protocol"] != "tcp"
+                        for certificate in service["http"]["certificates"]
+                    ],
+                ),
+            ]
+            for future in futures:
+                future.result()
 
+        for load_balancer in load_balancers:
             tmp.append(
                 {
-                    "id": str(load_balancer.id),
-                    "name": load_balancer.name,
-                    "ipv4_address": load_balancer.public_net.ipv4.ip,
-                    "ipv6_address": load_balancer.public_net.ipv6.ip,
-                    "private_ipv4_address": load_balancer.private_net[0].ip if len(load_balancer.private_net) else None,
-                    "load_balancer_type": load_balancer.load_balancer_type.name,
-                    "location": load_balancer.location.name,
-                    "labels": load_balancer.labels,
-                    "delete_protection": load_balancer.protection["delete"],
-                    "disable_public_interface": False if load_balancer.public_net.enabled else True,
-                    "targets": [self._prepare_target_result(target) for target in load_balancer.targets],
-                    "services": [self._prepare_service_result(service) for service in load_balancer.services],
+                    "id": str(load_balancer["id"]),
+                    "name": load_balancer["name"],
+                    **project(load_balancer, LOAD_BALANCER_FIELDS),
+                    "private_ipv4_address": (
+                        load_balancer["private_net"][0]["ip"] if len(load_balancer["private_net"]) else None
+                    ),
+                    "labels": load_balancer["labels"],
+                    "delete_protection": load_balancer["protection"]["delete"],
+                    "disable_public_interface": False if load_balancer["public_net"]["enabled"] else True,
+                    "targets": [self._prepare_target_result(target, servers) for target in load_balancer["targets"]],
+                    "services": [
+                        self._prepare_service_result(service, certificates) for service in load_balancer["services"]
+                    ],
                 }
             )
         return tmp
 
     @staticmethod
-    def _prepare_service_result(service: LoadBalancerService):
+    def _prepare_service_result(service: dict, certificates: ClientResourceIndex):
         http = None
-        if service.protocol != "tcp":
+        if service["protocol"] != "tcp":
             http = {
-                "cookie_name": service.http.cookie_name,
-                "cookie_lifetime": service.http.cookie_lifetime,
-                "redirect_http": service.http.redirect_http,
-                "sticky_sessions": service.http.sticky_sessions,
-                "certificates": [certificate.name for certificate in service.http.certificates],
-            }
-        health_check = {
-            "protocol": service.health_check.protocol,
-            "port": service.health_check.port,
-            "interval": service.health_check.interval,
-            "timeout": service.health_check.timeout,
-            "retries": service.health_check.retries,
-        }
-        if service.health_check.protocol != "tcp":
-            health_check["http"] = {
-                "domain": service.health_check.http.domain,
-                "path": service.health_check.http.path,
-                "response": service.health_check.http.response,
-                "certificates": service.health_check.http.status_codes,
-                "tls": service.health_check.http.tls,
+                **project(service["http"], SERVICE_HTTP_FIELDS),
+                "certificates": [certificates.get(certificate).name for certificate in service["http"]["certificates"]],
             }
+        health_check = project(service["health_check"], HEALTH_CHECK_FIELDS)
+        if service["health_check"]["protocol"] != "tcp":
+            health_check["http"] = project(service["health_check"]["http"], HEALTH_CHECK_HTTP_FIELDS)
         return {
-            "protocol": service.protocol,
-            "listen_port": service.listen_port,
-            "destination_port": service.destination_port,
-            "proxyprotocol": service.proxyprotocol,
+            "protocol": service["protocol"],
+            "listen_port": service["listen_port"],
+            "destination_port": service["destination_port"],
+            "proxyprotocol": service["proxyprotocol"],
             "http": http,
             "health_check": health_check,
         }
 
     @staticmethod
-    def _prepare_target_result(target: LoadBalancerTarget):
+    def _prepare_target_result(target: dict, servers: ClientResourceIndex):
         result = {
-            "type": target.type,
-            "use_private_ip": target.use_private_ip,
+            "type": target["type"],
+            "use_private_ip": target.get("use_private_ip"),
         }
-        if target.type == "server":
-            result["server"] = target.server.name
-        elif target.type == "label_selector":
-            result["label_selector"] = target.label_selector.selector
-        elif target.type == "ip":
-            result["ip"] = target.ip.ip
-
-        if target.health_status is not None:
-            result["health_status"] = [
-                {
-                    "listen_port": item.listen_port,
-                    "status": item.status,
-                }
-                for item in target.health_status
-            ]
+        if target["type"] == "server":
+            result["server"] = servers.get(target["server"]["id"]).name
+        elif target["type"] == "label_selector":
+            result["label_selector"] = target["label_selector"]["selector"]
+        elif target["type"] == "ip":
+            result["ip"] = target["ip"]["ip"]
+
+        if target.get("health_status") is not None:
+            result["health_status"] = [project(item, HEALTH_STATUS_FIELDS) for item in target["health_status"]]
 
         return result
 
     def get_load_balancers(self):
         try:
             if self.module.params.get("id") is not None:
-                self.hcloud_load_balancer_info = [self.client.load_balancers.get_by_id(self.module.params.get("id"))]
+                self.hcloud_load_balancer_info = [
+                    client_get_by_id(self.client, "load_balancers", self.module.params.get("id"), raw=True)
+                ]
             elif self.module.params.get("name") is not None:
                 self.hcloud_load_balancer_info = [
-                    self.client.load_balancers.get_by_name(self.module.params.get("name"))
+                    client_get_by_name(self.client, "load_balancers", self.module.params.get("name"), raw=True)
                 ]
             else:
                 params = {}
@@ -385,7 +433,7 @@ class AnsibleHCloudLoadBalancerInfo(AnsibleHCloud):
                 if label_selector:
                     params["label_selector"] = label_selector
 
-                self.hcloud_load_balancer_info = self.client.load_balancers.get_all(**params)
+                self.hcloud_load_balancer_info = client_iter_all(self.client, "load_balancers", raw=True, **params)
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
@@ -43,6 +43,7 @@ options:
 
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -87,6 +88,12 @@ hcloud_load_balancer_network:
             type: str
             returned: always
             sample: 10.0.0.8
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -140,7 +147,7 @@ class AnsibleHCloudLoadBalancerNetwork(AnsibleHCloud):
         if not self.module.check_mode:
             try:
                 action = self.hcloud_load_balancer.attach_to_network(**params)
-                action.wait_until_finished()
+                self._wait_for_actions(action)
             except HCloudException as exception:
                 self.fail_json_hcloud(exception)
 
@@ -161,7 +168,7 @@ class AnsibleHCloudLoadBalancerNetwork(AnsibleHCloud):
             if not self.module.check_mode:
                 try:
                     action = self.hcloud_load_balancer.detach_from_network(self.hcloud_load_balancer_network.network)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                     self._mark_as_changed()
                 except HCloudException as exception:
                     self.fail_json_hcloud(exception)
@@ -180,6 +187,7 @@ class AnsibleHCloudLoadBalancerNetwork(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             supports_check_mode=True,
         )
@@ -135,6 +135,7 @@ options:
         type: str
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -276,6 +277,12 @@ hcloud_load_balancer_service:
                             returned: always
                             type: bool
                             sample: false
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -370,7 +377,7 @@ class AnsibleHCloudLoadBalancerService(AnsibleHCloud):
         if not self.module.check_mode:
             try:
                 action = self.hcloud_load_balancer.add_service(LoadBalancerService(**params))
-                action.wait_until_finished()
+                self._wait_for_actions(action)
             except HCloudException as exception:
                 self.fail_json_hcloud(exception)
         self._mark_as_changed()
@@ -461,7 +468,7 @@ class AnsibleHCloudLoadBalancerService(AnsibleHCloud):
 
             if not self.module.check_mode:
                 action = self.hcloud_load_balancer.update_service(LoadBalancerService(**params))
-                action.wait_until_finished()
+                self._wait_for_actions(action)
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
         self._get_load_balancer()
@@ -488,7 +495,7 @@ class AnsibleHCloudLoadBalancerService(AnsibleHCloud):
                 if not self.module.check_mode:
                     try:
                         action = self.hcloud_load_balancer.delete_service(self.hcloud_load_balancer_service)
-                        action.wait_until_finished()
+                        self._wait_for_actions(action)
                     except HCloudException as exception:
                         self.fail_json_hcloud(exception)
                 self._mark_as_changed()
@@ -546,6 +553,7 @@ class AnsibleHCloudLoadBalancerService(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             supports_check_mode=True,
         )
@@ -61,6 +61,8 @@ options:
 
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.resource_lock
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -131,6 +133,17 @@ hcloud_load_balancer_target:
             type: bool
             sample: true
             returned: always
+lock_wait_time:
+    description: Time in seconds spent waiting for the resource lock.
+    returned: when O(resource_lock=true)
+    type: float
+    sample: 1.234
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -225,7 +238,7 @@ class AnsibleHCloudLoadBalancerTarget(AnsibleHCloud):
         if not self.module.check_mode:
             try:
                 action = self.hcloud_load_balancer.add_target(**params)
-                action.wait_until_finished()
+                self._wait_for_actions(action)
             except APIException as exception:
                 if exception.code == "locked" or exception.code == "conflict":
                     self._create_load_balancer_target()
@@ -240,13 +253,28 @@ class AnsibleHCloudLoadBalancerTarget(AnsibleHCloud):
 
     def present_load_balancer_target(self):
         self._get_load_balancer_and_target()
-        self._get_load_balancer_target()
-        if self.hcloud_load_balancer_target is None:
-            self._create_load_balancer_target()
+        with self._resource_lock("load_balancers", self.hcloud_load_balancer.id) as locked:
+            if locked:
+                self._reload_load_balancer()
+            self._get_load_balancer_target()
+            if self.hcloud_load_balancer_target is None:
+                self._create_load_balancer_target()
 
     def delete_load_balancer_target(self):
         self._get_load_balancer_and_target()
-        self._get_load_balancer_target()
+        with self._resource_lock("load_balancers", self.hcloud_load_balancer.id) as locked:
+            if locked:
+                self._reload_load_balancer()
+            self._get_load_balancer_target()
+            self._delete_load_balancer_target()
+
+    def _reload_load_balancer(self):
+        try:
+            self.hcloud_load_balancer.reload()
+        except HCloudException as exception:
+            self.fail_json_hcloud(exception)
+
+    def _delete_load_balancer_target(self):
         if self.hcloud_load_balancer_target is not None and self.hcloud_load_balancer is not None:
             if not self.module.check_mode:
                 target = None
@@ -271,7 +299,7 @@ class AnsibleHCloudLoadBalancerTarget(AnsibleHCloud):
                     )
                 try:
                     action = self.hcloud_load_balancer.remove_target(target)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 except HCloudException as exception:
                     self.fail_json_hcloud(exception)
             self._mark_as_changed()
@@ -292,6 +320,8 @@ class AnsibleHCloudLoadBalancerTarget(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().resource_lock_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             supports_check_mode=True,
         )
@@ -87,8 +87,11 @@ hcloud_load_balancer_type_info:
             sample: 5
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.load_balancer_types import BoundLoadBalancerType
@@ -97,7 +100,7 @@ from ..module_utils.vendor.hcloud.load_balancer_types import BoundLoadBalancerTy
 class AnsibleHCloudLoadBalancerTypeInfo(AnsibleHCloud):
     represent = "hcloud_load_balancer_type_info"
 
-    hcloud_load_balancer_type_info: list[BoundLoadBalancerType] | None = None
+    hcloud_load_balancer_type_info: Iterable[BoundLoadBalancerType] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -130,7 +133,7 @@ class AnsibleHCloudLoadBalancerTypeInfo(AnsibleHCloud):
                     self.client.load_balancer_types.get_by_name(self.module.params.get("name"))
                 ]
             else:
-                self.hcloud_load_balancer_type_info = self.client.load_balancer_types.get_all()
+                self.hcloud_load_balancer_type_info = client_iter_all(self.client, "load_balancer_types")
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
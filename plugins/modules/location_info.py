@@ -77,8 +77,11 @@ hcloud_location_info:
             sample: Falkenstein
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.locations import BoundLocation
@@ -87,7 +90,7 @@ from ..module_utils.vendor.hcloud.locations import BoundLocation
 class AnsibleHCloudLocationInfo(AnsibleHCloud):
     represent = "hcloud_location_info"
 
-    hcloud_location_info: list[BoundLocation] | None = None
+    hcloud_location_info: Iterable[BoundLocation] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -114,7 +117,7 @@ class AnsibleHCloudLocationInfo(AnsibleHCloud):
             elif self.module.params.get("name") is not None:
                 self.hcloud_location_info = [self.client.locations.get_by_name(self.module.params.get("name"))]
             else:
-                self.hcloud_location_info = self.client.locations.get_all()
+                self.hcloud_location_info = client_iter_all(self.client, "locations")
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
@@ -58,6 +58,7 @@ options:
 
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -112,6 +113,12 @@ hcloud_network:
             sample:
                 key: value
                 mylabel: 123
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -165,7 +172,7 @@ class AnsibleHCloudNetwork(AnsibleHCloud):
                 if delete_protection is not None:
                     self._get_network()
                     action = self.hcloud_network.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
         self._mark_as_changed()
@@ -190,7 +197,7 @@ class AnsibleHCloudNetwork(AnsibleHCloud):
             if ip_range is not None and ip_range != self.hcloud_network.ip_range:
                 if not self.module.check_mode:
                     action = self.hcloud_network.change_ip_range(ip_range=ip_range)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 self._mark_as_changed()
 
             expose_routes_to_vswitch = self.module.params.get("expose_routes_to_vswitch")
@@ -206,7 +213,7 @@ class AnsibleHCloudNetwork(AnsibleHCloud):
             if delete_protection is not None and delete_protection != self.hcloud_network.protection["delete"]:
                 if not self.module.check_mode:
                     action = self.hcloud_network.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 self._mark_as_changed()
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
@@ -245,6 +252,7 @@ class AnsibleHCloudNetwork(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             required_one_of=[["id", "name"]],
             supports_check_mode=True,
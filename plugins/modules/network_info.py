@@ -184,69 +184,91 @@ hcloud_network_info:
             type: dict
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import (
+    ClientResourceIndex,
+    client_get_by_id,
+    client_get_by_name,
+    client_iter_all,
+)
 from ..module_utils.hcloud import AnsibleHCloud
+from ..module_utils.projection import project
 from ..module_utils.vendor.hcloud import HCloudException
-from ..module_utils.vendor.hcloud.networks import BoundNetwork
+
+SUBNET_FIELDS = {
+    "type": "type",
+    "ip_range": "ip_range",
+    "network_zone": "network_zone",
+    "gateway": "gateway",
+}
+ROUTE_FIELDS = {
+    "destination": "destination",
+    "gateway": "gateway",
+}
+SERVER_FIELDS = {
+    "name": "name",
+    "ipv4_address": "public_net.ipv4.ip",
+    "ipv6": "public_net.ipv6.ip",
+    "image": "image.name",
+    "server_type": "server_type.name",
+    "datacenter": "datacenter.name",
+    "location": "datacenter.location.name",
+    "rescue_enabled": "rescue_enabled",
+    "backup_window": "backup_window",
+    "labels": "labels",
+    "status": "status",
+}
+SERVER_INDEX_FIELDS = ["id", *SERVER_FIELDS.values()]
 
 
 class AnsibleHCloudNetworkInfo(AnsibleHCloud):
     represent = "hcloud_network_info"
 
-    hcloud_network_info: list[BoundNetwork] | None = None
+    hcloud_network_info: Iterable[dict] | None = None
 
     def _prepare_result(self):
         tmp = []
 
-        for network in self.hcloud_network_info:
-            if network is None:
-                continue
+        networks = [network for network in self.hcloud_network_info if network is not None]
 
+        # Fetch the servers attached to the networks at once, and join them by ID.
+        servers = ClientResourceIndex(self.client, "servers", fields=SERVER_INDEX_FIELDS)
+        servers.prefetch(server_id for network in networks for server_id in network["servers"])
+
+        for network in networks:
             subnets = []
-            for subnet in network.subnets:
-                prepared_subnet = {
-                    "type": subnet.type,
-                    "ip_range": subnet.ip_range,
-                    "network_zone": subnet.network_zone,
-                    "gateway": subnet.gateway,
-                }
+            for subnet in network["subnets"]:
+                prepared_subnet = project(subnet, SUBNET_FIELDS)
                 subnets.append(prepared_subnet)
 
             routes = []
-            for route in network.routes:
-                prepared_route = {"destination": route.destination, "gateway": route.gateway}
+            for route in network["routes"]:
+                prepared_route = project(route, ROUTE_FIELDS)
                 routes.append(prepared_route)
 
-            servers = []
-            for server in network.servers:
+            prepared_servers = []
+            for server_id in network["servers"]:
+                server = servers.get(server_id)
                 prepared_server = {
                     "id": str(server.id),
-                    "name": server.name,
-                    "ipv4_address": server.public_net.ipv4.ip if server.public_net.ipv4 is not None else None,
-                    "ipv6": server.public_net.ipv6.ip if server.public_net.ipv6 is not None else None,
-                    "image": server.image.name if server.image is not None else None,
-                    "server_type": server.server_type.name,
-                    "datacenter": server.datacenter.name,
-                    "location": server.datacenter.location.name,
-                    "rescue_enabled": server.rescue_enabled,
-                    "backup_window": server.backup_window,
-                    "labels": server.labels,
-                    "status": server.status,
+                    **project(server, SERVER_FIELDS),
                 }
-                servers.append(prepared_server)
+                prepared_servers.append(prepared_server)
 
             tmp.append(
                 {
-                    "id": str(network.id),
-                    "name": network.name,
-                    "ip_range": network.ip_range,
+                    "id": str(network["id"]),
+                    "name": network["name"],
+                    "ip_range": network["ip_range"],
                     "subnetworks": subnets,
                     "routes": routes,
-                    "expose_routes_to_vswitch": network.expose_routes_to_vswitch,
-                    "servers": servers,
-                    "labels": network.labels,
-                    "delete_protection": network.protection["delete"],
+                    "expose_routes_to_vswitch": network["expose_routes_to_vswitch"],
+                    "servers": prepared_servers,
+                    "labels": network["labels"],
+                    "delete_protection": network["protection"]["delete"],
                 }
             )
         return tmp
@@ -254,15 +276,22 @@ class AnsibleHCloudNetworkInfo(AnsibleHCloud):
     def get_networks(self):
         try:
             if self.module.params.get("id") is not None:
-                self.hcloud_network_info = [self.client.networks.get_by_id(self.module.params.get("id"))]
+                self.hcloud_network_info = [
+                    client_get_by_id(self.client, "networks", self.module.params.get("id"), raw=True)
+                ]
             elif self.module.params.get("name") is not None:
-                self.hcloud_network_info = [self.client.networks.get_by_name(self.module.params.get("name"))]
+                self.hcloud_network_info = [
+                    client_get_by_name(self.client, "networks", self.module.params.get("name"), raw=True)
+                ]
             elif self.module.params.get("label_selector") is not None:
-                self.hcloud_network_info = self.client.networks.get_all(
-                    label_selector=self.module.params.get("label_selector")
+                self.hcloud_network_info = client_iter_all(
+                    self.client,
+                    "networks",
+                    label_selector=self.module.params.get("label_selector"),
+                    raw=True,
                 )
             else:
-                self.hcloud_network_info = self.client.networks.get_all()
+                self.hcloud_network_info = client_iter_all(self.client, "networks", raw=True)
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
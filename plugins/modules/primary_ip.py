@@ -69,6 +69,7 @@ options:
 
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -165,6 +166,12 @@ hcloud_primary_ip:
             type: bool
             returned: always
             sample: false
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -226,13 +233,13 @@ class AnsibleHCloudPrimaryIP(AnsibleHCloud):
             if not self.module.check_mode:
                 resp = self.client.primary_ips.create(**params)
                 if resp.action is not None:
-                    resp.action.wait_until_finished()
+                    self._wait_for_actions(resp.action)
                 self.hcloud_primary_ip = resp.primary_ip
 
                 delete_protection = self.module.params.get("delete_protection")
                 if delete_protection is not None:
                     action = self.hcloud_primary_ip.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
         self._mark_as_changed()
@@ -259,7 +266,7 @@ class AnsibleHCloudPrimaryIP(AnsibleHCloud):
             if delete_protection is not None and delete_protection != self.hcloud_primary_ip.protection["delete"]:
                 if not self.module.check_mode:
                     action = self.hcloud_primary_ip.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 self._mark_as_changed()
 
             self._get_primary_ip()
@@ -301,6 +308,7 @@ class AnsibleHCloudPrimaryIP(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             required_one_of=[["id", "name"]],
             supports_check_mode=True,
@@ -124,8 +124,11 @@ hcloud_primary_ip_info:
             sample: false
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.primary_ips import BoundPrimaryIP
@@ -134,7 +137,7 @@ from ..module_utils.vendor.hcloud.primary_ips import BoundPrimaryIP
 class AnsibleHCloudPrimaryIPInfo(AnsibleHCloud):
     represent = "hcloud_primary_ip_info"
 
-    hcloud_primary_ip_info: list[BoundPrimaryIP] | None = None
+    hcloud_primary_ip_info: Iterable[BoundPrimaryIP] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -168,11 +171,11 @@ class AnsibleHCloudPrimaryIPInfo(AnsibleHCloud):
             elif self.module.params.get("name") is not None:
                 self.hcloud_primary_ip_info = [self.client.primary_ips.get_by_name(self.module.params.get("name"))]
             elif self.module.params.get("label_selector") is not None:
-                self.hcloud_primary_ip_info = self.client.primary_ips.get_all(
-                    label_selector=self.module.params.get("label_selector")
+                self.hcloud_primary_ip_info = client_iter_all(
+                    self.client, "primary_ips", label_selector=self.module.params.get("label_selector")
                 )
             else:
-                self.hcloud_primary_ip_info = self.client.primary_ips.get_all()
+                self.hcloud_primary_ip_info = client_iter_all(self.client, "primary_ips")
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
@@ -55,6 +55,7 @@ options:
 
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -130,6 +131,12 @@ hcloud_rdns:
             type: str
             returned: always
             sample: example.com
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 import ipaddress
@@ -277,7 +284,7 @@ class AnsibleHCloudReverseDNS(AnsibleHCloud):
         if not self.module.check_mode:
             try:
                 action = self.hcloud_resource.change_dns_ptr(**params)
-                action.wait_until_finished()
+                self._wait_for_actions(action)
             except HCloudException as exception:
                 self.fail_json_hcloud(exception)
         self._mark_as_changed()
@@ -295,7 +302,7 @@ class AnsibleHCloudReverseDNS(AnsibleHCloud):
             if not self.module.check_mode:
                 try:
                     action = self.hcloud_resource.change_dns_ptr(**params)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 except HCloudException as exception:
                     self.fail_json_hcloud(exception)
             self._mark_as_changed()
@@ -337,6 +344,7 @@ class AnsibleHCloudReverseDNS(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             required_one_of=[["server", "floating_ip", "load_balancer", "primary_ip"]],
             mutually_exclusive=[["server", "floating_ip", "load_balancer", "primary_ip"]],
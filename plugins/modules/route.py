@@ -44,6 +44,7 @@ options:
 
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -83,6 +84,12 @@ hcloud_route:
             type: str
             returned: always
             sample: 10.0.0.1
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -130,7 +137,7 @@ class AnsibleHCloudRoute(AnsibleHCloud):
         if not self.module.check_mode:
             try:
                 action = self.hcloud_network.add_route(route=route)
-                action.wait_until_finished()
+                self._wait_for_actions(action)
             except HCloudException as exception:
                 self.fail_json_hcloud(exception)
 
@@ -151,7 +158,7 @@ class AnsibleHCloudRoute(AnsibleHCloud):
             if not self.module.check_mode:
                 try:
                     action = self.hcloud_network.delete_route(self.hcloud_route)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 except HCloudException as exception:
                     self.fail_json_hcloud(exception)
             self._mark_as_changed()
@@ -169,6 +176,7 @@ class AnsibleHCloudRoute(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             supports_check_mode=True,
         )
@@ -154,6 +154,7 @@ options:
         type: str
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 
 """
 
@@ -333,627 +334,15 @@ hcloud_server:
             returned: always
             sample: false
             version_added: "0.1.0"
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
-from datetime import datetime, timedelta, timezone
-from typing import TYPE_CHECKING, Literal
-
-from ansible.module_utils.basic import AnsibleModule
-
-from ..module_utils.hcloud import AnsibleHCloud
-from ..module_utils.vendor.hcloud import HCloudException
-from ..module_utils.vendor.hcloud.firewalls import FirewallResource
-from ..module_utils.vendor.hcloud.servers import (
-    BoundServer,
-    Server,
-    ServerCreatePublicNetwork,
-)
-
-if TYPE_CHECKING:
-    from ..module_utils.vendor.hcloud.actions import BoundAction
-    from ..module_utils.vendor.hcloud.firewalls import BoundFirewall
-    from ..module_utils.vendor.hcloud.networks import BoundNetwork
-    from ..module_utils.vendor.hcloud.placement_groups import BoundPlacementGroup
-    from ..module_utils.vendor.hcloud.primary_ips import PrimaryIP
-    from ..module_utils.vendor.hcloud.server_types import ServerType
-
-
-class AnsibleHCloudServer(AnsibleHCloud):
-    represent = "hcloud_server"
-
-    hcloud_server: BoundServer | None = None
-
-    def _prepare_result(self):
-        return {
-            "id": str(self.hcloud_server.id),
-            "name": self.hcloud_server.name,
-            "created": self.hcloud_server.created.isoformat(),
-            "ipv4_address": (
-                self.hcloud_server.public_net.ipv4.ip if self.hcloud_server.public_net.ipv4 is not None else None
-            ),
-            "ipv6": self.hcloud_server.public_net.ipv6.ip if self.hcloud_server.public_net.ipv6 is not None else None,
-            "private_networks": [net.network.name for net in self.hcloud_server.private_net],
-            "private_networks_info": [
-                {"name": net.network.name, "ip": net.ip} for net in self.hcloud_server.private_net
-            ],
-            "image": self.hcloud_server.image.name if self.hcloud_server.image is not None else None,
-            "server_type": self.hcloud_server.server_type.name,
-            "datacenter": self.hcloud_server.datacenter.name,
-            "location": self.hcloud_server.datacenter.location.name,
-            "placement_group": (
-                self.hcloud_server.placement_group.name if self.hcloud_server.placement_group is not None else None
-            ),
-            "rescue_enabled": self.hcloud_server.rescue_enabled,
-            "backup_window": self.hcloud_server.backup_window,
-            "labels": self.hcloud_server.labels,
-            "delete_protection": self.hcloud_server.protection["delete"],
-            "rebuild_protection": self.hcloud_server.protection["rebuild"],
-            "status": self.hcloud_server.status,
-        }
-
-    def _get_server(self):
-        try:
-            if self.module.params.get("id") is not None:
-                self.hcloud_server = self.client.servers.get_by_id(self.module.params.get("id"))
-            else:
-                self.hcloud_server = self.client.servers.get_by_name(self.module.params.get("name"))
-        except HCloudException as exception:
-            self.fail_json_hcloud(exception)
-
-    def _create_server(self):
-        self.module.fail_on_missing_params(required_params=["name", "server_type", "image"])
-
-        server_type = self._get_server_type()
-        image = self._get_image(server_type)
-
-        params = {
-            "name": self.module.params.get("name"),
-            "labels": self.module.params.get("labels"),
-            "server_type": server_type,
-            "image": image,
-            "user_data": self.module.params.get("user_data"),
-            "public_net": ServerCreatePublicNetwork(
-                enable_ipv4=self.module.params.get("enable_ipv4"),
-                enable_ipv6=self.module.params.get("enable_ipv6"),
-            ),
-        }
-
-        if self.module.params.get("placement_group") is not None:
-            params["placement_group"] = self._client_get_by_name_or_id(
-                "placement_groups", self.module.params.get("placement_group")
-            )
-
-        if self.module.params.get("ipv4") is not None:
-            params["public_net"].ipv4 = self._client_get_by_name_or_id("primary_ips", self.module.params.get("ipv4"))
-
-        if self.module.params.get("ipv6") is not None:
-            params["public_net"].ipv6 = self._client_get_by_name_or_id("primary_ips", self.module.params.get("ipv6"))
-
-        if self.module.params.get("private_networks") is not None:
-            params["networks"] = [
-                self._client_get_by_name_or_id("networks", name_or_id)
-                for name_or_id in self.module.params.get("private_networks")
-            ]
-
-        if self.module.params.get("ssh_keys") is not None:
-            params["ssh_keys"] = [
-                self._client_get_by_name_or_id("ssh_keys", name_or_id)
-                for name_or_id in self.module.params.get("ssh_keys")
-            ]
-
-        if self.module.params.get("volumes") is not None:
-            params["volumes"] = [
-                self._client_get_by_name_or_id("volumes", name_or_id)
-                for name_or_id in self.module.params.get("volumes")
-            ]
-
-        if self.module.params.get("firewalls") is not None:
-            params["firewalls"] = [
-                self._client_get_by_name_or_id("firewalls", name_or_id)
-                for name_or_id in self.module.params.get("firewalls")
-            ]
-
-        if self.module.params.get("location") is None and self.module.params.get("datacenter") is None:
-            # When not given, the API will choose the location.
-            params["location"] = None
-            params["datacenter"] = None
-        elif self.module.params.get("location") is not None and self.module.params.get("datacenter") is None:
-            params["location"] = self._client_get_by_name_or_id("locations", self.module.params.get("location"))
-        elif self.module.params.get("location") is None and self.module.params.get("datacenter") is not None:
-            params["datacenter"] = self._client_get_by_name_or_id("datacenters", self.module.params.get("datacenter"))
-
-        if self.module.params.get("state") == "stopped":
-            params["start_after_create"] = False
-
-        if not self.module.check_mode:
-            try:
-                resp = self.client.servers.create(**params)
-                self.result["root_password"] = resp.root_password
-                # Action should take 60 to 90 seconds on average, but can be >10m when creating a
-                # server from a custom images
-                resp.action.wait_until_finished(max_retries=362)  # 362 retries >= 1802 seconds
-                for action in resp.next_actions:
-                    # Starting the server or attaching to the network might take a few minutes,
-                    # depending on the current activity in the project.
-                    # This waits up to 30minutes for each action in series, but in the background
-                    # the actions are mostly running in parallel, so after the first one the other
-                    # actions are usually completed already.
-                    action.wait_until_finished(max_retries=362)  # 362 retries >= 1802 seconds
-
-                rescue_mode = self.module.params.get("rescue_mode")
-                if rescue_mode:
-                    self._get_server()
-                    self._set_rescue_mode(rescue_mode)
-
-                backups = self.module.params.get("backups")
-                if backups:
-                    self._get_server()
-                    action = self.hcloud_server.enable_backup()
-                    action.wait_until_finished()
-
-                delete_protection = self.module.params.get("delete_protection")
-                rebuild_protection = self.module.params.get("rebuild_protection")
-                if delete_protection is not None and rebuild_protection is not None:
-                    self._get_server()
-                    action = self.hcloud_server.change_protection(
-                        delete=delete_protection,
-                        rebuild=rebuild_protection,
-                    )
-                    action.wait_until_finished()
-            except HCloudException as exception:
-                self.fail_json_hcloud(exception)
-        self._mark_as_changed()
-        self._get_server()
-
-    def _get_image(self, server_type: ServerType):
-        image = self.client.images.get_by_name_and_architecture(
-            name=self.module.params.get("image"),
-            architecture=server_type.architecture,
-            include_deprecated=True,
-        )
-        if image is None:
-            image = self.client.images.get_by_id(self.module.params.get("image"))
-
-        if image.deprecated is not None:
-            available_until = image.deprecated + timedelta(days=90)
-            if self.module.params.get("image_allow_deprecated"):
-                self.module.warn(
-                    f"You try to use a deprecated image. The image {image.name} will "
-                    f"continue to be available until {available_until.strftime('%Y-%m-%d')}."
-                )
-            else:
-                self.module.fail_json(
-                    msg=(
-                        f"You try to use a deprecated image. The image {image.name} will "
-                        f"continue to be available until {available_until.strftime('%Y-%m-%d')}. "
-                        "If you want to use this image use image_allow_deprecated=true."
-                    )
-                )
-        return image
-
-    def _get_server_type(self) -> ServerType:
-        server_type = self._client_get_by_name_or_id("server_types", self.module.params.get("server_type"))
-
-        self._check_and_warn_deprecated_server(server_type)
-        return server_type
-
-    def _check_and_warn_deprecated_server(self, server_type: ServerType) -> None:
-        if server_type.deprecation is None:
-            return
-
-        if server_type.deprecation.unavailable_after < datetime.now(timezone.utc):
-            self.module.warn(
-                f"Attention: The server plan {server_type.name} is deprecated and can "
-                "no longer be ordered. Existing servers of that plan will continue to "
-                "work as before and no action is required on your part. "
-                "It is possible to migrate this server to another server plan by setting "
-                "the server_type parameter on the hetzner.hcloud.server module."
-            )
-        else:
-            server_type_unavailable_date = server_type.deprecation.unavailable_after.strftime("%Y-%m-%d")
-            self.module.warn(
-                f"Attention: The server plan {server_type.name} is deprecated and will "
-                f"no longer be available for order as of {server_type_unavailable_date}. "
-                "Existing servers of that plan will continue to work as before and no "
-                "action is required on your part. "
-                "It is possible to migrate this server to another server plan by setting "
-                "the server_type parameter on the hetzner.hcloud.server module."
-            )
-
-    def _update_server(self) -> None:
-        try:
-            previous_server_status = self.hcloud_server.status
-
-            labels = self.module.params.get("labels")
-            if labels is not None and labels != self.hcloud_server.labels:
-                if not self.module.check_mode:
-                    self.hcloud_server.update(labels=labels)
-                self._mark_as_changed()
-
-            rescue_mode = self.module.params.get("rescue_mode")
-            if rescue_mode and self.hcloud_server.rescue_enabled is False:
-                if not self.module.check_mode:
-                    self._set_rescue_mode(rescue_mode)
-                self._mark_as_changed()
-            elif not rescue_mode and self.hcloud_server.rescue_enabled is True:
-                if not self.module.check_mode:
-                    action = self.hcloud_server.disable_rescue()
-                    action.wait_until_finished()
-                self._mark_as_changed()
-
-            backups = self.module.params.get("backups")
-            if backups and self.hcloud_server.backup_window is None:
-                if not self.module.check_mode:
-                    action = self.hcloud_server.enable_backup()
-                    action.wait_until_finished()
-                self._mark_as_changed()
-            elif backups is not None and not backups and self.hcloud_server.backup_window is not None:
-                if not self.module.check_mode:
-                    action = self.hcloud_server.disable_backup()
-                    action.wait_until_finished()
-                self._mark_as_changed()
-
-            if self.module.params.get("firewalls") is not None:
-                self._update_server_firewalls()
-
-            if self.module.params.get("placement_group") is not None:
-                self._update_server_placement_group()
-
-            if self.module.params.get("ipv4") is not None:
-                self._update_server_ip("ipv4")
-
-            if self.module.params.get("ipv6") is not None:
-                self._update_server_ip("ipv6")
-
-            if self.module.params.get("private_networks") is not None:
-                self._update_server_networks()
-
-            if self.module.params.get("server_type") is not None:
-                self._update_server_server_type()
-
-            if not self.module.check_mode and (
-                (self.module.params.get("state") == "present" and previous_server_status == Server.STATUS_RUNNING)
-                or self.module.params.get("state") == "started"
-            ):
-                self.start_server()
-
-            delete_protection = self.module.params.get("delete_protection")
-            rebuild_protection = self.module.params.get("rebuild_protection")
-            if (delete_protection is not None and rebuild_protection is not None) and (
-                delete_protection != self.hcloud_server.protection["delete"]
-                or rebuild_protection != self.hcloud_server.protection["rebuild"]
-            ):
-                if not self.module.check_mode:
-                    action = self.hcloud_server.change_protection(
-                        delete=delete_protection,
-                        rebuild=rebuild_protection,
-                    )
-                    action.wait_until_finished()
-                self._mark_as_changed()
-            self._get_server()
-        except HCloudException as exception:
-            self.fail_json_hcloud(exception)
-
-    def _update_server_placement_group(self) -> None:
-        current: BoundPlacementGroup | None = self.hcloud_server.placement_group
-        wanted = self.module.params.get("placement_group")
-
-        # Return if nothing changed
-        if current is not None and current.has_id_or_name(wanted):
-            return
-
-        # Fetch resource if parameter is truthy
-        if wanted:
-            placement_group = self._client_get_by_name_or_id("placement_groups", wanted)
-
-        # Remove if current is defined
-        if current is not None:
-            if not self.module.check_mode:
-                action = self.hcloud_server.remove_from_placement_group()
-                action.wait_until_finished()
-            self._mark_as_changed()
-
-        # Return if parameter is falsy
-        if not wanted:
-            return
-
-        # Assign new
-        self.stop_server_if_forced()
-        if not self.module.check_mode:
-            action = self.hcloud_server.add_to_placement_group(placement_group)
-            action.wait_until_finished()
-        self._mark_as_changed()
-
-    def _update_server_server_type(self) -> None:
-        current: ServerType = self.hcloud_server.server_type
-        wanted = self.module.params.get("server_type")
-
-        # Return if nothing changed
-        if current.has_id_or_name(wanted):
-            # Check if we should warn for using an deprecated server type
-            self._check_and_warn_deprecated_server(self.hcloud_server.server_type)
-            return
-
-        self.stop_server_if_forced()
-
-        if not self.module.check_mode:
-            upgrade_disk = self.module.params.get("upgrade_disk")
-
-            action = self.hcloud_server.change_type(
-                server_type=self._get_server_type(),
-                upgrade_disk=upgrade_disk,
-            )
-            # Upgrading a server takes 160 seconds on average, upgrading the disk should
-            # take more time
-            # 122 retries >= 602 seconds
-            # 38 retries >= 182 seconds
-            action.wait_until_finished(max_retries=122 if upgrade_disk else 38)
-        self._mark_as_changed()
-
-    def _update_server_ip(self, kind: Literal["ipv4", "ipv6"]) -> None:
-        current: PrimaryIP | None = getattr(self.hcloud_server.public_net, f"primary_{kind}")
-        wanted = self.module.params.get(kind)
-        enable = self.module.params.get(f"enable_{kind}")
-
-        # Return if nothing changed
-        if current is not None and current.has_id_or_name(wanted) and enable:
-            return
-
-        # Fetch resource if parameter is truthy
-        if wanted:
-            primary_ip = self._client_get_by_name_or_id("primary_ips", wanted)
-
-        # Remove if current is defined
-        if current is not None:
-            self.stop_server_if_forced()
-            if not self.module.check_mode:
-                action = self.client.primary_ips.unassign(current)
-                action.wait_until_finished()
-            self._mark_as_changed()
-
-        # Return if parameter is falsy or resource is disabled
-        if not wanted or not enable:
-            return
-
-        # Assign new
-        self.stop_server_if_forced()
-        if not self.module.check_mode:
-            action = self.client.primary_ips.assign(
-                primary_ip,
-                assignee_id=self.hcloud_server.id,
-                assignee_type="server",
-            )
-            action.wait_until_finished()
-        self._mark_as_changed()
-
-    def _update_server_networks(self) -> None:
-        current: list[BoundNetwork] = [item.network for item in self.hcloud_server.private_net]
-        wanted: list[BoundNetwork] = [
-            self._client_get_by_name_or_id("networks", name_or_id)
-            for name_or_id in self.module.params.get("private_networks")
-        ]
-
-        current_ids = {item.id for item in current}
-        wanted_ids = {item.id for item in wanted}
-
-        # Removing existing but not wanted networks
-        actions: list[BoundAction] = []
-        for current_network in current:
-            if current_network.id in wanted_ids:
-                continue
-
-            self._mark_as_changed()
-            if self.module.check_mode:
-                continue
-
-            actions.append(self.hcloud_server.detach_from_network(current_network))
-
-        for action in actions:
-            action.wait_until_finished()
-
-        # Adding wanted networks that doesn't exist yet
-        actions: list[BoundAction] = []
-        for wanted_network in wanted:
-            if wanted_network.id in current_ids:
-                continue
-
-            self._mark_as_changed()
-            if self.module.check_mode:
-                continue
-
-            actions.append(self.hcloud_server.attach_to_network(wanted_network))
-
-        for action in actions:
-            action.wait_until_finished()
-
-    def _update_server_firewalls(self) -> None:
-        current: list[BoundFirewall] = [item.firewall for item in self.hcloud_server.public_net.firewalls]
-        wanted: list[BoundFirewall] = [
-            self._client_get_by_name_or_id("firewalls", name_or_id)
-            for name_or_id in self.module.params.get("firewalls")
-        ]
-
-        current_ids = {item.id for item in current}
-        wanted_ids = {item.id for item in wanted}
-
-        # Removing existing but not wanted firewalls
-        actions: list[BoundAction] = []
-        for current_firewall in current:
-            if current_firewall.id in wanted_ids:
-                continue
-
-            self._mark_as_changed()
-            if self.module.check_mode:
-                continue
-
-            actions.extend(
-                self.client.firewalls.remove_from_resources(
-                    current_firewall,
-                    [FirewallResource(type="server", server=self.hcloud_server)],
-                )
-            )
-
-        for action in actions:
-            action.wait_until_finished()
-
-        # Adding wanted firewalls that doesn't exist yet
-        actions: list[BoundAction] = []
-        for wanted_firewall in wanted:
-            if wanted_firewall.id in current_ids:
-                continue
-
-            self._mark_as_changed()
-            if self.module.check_mode:
-                continue
-
-            actions.extend(
-                self.client.firewalls.apply_to_resources(
-                    wanted_firewall,
-                    [FirewallResource(type="server", server=self.hcloud_server)],
-                )
-            )
-
-        for action in actions:
-            action.wait_until_finished()
-
-    def _set_rescue_mode(self, rescue_mode):
-        if self.module.params.get("ssh_keys"):
-            resp = self.hcloud_server.enable_rescue(
-                type=rescue_mode,
-                ssh_keys=[
-                    self.client.ssh_keys.get_by_name(ssh_key_name).id
-                    for ssh_key_name in self.module.params.get("ssh_keys")
-                ],
-            )
-        else:
-            resp = self.hcloud_server.enable_rescue(type=rescue_mode)
-        resp.action.wait_until_finished()
-        self.result["root_password"] = resp.root_password
-
-    def start_server(self):
-        try:
-            if self.hcloud_server:
-                if self.hcloud_server.status != Server.STATUS_RUNNING:
-                    if not self.module.check_mode:
-                        action = self.client.servers.power_on(self.hcloud_server)
-                        action.wait_until_finished()
-                    self._mark_as_changed()
-                self._get_server()
-        except HCloudException as exception:
-            self.fail_json_hcloud(exception)
-
-    def stop_server(self):
-        try:
-            if self.hcloud_server:
-                if self.hcloud_server.status != Server.STATUS_OFF:
-                    if not self.module.check_mode:
-                        action = self.client.servers.power_off(self.hcloud_server)
-                        action.wait_until_finished()
-                    self._mark_as_changed()
-                self._get_server()
-        except HCloudException as exception:
-            self.fail_json_hcloud(exception)
-
-    def stop_server_if_forced(self):
-        previous_server_status = self.hcloud_server.status
-        if previous_server_status == Server.STATUS_RUNNING and not self.module.check_mode:
-            if self.module.params.get("force") or self.module.params.get("state") == "stopped":
-                self.stop_server()  # Only stopped server can be upgraded
-                return previous_server_status
-
-            self.module.warn(
-                f"You can not upgrade a running instance {self.hcloud_server.name}. "
-                "You need to stop the instance or use force=true."
-            )
-
-        return None
-
-    def rebuild_server(self):
-        self._get_server()
-        if self.hcloud_server is None:
-            self._create_server()
-        else:
-            self._update_server()
-
-            # Only rebuild the server if it already existed.
-            self.module.fail_on_missing_params(required_params=["image"])
-            try:
-                if not self.module.check_mode:
-                    image = self._get_image(self.hcloud_server.server_type)
-                    resp = self.client.servers.rebuild(self.hcloud_server, image)
-                    # When we rebuild the server progress takes some more time.
-                    resp.action.wait_until_finished(max_retries=202)  # 202 retries >= 1002 seconds
-                self._mark_as_changed()
-
-                self._get_server()
-            except HCloudException as exception:
-                self.fail_json_hcloud(exception)
-
-    def present_server(self):
-        self._get_server()
-        if self.hcloud_server is None:
-            self._create_server()
-        else:
-            self._update_server()
-
-    def delete_server(self):
-        try:
-            self._get_server()
-            if self.hcloud_server is not None:
-                if not self.module.check_mode:
-                    action = self.client.servers.delete(self.hcloud_server)
-                    action.wait_until_finished()
-                self._mark_as_changed()
-            self.hcloud_server = None
-        except HCloudException as exception:
-            self.fail_json_hcloud(exception)
-
-    @classmethod
-    def define_module(cls):
-        return AnsibleModule(
-            argument_spec=dict(
-                id={"type": "int"},
-                name={"type": "str"},
-                image={"type": "str"},
-                image_allow_deprecated={"type": "bool", "default": False, "aliases": ["allow_deprecated_image"]},
-                server_type={"type": "str"},
-                location={"type": "str"},
-                datacenter={"type": "str"},
-                user_data={"type": "str"},
-                ssh_keys={"type": "list", "elements": "str", "no_log": False},
-                volumes={"type": "list", "elements": "str"},
-                firewalls={"type": "list", "elements": "str"},
-                labels={"type": "dict"},
-                backups={"type": "bool"},
-                upgrade_disk={"type": "bool", "default": False},
-                enable_ipv4={"type": "bool", "default": True},
-                enable_ipv6={"type": "bool", "default": True},
-                ipv4={"type": "str"},
-                ipv6={"type": "str"},
-                private_networks={"type": "list", "elements": "str", "default": None},
-                force={
-                    "type": "bool",
-                    "default": False,
-                    "aliases": ["force_upgrade"],
-                    "deprecated_aliases": [
-                        {"collection_name": "hetzner.hcloud", "name": "force_upgrade", "version": "5.0.0"}
-                    ],
-                },
-                rescue_mode={"type": "str"},
-                delete_protection={"type": "bool"},
-                rebuild_protection={"type": "bool"},
-                placement_group={"type": "str"},
-                state={
-                    "choices": ["absent", "present", "restarted", "started", "stopped", "rebuild"],
-                    "default": "present",
-                },
-                **super().base_module_arguments(),
-            ),
-            required_one_of=[["id", "name"]],
-            mutually_exclusive=[["location", "datacenter"]],
-            required_together=[["delete_protection", "rebuild_protection"]],
-            supports_check_mode=True,
-        )
+from ..module_utils.server import AnsibleHCloudServer
 
 
 def main():
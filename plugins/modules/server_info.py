@@ -145,45 +145,63 @@ hcloud_server_info:
             version_added: "0.1.0"
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import (
+    ClientResourceIndex,
+    client_get_by_id,
+    client_get_by_name,
+    client_iter_all,
+)
 from ..module_utils.hcloud import AnsibleHCloud
+from ..module_utils.projection import Record, isoformat, project
 from ..module_utils.vendor.hcloud import HCloudException
-from ..module_utils.vendor.hcloud.servers import BoundServer
+
+SERVER_FIELDS = {
+    "name": "name",
+    "ipv4_address": "public_net.ipv4.ip",
+    "ipv6": "public_net.ipv6.ip",
+    "image": "image.name",
+    "server_type": "server_type.name",
+    "datacenter": "datacenter.name",
+    "location": "datacenter.location.name",
+    "placement_group": "placement_group.name",
+    "rescue_enabled": "rescue_enabled",
+    "backup_window": "backup_window",
+    "labels": "labels",
+    "status": "status",
+    "delete_protection": "protection.delete",
+    "rebuild_protection": "protection.rebuild",
+}
+FIELDS = ["id", "created", "private_net", *SERVER_FIELDS.values()]
 
 
 class AnsibleHCloudServerInfo(AnsibleHCloud):
     represent = "hcloud_server_info"
 
-    hcloud_server_info: list[BoundServer] | None = None
+    hcloud_server_info: Iterable[Record] | None = None
 
     def _prepare_result(self):
         tmp = []
 
+        networks = ClientResourceIndex(self.client, "networks", fields=["id", "name"])
         for server in self.hcloud_server_info:
             if server is None:
                 continue
 
+            private_networks_info = [
+                {"name": networks.get(net["network"]).name, "ip": net["ip"]} for net in server.private_net
+            ]
+
             tmp.append(
                 {
                     "id": str(server.id),
-                    "name": server.name,
-                    "created": server.created.isoformat(),
-                    "ipv4_address": server.public_net.ipv4.ip if server.public_net.ipv4 is not None else None,
-                    "ipv6": server.public_net.ipv6.ip if server.public_net.ipv6 is not None else None,
-                    "private_networks": [net.network.name for net in server.private_net],
-                    "private_networks_info": [{"name": net.network.name, "ip": net.ip} for net in server.private_net],
-                    "image": server.image.name if server.image is not None else None,
-                    "server_type": server.server_type.name,
-                    "datacenter": server.datacenter.name,
-                    "location": server.datacenter.location.name,
-                    "placement_group": server.placement_group.name if server.placement_group is not None else None,
-                    "rescue_enabled": server.rescue_enabled,
-                    "backup_window": server.backup_window,
-                    "labels": server.labels,
-                    "status": server.status,
-                    "delete_protection": server.protection["delete"],
-                    "rebuild_protection": server.protection["rebuild"],
+                    "created": isoformat(server.created),
+                    **project(server, SERVER_FIELDS),
+                    "private_networks": [net["name"] for net in private_networks_info],
+                    "private_networks_info": private_networks_info,
                 }
             )
         return tmp
@@ -191,15 +209,22 @@ class AnsibleHCloudServerInfo(AnsibleHCloud):
     def get_servers(self):
         try:
             if self.module.params.get("id") is not None:
-                self.hcloud_server_info = [self.client.servers.get_by_id(self.module.params.get("id"))]
+                self.hcloud_server_info = [
+                    client_get_by_id(self.client, "servers", self.module.params.get("id"), fields=FIELDS)
+                ]
             elif self.module.params.get("name") is not None:
-                self.hcloud_server_info = [self.client.servers.get_by_name(self.module.params.get("name"))]
+                self.hcloud_server_info = [
+                    client_get_by_name(self.client, "servers", self.module.params.get("name"), fields=FIELDS)
+                ]
             elif self.module.params.get("label_selector") is not None:
-                self.hcloud_server_info = self.client.servers.get_all(
-                    label_selector=self.module.params.get("label_selector")
+                self.hcloud_server_info = client_iter_all(
+                    self.client,
+                    "servers",
+                    label_selector=self.module.params.get("label_selector"),
+                    fields=FIELDS,
                 )
             else:
-                self.hcloud_server_info = self.client.servers.get_all()
+                self.hcloud_server_info = client_iter_all(self.client, "servers", fields=FIELDS)
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
@@ -48,6 +48,8 @@ options:
 
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.resource_lock
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -108,6 +110,17 @@ hcloud_server_network:
             elements: str
             returned: always
             sample: [10.1.0.1, ...]
+lock_wait_time:
+    description: Time in seconds spent waiting for the resource lock.
+    returned: when O(resource_lock=true)
+    type: float
+    sample: 1.234
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -165,7 +178,7 @@ class AnsibleHCloudServerNetwork(AnsibleHCloud):
         if not self.module.check_mode:
             try:
                 action = self.hcloud_server.attach_to_network(**params)
-                action.wait_until_finished()
+                self._wait_for_actions(action)
             except HCloudException as exception:
                 self.fail_json_hcloud(exception)
 
@@ -184,7 +197,7 @@ class AnsibleHCloudServerNetwork(AnsibleHCloud):
             if not self.module.check_mode:
                 try:
                     action = self.hcloud_server.change_alias_ips(**params)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 except APIException as exception:
                     self.fail_json_hcloud(exception)
 
@@ -194,20 +207,29 @@ class AnsibleHCloudServerNetwork(AnsibleHCloud):
 
     def present_server_network(self):
         self._get_server_and_network()
-        self._get_server_network()
-        if self.hcloud_server_network is None:
-            self._create_server_network()
-        else:
-            self._update_server_network()
+        with self._resource_lock("networks", self.hcloud_network.id) as locked:
+            if locked:
+                self._get_server_and_network()
+            self._get_server_network()
+            if self.hcloud_server_network is None:
+                self._create_server_network()
+            else:
+                self._update_server_network()
 
     def delete_server_network(self):
         self._get_server_and_network()
-        self._get_server_network()
+        with self._resource_lock("networks", self.hcloud_network.id) as locked:
+            if locked:
+                self._get_server_and_network()
+            self._get_server_network()
+            self._delete_server_network()
+
+    def _delete_server_network(self):
         if self.hcloud_server_network is not None and self.hcloud_server is not None:
             if not self.module.check_mode:
                 try:
                     action = self.hcloud_server.detach_from_network(self.hcloud_server_network.network)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 except HCloudException as exception:
                     self.fail_json_hcloud(exception)
             self._mark_as_changed()
@@ -226,6 +248,8 @@ class AnsibleHCloudServerNetwork(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().resource_lock_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             supports_check_mode=True,
         )
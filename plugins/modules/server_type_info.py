@@ -127,8 +127,11 @@ hcloud_server_type_info:
 
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.server_types import BoundServerType
@@ -137,7 +140,7 @@ from ..module_utils.vendor.hcloud.server_types import BoundServerType
 class AnsibleHCloudServerTypeInfo(AnsibleHCloud):
     represent = "hcloud_server_type_info"
 
-    hcloud_server_type_info: list[BoundServerType] | None = None
+    hcloud_server_type_info: Iterable[BoundServerType] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -177,7 +180,7 @@ class AnsibleHCloudServerTypeInfo(AnsibleHCloud):
             elif self.module.params.get("name") is not None:
                 self.hcloud_server_type_info = [self.client.server_types.get_by_name(self.module.params.get("name"))]
             else:
-                self.hcloud_server_type_info = self.client.server_types.get_all()
+                self.hcloud_server_type_info = client_iter_all(self.client, "server_types")
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
@@ -0,0 +1,565 @@
+#!/usr/bin/python
+
+# Copyright: (c) 2026, Hetzner Cloud GmbH <info@hetzner-cloud.de>
+# GNU General Public License v3.0+ (see COPYING or https://www.gnu.org/licenses/gpl-3.0.txt)
+
+
+from __future__ import annotations
+
+DOCUMENTATION = """
+---
+module: servers
+short_description: Create and manage many cloud servers on the Hetzner Cloud at once.
+
+description:
+    - Create, update and delete many cloud servers on the Hetzner Cloud in a single task.
+    - The resources shared by the servers (server types, images, SSH keys, networks, ...) are only resolved once,
+      the servers are created and deleted concurrently, and the actions are waited for together.
+    - Existing servers are updated one after the other, like using M(hetzner.hcloud.server).
+    - If creating or deleting some servers fails, the other servers are still created and set up, and the module
+      fails with the result of all the servers, including the root passwords of the created servers.
+
+author:
+    - Jonas Lammler (@jooola)
+
+version_added: 4.3.0
+options:
+    servers:
+        description:
+            - List of the servers to manage.
+        type: list
+        elements: dict
+        required: true
+        suboptions:
+            name:
+                description:
+                    - Name of the Hetzner Cloud Server to manage.
+                type: str
+                required: true
+            server_type:
+                description:
+                    - Hetzner Cloud Server Type (name or ID) of the server.
+                    - Required if server does not exist.
+                type: str
+            image:
+                description:
+                    - Hetzner Cloud Image (name or ID) to create the server from.
+                    - Required if server does not exist.
+                type: str
+            image_allow_deprecated:
+                description:
+                    - Allows the creation of servers with deprecated images.
+                type: bool
+                default: false
+            location:
+                description:
+                    - Hetzner Cloud Location (name or ID) to create the server in.
+                    - Only used during the server creation.
+                type: str
+            datacenter:
+                description:
+                    - Hetzner Cloud Datacenter (name or ID) to create the server in.
+                    - Only used during the server creation.
+                type: str
+            ssh_keys:
+                description:
+                    - List of Hetzner Cloud SSH Keys (name or ID) to create the server with.
+                    - Only used during the server creation.
+                type: list
+                elements: str
+            volumes:
+                description:
+                    - List of Hetzner Cloud Volumes (name or ID) that should be attached to the server.
+                    - Only used during the server creation.
+                type: list
+                elements: str
+            firewalls:
+                description:
+                    - List of Hetzner Cloud Firewalls (name or ID) that should be attached to the server.
+                type: list
+                elements: str
+            private_networks:
+                description:
+                    - List of Hetzner Cloud Networks (name or ID) the server should be attached to.
+                    - If None, private networks are left as they are, if it has any other value (including []),
+                      only those networks are attached to the server.
+                type: list
+                elements: str
+            placement_group:
+                description:
+                    - Hetzner Cloud Placement Group (name or ID) to create the server in.
+                type: str
+            enable_ipv4:
+                description:
+                    - Enables the public ipv4 address.
+                type: bool
+                default: true
+            enable_ipv6:
+                description:
+                    - Enables the public ipv6 address.
+                type: bool
+                default: true
+            user_data:
+                description:
+                    - User Data to be passed to the server on creation.
+                    - Only used during the server creation.
+                type: str
+            backups:
+                description:
+                    - Enable or disable Backups for the given Server.
+                type: bool
+            labels:
+                description:
+                    - User-defined labels (key-value pairs).
+                type: dict
+            delete_protection:
+                description:
+                    - Protect the Server for deletion.
+                    - Needs to be the same as O(servers[].rebuild_protection).
+                type: bool
+            rebuild_protection:
+                description:
+                    - Protect the Server for rebuild.
+                    - Needs to be the same as O(servers[].delete_protection).
+                type: bool
+            state:
+                description:
+                    - State of the server.
+                default: present
+                choices: [absent, present, started, stopped]
+                type: str
+    max_concurrency:
+        description:
+            - Maximum number of servers created or deleted concurrently.
+            - The concurrency is also limited by the remaining requests of the API rate limit.
+        default: 10
+        type: int
+
+extends_documentation_fragment:
+    - hetzner.hcloud.hcloud
+    - hetzner.hcloud.hcloud.wait
+"""
+
+EXAMPLES = """
+- name: Create many servers
+  hetzner.hcloud.servers:
+    servers:
+      - name: my-server-1
+        server_type: cpx22
+        image: debian-12
+        ssh_keys: [me@myorganisation]
+      - name: my-server-2
+        server_type: cpx22
+        image: debian-12
+        ssh_keys: [me@myorganisation]
+        private_networks: [my-network]
+
+- name: Ensure the servers are stopped
+  hetzner.hcloud.servers:
+    servers:
+      - name: my-server-1
+        state: stopped
+      - name: my-server-2
+        state: stopped
+
+- name: Ensure the servers are absent (remove if needed)
+  hetzner.hcloud.servers:
+    servers:
+      - name: my-server-1
+        state: absent
+      - name: my-server-2
+        state: absent
+"""
+
+RETURN = """
+hcloud_servers:
+    description: The managed servers, in the order of O(servers).
+    returned: always
+    type: list
+    elements: dict
+    contains:
+        name:
+            description: Name of the server
+            returned: always
+            type: str
+            sample: my-server
+        changed:
+            description: Whether the server was changed
+            returned: always
+            type: bool
+            sample: true
+        root_password:
+            description: Root password of the server, if no SSH keys were given when creating it
+            returned: when the server was created
+            type: str
+        msg:
+            description: Error message, when creating or deleting the server failed
+            returned: when creating or deleting the server failed
+            type: str
+        hcloud_server:
+            description:
+                - The server instance, as returned by M(hetzner.hcloud.server).
+                - None if the server is absent, or not created yet in check mode.
+            returned: always
+            type: dict
+            sample:
+                id: "1937415"
+                name: my-server
+                status: running
+                server_type: cpx22
+                ipv4_address: 116.203.104.109
+                ipv6: 2a01:4f8:1c1c:c140::/64
+                private_networks: [my-network]
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
+"""
+
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
+from typing import TYPE_CHECKING, Any, Callable, NoReturn
+
+from ansible.module_utils.basic import AnsibleModule
+from ansible.module_utils.common.text.converters import to_native
+from ansible.module_utils.common.validation import check_missing_parameters
+
+from ..module_utils.client import ClientResourceIndex, client_find_many
+from ..module_utils.hcloud import AnsibleHCloud
+from ..module_utils.server import AnsibleHCloudServer
+from ..module_utils.vendor.hcloud import HCloudException
+
+if TYPE_CHECKING:
+    from ..module_utils.vendor.hcloud.actions import BoundAction
+    from ..module_utils.vendor.hcloud.server_types import ServerType
+
+# Module params of the servers resolving to shared resources, by resource
+SERVER_DEPENDENCIES = {
+    "server_types": "server_type",
+    "locations": "location",
+    "datacenters": "datacenter",
+    "placement_groups": "placement_group",
+    "ssh_keys": "ssh_keys",
+    "volumes": "volumes",
+    "firewalls": "firewalls",
+    "networks": "private_networks",
+}
+# Module params of the servers only used during the server creation
+SERVER_CREATE_ONLY_PARAMS = ("location", "datacenter", "ssh_keys", "volumes")
+
+
+class ServerSpecModule:
+    """
+    View of the bulk module, with the params of a single server spec.
+    """
+
+    def __init__(self, module: AnsibleModule, params: dict[str, Any]):
+        self._module = module
+        self.params = params
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._module, name)
+
+    def fail_on_missing_params(self, required_params: list[str] | None = None) -> None:
+        try:
+            check_missing_parameters(self.params, required_params)
+        except TypeError as exception:
+            self._module.fail_json(msg=f"server {self.params['name']}: {to_native(exception)}")
+
+
+class AnsibleHCloudServersItem(AnsibleHCloudServer):
+    """
+    Server of the bulk module, managed using the params of its spec, and the client and
+    the resolved resources of the bulk module.
+    """
+
+    def __init__(self, parent: AnsibleHCloudServers, spec: dict[str, Any]):
+        self.parent = parent
+        super().__init__(
+            ServerSpecModule(parent.module, {**parent.module.params, **spec, "id": None}),
+            client=parent.client,
+        )
+
+    @property
+    def name(self) -> str:
+        return self.module.params["name"]
+
+    def _client_get_by_name_or_id(self, resource: str, param: str | int):
+        return self.parent.resolve(resource, [param])[0]
+
+    def _client_resolve_many(self, resource: str, params: list[str | int]) -> list:
+        return self.parent.resolve(resource, params)
+
+    def _get_server_type(self) -> ServerType:
+        # The deprecation of the server types is only checked once, when resolving them
+        return self._client_get_by_name_or_id("server_types", self.module.params.get("server_type"))
+
+    def _get_image(self, server_type: ServerType):
+        image = self.module.params.get("image")
+        allow_deprecated = self.module.params.get("image_allow_deprecated")
+        key = ("images", f"{image}:{server_type.architecture}:{allow_deprecated}")
+        if key not in self.parent.resolved:
+            self.parent.resolved[key] = super()._get_image(server_type)
+        return self.parent.resolved[key]
+
+
+class AnsibleHCloudServers(AnsibleHCloud):
+    represent = "hcloud_servers"
+
+    hcloud_servers: list[AnsibleHCloudServersItem] | None = None
+    resolved: dict[tuple[str, str], Any] | None = None
+
+    def _prepare_result(self):
+        self.client.hydrate(
+            [
+                net
+                for item in self.hcloud_servers
+                if item.hcloud_server is not None
+                for net in item.hcloud_server.private_net
+            ],
+            depth=0,
+        )
+
+        result = []
+        for item in self.hcloud_servers:
+            entry = {
+                "name": item.name,
+                "changed": item.result["changed"],
+                "hcloud_server": item.prepare_result() if item.hcloud_server is not None else None,
+            }
+            if "root_password" in item.result:
+                entry["root_password"] = item.result["root_password"]
+            if "msg" in item.result:
+                entry["msg"] = item.result["msg"]
+            result.append(entry)
+        return result
+
+    def resolve(self, resource: str, params: list[str | int]) -> list:
+        """
+        Resolve resources by name or ID, only once for all the servers.
+
+        :param resource: Name of the resource client, e.g. `ssh_keys`
+        :param params: Names or IDs of the resources
+        """
+        missing = [
+            param for param in dict.fromkeys(str(param) for param in params) if (resource, param) not in self.resolved
+        ]
+        if missing:
+            for param, item in zip(missing, self._client_resolve_many(resource, missing)):
+                self.resolved[(resource, param)] = item
+        return [self.resolved[(resource, str(param))] for param in params]
+
+    def _resolve_dependencies(self, items: list[AnsibleHCloudServersItem]) -> None:
+        for resource, key in SERVER_DEPENDENCIES.items():
+            params: list[str] = []
+            for item in items:
+                if item.hcloud_server is not None and key in SERVER_CREATE_ONLY_PARAMS:
+                    continue
+                value = item.module.params.get(key)
+                if value is not None:
+                    params.extend(value if isinstance(value, list) else [value])
+            if params:
+                self.resolve(resource, params)
+
+        # The server types of the existing servers are checked when updating them
+        created = [item for item in items if item.hcloud_server is None]
+        for param in dict.fromkeys(item.module.params.get("server_type") for item in created):
+            if param is not None:
+                created[0].check_and_warn_deprecated_server(self.resolved[("server_types", str(param))])
+
+    def _max_workers(self, count: int) -> int:
+        max_workers = min(self.module.params.get("max_concurrency"), count)
+        rate_limit = self.client.rate_limit
+        if rate_limit is not None:
+            # Keep half of the remaining requests for the polling and the other processes
+            max_workers = min(max_workers, rate_limit.remaining // 2)
+        return max(max_workers, 1)
+
+    def _run_concurrently(
+        self,
+        calls: list[tuple[AnsibleHCloudServersItem, Callable[[], list[BoundAction]]]],
+    ) -> tuple[list[BoundAction], list[tuple[AnsibleHCloudServersItem, HCloudException]]]:
+        """
+        Run the calls concurrently, within the rate limit headroom.
+
+        :return: Actions started by the calls, and the failed calls.
+        """
+        actions: list[BoundAction] = []
+        failures: list[tuple[AnsibleHCloudServersItem, HCloudException]] = []
+        if not calls:
+            return actions, failures
+
+        with ThreadPoolExecutor(max_workers=self._max_workers(len(calls))) as executor:
+            futures = [(item, executor.submit(call)) for item, call in calls]
+
+        for item, future in futures:
+            try:
+                actions.extend(future.result())
+            except HCloudException as exception:
+                failures.append((item, exception))
+        return actions, failures
+
+    def _create_server(self, item: AnsibleHCloudServersItem, params: dict[str, Any]) -> list[BoundAction]:
+        resp = self.client.servers.create(**params)
+        item.hcloud_server = resp.server
+        item.result["root_password"] = resp.root_password
+        return [resp.action, *resp.next_actions]
+
+    def _delete_server(self, item: AnsibleHCloudServersItem) -> list[BoundAction]:
+        action = self.client.servers.delete(item.hcloud_server)
+        item.hcloud_server = None
+        return [action]
+
+    def _fail_servers(self, failures: list[tuple[AnsibleHCloudServersItem, HCloudException]]) -> NoReturn:
+        """
+        Fail with the message of every failed server, and the result of all the servers,
+        e.g. the root passwords of the servers that were created.
+        """
+        for item, exception in failures:
+            item.result["msg"] = to_native(exception)
+
+        self.module.fail_json(
+            msg="failed to create or delete servers: "
+            + "; ".join(f"{item.name}: {to_native(exception)}" for item, exception in failures),
+            exception="".join(
+                line
+                for _, exception in failures
+                for line in traceback.format_exception(type(exception), exception, exception.__traceback__)
+            ),
+            **self.get_result(),
+        )
+
+    def manage_servers(self):
+        self.resolved = {}
+        self.hcloud_servers = [AnsibleHCloudServersItem(self, spec) for spec in self.module.params.get("servers")]
+
+        names = [item.name for item in self.hcloud_servers]
+        duplicates = sorted({name for name in names if names.count(name) > 1})
+        if duplicates:
+            self.module.fail_json(msg=f"duplicate servers: {', '.join(duplicates)}")
+
+        try:
+            # Only match the servers by name, a server spec must never take over another
+            # server using its name as ID.
+            existing = client_find_many(self.client, "servers", names, by_id=False)
+        except HCloudException as exception:
+            self.fail_json_hcloud(exception)
+
+        created: list[AnsibleHCloudServersItem] = []
+        deleted: list[AnsibleHCloudServersItem] = []
+        updated: list[AnsibleHCloudServersItem] = []
+        for item in self.hcloud_servers:
+            item.hcloud_server = existing.get(item.name)
+            if item.module.params.get("state") == "absent":
+                if item.hcloud_server is not None:
+                    deleted.append(item)
+            elif item.hcloud_server is None:
+                created.append(item)
+            else:
+                updated.append(item)
+
+        self._resolve_dependencies(created + updated)
+        create_params = [item.create_server_params() for item in created]
+
+        for item in created + deleted:
+            item.mark_as_changed()
+
+        if not self.module.check_mode:
+            actions, failures = self._run_concurrently(
+                [(item, partial(self._create_server, item, params)) for item, params in zip(created, create_params)]
+                + [(item, partial(self._delete_server, item)) for item in deleted]
+            )
+            failed = [item for item, _ in failures]
+            for item in failed:
+                item.result["changed"] = False
+            created = [item for item in created if item not in failed]
+            if any(item.result["changed"] for item in self.hcloud_servers):
+                self._mark_as_changed()
+            try:
+                # Creating a server can take >10m when using a custom image, the actions are
+                # running in parallel, so we wait for all of them at once.
+                self._wait_for_actions(*actions, timeout=self._wait_timeout(1800))
+
+                # Finish setting up the created servers, even if others failed
+                for item in created:
+                    item.setup_created_server()
+
+                # Fetch the state of the created servers once their actions finished
+                index = ClientResourceIndex(self.client, "servers")
+                index.prefetch(item.hcloud_server.id for item in created)
+                for item in created:
+                    item.hcloud_server = index.get(item.hcloud_server.id)
+            except HCloudException as exception:
+                self.fail_json_hcloud(exception, **self.get_result())
+
+            if failures:
+                self._fail_servers(failures)
+
+        for item in updated:
+            item.update_server()
+            if item.module.params.get("state") == "stopped":
+                item.stop_server()
+
+        for item in deleted:
+            item.hcloud_server = None
+
+        if any(item.result["changed"] for item in self.hcloud_servers):
+            self._mark_as_changed()
+
+    @classmethod
+    def define_module(cls):
+        return AnsibleModule(
+            argument_spec=dict(
+                servers={
+                    "type": "list",
+                    "elements": "dict",
+                    "required": True,
+                    "options": {
+                        "name": {"type": "str", "required": True},
+                        "server_type": {"type": "str"},
+                        "image": {"type": "str"},
+                        "image_allow_deprecated": {"type": "bool", "default": False},
+                        "location": {"type": "str"},
+                        "datacenter": {"type": "str"},
+                        "ssh_keys": {"type": "list", "elements": "str", "no_log": False},
+                        "volumes": {"type": "list", "elements": "str"},
+                        "firewalls": {"type": "list", "elements": "str"},
+                        "private_networks": {"type": "list", "elements": "str"},
+                        "placement_group": {"type": "str"},
+                        "enable_ipv4": {"type": "bool", "default": True},
+                        "enable_ipv6": {"type": "bool", "default": True},
+                        "user_data": {"type": "str"},
+                        "backups": {"type": "bool"},
+                        "labels": {"type": "dict"},
+                        "delete_protection": {"type": "bool"},
+                        "rebuild_protection": {"type": "bool"},
+                        "state": {
+                            "choices": ["absent", "present", "started", "stopped"],
+                            "default": "present",
+                        },
+                    },
+                    "mutually_exclusive": [["location", "datacenter"]],
+                    "required_together": [["delete_protection", "rebuild_protection"]],
+                },
+                max_concurrency={"type": "int", "default": 10},
+                **super().base_module_arguments(),
+                **super().wait_module_arguments(),
+            ),
+            supports_check_mode=True,
+        )
+
+
+def main():
+    module = AnsibleHCloudServers.define_module()
+
+    hcloud = AnsibleHCloudServers(module)
+    hcloud.manage_servers()
+
+    module.exit_json(**hcloud.get_result())
+
+
+if __name__ == "__main__":
+    main()
@@ -78,8 +78,11 @@ hcloud_ssh_key_info:
             type: dict
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import client_iter_all
 from ..module_utils.hcloud import AnsibleHCloud
 from ..module_utils.vendor.hcloud import HCloudException
 from ..module_utils.vendor.hcloud.ssh_keys import BoundSSHKey
@@ -88,7 +91,7 @@ from ..module_utils.vendor.hcloud.ssh_keys import BoundSSHKey
 class AnsibleHCloudSSHKeyInfo(AnsibleHCloud):
     represent = "hcloud_ssh_key_info"
 
-    hcloud_ssh_key_info: list[BoundSSHKey] | None = None
+    hcloud_ssh_key_info: Iterable[BoundSSHKey] | None = None
 
     def _prepare_result(self):
         tmp = []
@@ -119,11 +122,11 @@ class AnsibleHCloudSSHKeyInfo(AnsibleHCloud):
                     self.client.ssh_keys.get_by_fingerprint(self.module.params.get("fingerprint"))
                 ]
             elif self.module.params.get("label_selector") is not None:
-                self.hcloud_ssh_key_info = self.client.ssh_keys.get_all(
-                    label_selector=self.module.params.get("label_selector")
+                self.hcloud_ssh_key_info = client_iter_all(
+                    self.client, "ssh_keys", label_selector=self.module.params.get("label_selector")
                 )
             else:
-                self.hcloud_ssh_key_info = self.client.ssh_keys.get_all()
+                self.hcloud_ssh_key_info = client_iter_all(self.client, "ssh_keys")
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
@@ -55,6 +55,7 @@ options:
 
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 """
 
 EXAMPLES = """
@@ -120,6 +121,12 @@ hcloud_subnetwork:
             type: str
             returned: always
             sample: 10.0.0.1
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -174,7 +181,7 @@ class AnsibleHCloudSubnetwork(AnsibleHCloud):
         if not self.module.check_mode:
             try:
                 action = self.hcloud_network.add_subnet(subnet=NetworkSubnet(**params))
-                action.wait_until_finished()
+                self._wait_for_actions(action)
             except HCloudException as exception:
                 self.fail_json_hcloud(exception)
 
@@ -195,7 +202,7 @@ class AnsibleHCloudSubnetwork(AnsibleHCloud):
             if not self.module.check_mode:
                 try:
                     action = self.hcloud_network.delete_subnet(self.hcloud_subnetwork)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 except HCloudException as exception:
                     self.fail_json_hcloud(exception)
             self._mark_as_changed()
@@ -215,6 +222,7 @@ class AnsibleHCloudSubnetwork(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             supports_check_mode=True,
         )
@@ -72,6 +72,7 @@ options:
         type: str
 extends_documentation_fragment:
 - hetzner.hcloud.hcloud
+- hetzner.hcloud.hcloud.wait
 
 """
 
@@ -157,6 +158,12 @@ hcloud_volume:
             returned: always
             sample: false
             version_added: "0.1.0"
+action_ids:
+    description: IDs of the actions the module did not wait for, to wait for them using M(hetzner.hcloud.action_wait).
+    returned: when O(wait=false)
+    type: list
+    elements: int
+    sample: [1337, 1338]
 """
 
 from ansible.module_utils.basic import AnsibleModule
@@ -211,13 +218,12 @@ class AnsibleHCloudVolume(AnsibleHCloud):
         if not self.module.check_mode:
             try:
                 resp = self.client.volumes.create(**params)
-                resp.action.wait_until_finished()
-                [action.wait_until_finished() for action in resp.next_actions]
+                self._wait_for_actions(resp.action, *resp.next_actions)
                 delete_protection = self.module.params.get("delete_protection")
                 if delete_protection is not None:
                     self._get_volume()
                     action = self.hcloud_volume.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
             except HCloudException as exception:
                 self.fail_json_hcloud(exception)
         self._mark_as_changed()
@@ -230,7 +236,7 @@ class AnsibleHCloudVolume(AnsibleHCloud):
                 if self.hcloud_volume.size < size:
                     if not self.module.check_mode:
                         action = self.hcloud_volume.resize(size)
-                        action.wait_until_finished()
+                        self._wait_for_actions(action)
                     self._mark_as_changed()
                 elif self.hcloud_volume.size > size:
                     self.module.warn("Shrinking of volumes is not supported")
@@ -242,13 +248,13 @@ class AnsibleHCloudVolume(AnsibleHCloud):
                     if not self.module.check_mode:
                         automount = self.module.params.get("automount", False)
                         action = self.hcloud_volume.attach(server, automount=automount)
-                        action.wait_until_finished()
+                        self._wait_for_actions(action)
                     self._mark_as_changed()
             else:
                 if self.hcloud_volume.server is not None:
                     if not self.module.check_mode:
                         action = self.hcloud_volume.detach()
-                        action.wait_until_finished()
+                        self._wait_for_actions(action)
                     self._mark_as_changed()
 
             labels = self.module.params.get("labels")
@@ -261,7 +267,7 @@ class AnsibleHCloudVolume(AnsibleHCloud):
             if delete_protection is not None and delete_protection != self.hcloud_volume.protection["delete"]:
                 if not self.module.check_mode:
                     action = self.hcloud_volume.change_protection(delete=delete_protection)
-                    action.wait_until_finished()
+                    self._wait_for_actions(action)
                 self._mark_as_changed()
 
             self._get_volume()
@@ -282,7 +288,7 @@ class AnsibleHCloudVolume(AnsibleHCloud):
                 if not self.module.check_mode:
                     if self.hcloud_volume.server is not None:
                         action = self.hcloud_volume.detach()
-                        action.wait_until_finished()
+                        self._wait_for_actions(action)
                     self.client.volumes.delete(self.hcloud_volume)
                 self._mark_as_changed()
             self.hcloud_volume = None
@@ -307,6 +313,7 @@ class AnsibleHCloudVolume(AnsibleHCloud):
                     "default": "present",
                 },
                 **super().base_module_arguments(),
+                **super().wait_module_arguments(),
             ),
             required_one_of=[["id", "name"]],
             mutually_exclusive=[["location", "server"]],
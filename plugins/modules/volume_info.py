@@ -94,35 +94,51 @@ hcloud_volume_info:
             type: dict
 """
 
+from collections.abc import Iterable
+
 from ansible.module_utils.basic import AnsibleModule
 
+from ..module_utils.client import (
+    ClientResourceIndex,
+    client_get_by_id,
+    client_get_by_name,
+    client_iter_all,
+)
 from ..module_utils.hcloud import AnsibleHCloud
+from ..module_utils.projection import Record, project
 from ..module_utils.vendor.hcloud import HCloudException
-from ..module_utils.vendor.hcloud.volumes import BoundVolume
+
+VOLUME_FIELDS = {
+    "name": "name",
+    "size": "size",
+    "location": "location.name",
+    "labels": "labels",
+    "linux_device": "linux_device",
+    "delete_protection": "protection.delete",
+}
+FIELDS = ["id", "server", *VOLUME_FIELDS.values()]
 
 
 class AnsibleHCloudVolumeInfo(AnsibleHCloud):
     represent = "hcloud_volume_info"
 
-    hcloud_volume_info: list[BoundVolume] | None = None
+    hcloud_volume_info: Iterable[Record] | None = None
 
     def _prepare_result(self):
         tmp = []
 
-        for volume in self.hcloud_volume_info:
-            if volume is None:
-                continue
+        volumes = [volume for volume in self.hcloud_volume_info if volume is not None]
+
+        # Fetch the servers attached to the volumes at once, and join them by ID.
+        servers = ClientResourceIndex(self.client, "servers", fields=["id", "name"])
+        servers.prefetch(volume.server for volume in volumes if volume.server is not None)
 
+        for volume in volumes:
             tmp.append(
                 {
                     "id": str(volume.id),
-                    "name": volume.name,
-                    "size": volume.size,
-                    "location": volume.location.name,
-                    "labels": volume.labels,
-                    "server": volume.server.name if volume.server is not None else None,
-                    "linux_device": volume.linux_device,
-                    "delete_protection": volume.protection["delete"],
+                    **project(volume, VOLUME_FIELDS),
+                    "server": servers.get(volume.server).name if volume.server is not None else None,
                 }
             )
 
@@ -131,15 +147,22 @@ class AnsibleHCloudVolumeInfo(AnsibleHCloud):
     def get_volumes(self):
         try:
             if self.module.params.get("id") is not None:
-                self.hcloud_volume_info = [self.client.volumes.get_by_id(self.module.params.get("id"))]
+                self.hcloud_volume_info = [
+                    client_get_by_id(self.client, "volumes", self.module.params.get("id"), fields=FIELDS)
+                ]
             elif self.module.params.get("name") is not None:
-                self.hcloud_volume_info = [self.client.volumes.get_by_name(self.module.params.get("name"))]
+                self.hcloud_volume_info = [
+                    client_get_by_name(self.client, "volumes", self.module.params.get("name"), fields=FIELDS)
+                ]
             elif self.module.params.get("label_selector") is not None:
-                self.hcloud_volume_info = self.client.volumes.get_all(
-                    label_selector=self.module.params.get("label_selector")
+                self.hcloud_volume_info = client_iter_all(
+                    self.client,
+                    "volumes",
+                    label_selector=self.module.params.get("label_selector"),
+                    fields=FIELDS,
                 )
             else:
-                self.hcloud_volume_info = self.client.volumes.get_all()
+                self.hcloud_volume_info = client_iter_all(self.client, "volumes", fields=FIELDS)
 
         except HCloudException as exception:
             self.fail_json_hcloud(exception)
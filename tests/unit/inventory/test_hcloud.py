@@ -3,8 +3,9 @@ from __future__ import annotations
 import json
 from unittest.mock import MagicMock
 
-from plugins.inventory.hcloud import InventoryModule, first_ipv6_address
-from plugins.module_utils.vendor.hcloud.servers import BoundServer
+from plugins.inventory.hcloud import SERVER_FIELDS, InventoryModule, first_ipv6_address
+from plugins.module_utils.client import ClientResourceIndex
+from plugins.module_utils.projection import record_type
 
 
 def test_first_ipv6_address():
@@ -14,13 +15,11 @@ def test_first_ipv6_address():
 
 
 def test_build_inventory_server():
-    client = MagicMock()
     inventory = InventoryModule()
     inventory.get_option = MagicMock()
     inventory.get_option.return_value = None
 
-    server = BoundServer(
-        client,
+    server = record_type(SERVER_FIELDS).from_dict(
         {
             "id": 45921624,
             "name": "my-server",
@@ -73,3 +72,42 @@ def test_build_inventory_server():
         "image_os_flavor": "debian",
         "ansible_host": None,
     }
+
+
+def test_build_inventory_server_private_networks():
+    client = MagicMock()
+    client.networks.max_per_page = 50
+    client.request.return_value = {"networks": [{"id": i, "name": f"network-{i}"} for i in (1, 2)]}
+
+    inventory = InventoryModule()
+    inventory.get_option = MagicMock(side_effect=lambda option: "network-2" if option == "network" else None)
+    inventory.network = MagicMock(id=2)
+    inventory.networks = ClientResourceIndex(client, "networks", fields=["id", "name"])
+
+    server = record_type(SERVER_FIELDS).from_dict(
+        {
+            "id": 45921624,
+            "name": "my-server",
+            "labels": {"env": "prod"},
+            "status": "running",
+            "public_net": {"ipv4": None, "ipv6": None, "floating_ips": [], "firewalls": []},
+            "private_net": [
+                {"network": 1, "ip": "10.0.0.2", "alias_ips": [], "mac_address": "86:00:00:2a:7d:e0"},
+                {"network": 2, "ip": "10.1.0.2", "alias_ips": [], "mac_address": "86:00:00:2a:7d:e1"},
+            ],
+            "server_type": {"id": 1, "name": "cx11", "architecture": "x86"},
+            "datacenter": {"id": 3, "name": "hel1-dc2", "location": {"id": 3, "name": "hel1"}},
+            "image": None,
+        },
+    )
+    # pylint: disable=protected-access
+    variables = inventory._build_inventory_server(server)
+
+    assert variables["private_networks"] == [
+        {"id": 1, "name": "network-1", "ip": "10.0.0.2"},
+        {"id": 2, "name": "network-2", "ip": "10.1.0.2"},
+    ]
+    assert variables["private_ipv4"] == "10.1.0.2"
+    assert "ipv4" not in variables
+    assert "image_id" not in variables
+    client.request.assert_called_once_with(url="/networks", method="GET", params={"page": 1, "per_page": 50})
@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from unittest import mock
+
+import pytest
+from ansible_collections.hetzner.hcloud.plugins.module_utils.actions import (
+    POLL_INTERVAL_MAX,
+    POLL_INTERVAL_MIN,
+    ActionGroupException,
+    action_estimate_remaining,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.client import Client
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud.actions import (
+    ActionFailedException,
+    ActionTimeoutException,
+    BoundAction,
+)
+
+# pylint: disable=protected-access
+
+
+def _action(id: int, status: str, **kwargs) -> dict:
+    return {"id": id, "command": "attach_to_network", "status": status, "progress": 0, **kwargs}
+
+
+@pytest.fixture()
+def client():
+    obj = Client(token="dummy", poll_interval=0.0, poll_max_retries=3)
+    obj.request = mock.MagicMock()
+    return obj
+
+
+def test_wait_for_actions(client: Client):
+    actions = [BoundAction(client.actions, _action(i, "running")) for i in (1, 2, 3)]
+    client.request.side_effect = [
+        {"actions": [_action(1, "success"), _action(2, "running"), _action(3, "running")]},
+        {"actions": [_action(2, "running"), _action(3, "success")]},
+        {"actions": [_action(2, "success")]},
+    ]
+
+    result = client.wait_for_actions(actions)
+
+    assert [action.id for action in result] == [1, 2, 3]
+    assert all(action.status == "success" for action in result)
+    assert [call.kwargs["params"]["id"] for call in client.request.call_args_list] == [[1, 2, 3], [2, 3], [2]]
+    assert all(call.kwargs["url"] == "/actions" for call in client.request.call_args_list)
+
+
+def test_wait_for_actions_skips_finished(client: Client):
+    actions = [BoundAction(client.actions, _action(1, "success")), BoundAction(client.actions, _action(2, "running"))]
+    client.request.side_effect = [{"actions": [_action(2, "success")]}]
+
+    result = client.wait_for_actions(actions)
+
+    assert [action.id for action in result] == [1, 2]
+    assert [call.kwargs["params"]["id"] for call in client.request.call_args_list] == [[2]]
+
+
+def test_wait_for_actions_empty(client: Client):
+    assert client.wait_for_actions([]) == []
+    client.request.assert_not_called()
+
+
+def test_wait_for_actions_chunks_ids(client: Client):
+    actions = [BoundAction(client.actions, _action(i, "running")) for i in range(60)]
+    client.request.side_effect = [
+        {"actions": [_action(i, "success") for i in range(50)]},
+        {"actions": [_action(i, "success") for i in range(50, 60)]},
+    ]
+
+    result = client.wait_for_actions(actions)
+
+    assert len(result) == 60
+    assert client.request.call_count == 2
+
+
+def test_wait_for_actions_aggregates_failures(client: Client):
+    actions = [BoundAction(client.actions, _action(i, "running")) for i in (1, 2, 3)]
+    client.request.side_effect = [
+        {
+            "actions": [
+                _action(1, "error", error={"code": "failed", "message": "Action failed"}),
+                *[_action(i, "running") for i in (2, 3)],
+            ]
+        },
+        {"actions": [_action(2, "success"), _action(3, "running")]},
+        {"actions": [_action(3, "running")]},
+    ]
+
+    with pytest.raises(ActionGroupException) as exc_info:
+        client.wait_for_actions(actions)
+
+    exception = exc_info.value
+    assert [type(item) for item in exception.exceptions] == [ActionFailedException, ActionTimeoutException]
+    assert [action.id for action in exception.actions] == [1, 3]
+    assert str(exception) == (
+        "The pending actions failed or timed out: "
+        "attach_to_network (1): The pending action failed: Action failed; "
+        "attach_to_network (3): The pending action timed out"
+    )
+    assert client.request.call_count == 3
+
+
+def test_wait_for_actions_timeout(client: Client):
+    actions = [BoundAction(client.actions, _action(1, "running"))]
+    client.request.return_value = {"actions": [_action(1, "running")]}
+
+    with pytest.raises(ActionGroupException):
+        client.wait_for_actions(actions, timeout=0)
+
+    assert client.request.call_count == 1
+
+
+NOW = datetime(2024, 1, 1, 12, 0, 0, tzinfo=timezone.utc)
+
+
+def _started(seconds: float) -> str:
+    return (NOW - timedelta(seconds=seconds)).isoformat()
+
+
+@pytest.mark.parametrize(
+    ("data", "expected"),
+    [
+        ({"command": "create_server", "progress": 25, "started": _started(30)}, 90.0),
+        ({"command": "create_server", "progress": 0, "started": _started(10)}, 20.0),
+        ({"command": "create_server", "progress": 0, "started": _started(40)}, -10.0),
+        ({"command": "attach_to_network", "progress": 0, "started": _started(10)}, None),
+        ({"command": "create_server", "progress": 50, "started": None}, None),
+        ({"command": "create_server", "progress": 100, "status": "success", "started": _started(10)}, None),
+    ],
+)
+def test_action_estimate_remaining(client: Client, data: dict, expected: float | None):
+    action = BoundAction(client.actions, {"id": 1, "status": "running", **data})
+    assert action_estimate_remaining(action, NOW) == expected
+
+
+@pytest.mark.parametrize(
+    ("progress", "started", "expected"),
+    [
+        # Long running action, poll less often
+        (10, 60, POLL_INTERVAL_MAX),
+        # Near completion, poll more often
+        (80, 20, 2.5),
+        (99, 50, POLL_INTERVAL_MIN),
+        # Cannot be estimated, fallback to the poll interval
+        (0, 60, 0.0),
+    ],
+)
+def test_poll_interval_adaptive(client: Client, progress: int, started: float, expected: float):
+    client._poll_adaptive = True
+    action = BoundAction(
+        client.actions,
+        _action(
+            1,
+            "running",
+            progress=progress,
+            started=(datetime.now(timezone.utc) - timedelta(seconds=started)).isoformat(),
+        ),
+    )
+    assert client._actions_poll_interval([action], 1) == pytest.approx(expected, abs=0.1)
+
+
+def test_poll_interval_adaptive_earliest(client: Client):
+    client._poll_adaptive = True
+    started = (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat()
+    actions = [
+        BoundAction(client.actions, _action(1, "running", progress=10, started=started)),
+        BoundAction(client.actions, _action(2, "running", progress=80, started=started)),
+    ]
+    assert client._actions_poll_interval(actions, 1) == pytest.approx(2.5, abs=0.1)
+
+
+def test_poll_interval_not_adaptive(client: Client):
+    started = (datetime.now(timezone.utc) - timedelta(seconds=20)).isoformat()
+    action = BoundAction(client.actions, _action(1, "running", progress=80, started=started))
+    assert client._actions_poll_interval([action], 1) == 0.0
+
+
+def test_wait_for_actions_client_timeout(client: Client):
+    client._poll_timeout = 0
+    actions = [BoundAction(client.actions, _action(1, "running"))]
+    client.request.return_value = {"actions": [_action(1, "running")]}
+
+    with pytest.raises(ActionGroupException):
+        client.wait_for_actions(actions)
+
+    assert client.request.call_count == 1
@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+import requests
+from ansible_collections.hetzner.hcloud.plugins.module_utils.catalog_cache import (
+    CatalogCache,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.client import (
+    CachedSession,
+)
+
+API_ENDPOINT = "https://api.hetzner.cloud/v1"
+
+
+@pytest.fixture()
+def catalog_cache(tmp_path):
+    return CatalogCache("token", API_ENDPOINT, str(tmp_path))
+
+
+def test_catalog_cache(catalog_cache: CatalogCache):
+    url = API_ENDPOINT + "/server_types?name=cx22"
+
+    assert catalog_cache.get("server_types", url) is None
+
+    catalog_cache.set("server_types", url, 200, b'{"server_types": []}')
+    assert catalog_cache.get("server_types", url) == (200, b'{"server_types": []}')
+
+    with mock.patch("time.time", return_value=10**10):
+        assert catalog_cache.get("server_types", url) is None
+
+
+def test_catalog_cache_scoped_by_token(tmp_path, catalog_cache: CatalogCache):
+    url = API_ENDPOINT + "/locations"
+    catalog_cache.set("locations", url, 200, b"{}")
+
+    other = CatalogCache("other-token", API_ENDPOINT, str(tmp_path))
+    assert other.get("locations", url) is None
+
+
+def test_catalog_cache_invalidate(catalog_cache: CatalogCache):
+    catalog_cache.set("images", API_ENDPOINT + "/images/1", 200, b"{}")
+    catalog_cache.set("isos", API_ENDPOINT + "/isos/1", 200, b"{}")
+
+    catalog_cache.invalidate("images")
+
+    assert catalog_cache.get("images", API_ENDPOINT + "/images/1") is None
+    assert catalog_cache.get("isos", API_ENDPOINT + "/isos/1") == (200, b"{}")
+
+
+def test_cached_session_catalog_cache(catalog_cache: CatalogCache):
+    def send(request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"images": []}'  # pylint: disable=protected-access
+        return response
+
+    with mock.patch.object(requests.Session, "send", side_effect=send) as send_mock:
+        request = requests.Request("GET", API_ENDPOINT + "/images?type=system&name=debian-12").prepare()
+
+        CachedSession(API_ENDPOINT, catalog_cache=catalog_cache).send(request)
+        response = CachedSession(API_ENDPOINT, catalog_cache=catalog_cache).send(request)
+
+        assert send_mock.call_count == 1
+        assert response.json() == {"images": []}
+
+        session = CachedSession(API_ENDPOINT, catalog_cache=catalog_cache)
+        session.send(requests.Request("DELETE", API_ENDPOINT + "/images/1").prepare())
+        session.send(request)
+
+        assert send_mock.call_count == 3
+
+
+def test_cached_session_catalog_cache_skips_snapshots(catalog_cache: CatalogCache):
+    def send(request, **kwargs):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b'{"images": []}'  # pylint: disable=protected-access
+        return response
+
+    with mock.patch.object(requests.Session, "send", side_effect=send) as send_mock:
+        for url in ("/images?type=snapshot", "/images?type=system&type=backup", "/images?name=debian-12"):
+            request = requests.Request("GET", API_ENDPOINT + url).prepare()
+            CachedSession(API_ENDPOINT, catalog_cache=catalog_cache).send(request)
+            CachedSession(API_ENDPOINT, catalog_cache=catalog_cache).send(request)
+
+        assert send_mock.call_count == 6
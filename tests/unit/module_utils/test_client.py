@@ -1 +1,365 @@
 from __future__ import annotations
+
+import json
+from unittest import mock
+
+import pytest
+import requests
+from ansible_collections.hetzner.hcloud.plugins.module_utils.client import (
+    CachedSession,
+    Client,
+    ClientException,
+    ClientResourceIndex,
+    client_find_many,
+    client_resolve_many,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud import (
+    APIException,
+    Client as ClientBase,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud.actions import (
+    BoundAction,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud.networks import (
+    BoundNetwork,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud.servers import (
+    BoundServer,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud.ssh_keys import (
+    BoundSSHKey,
+)
+
+API_ENDPOINT = "https://api.hetzner.cloud/v1"
+
+
+def _request(method: str, path: str) -> requests.PreparedRequest:
+    return requests.Request(method, API_ENDPOINT + path).prepare()
+
+
+def _response(content: bytes = b"{}", ok: bool = True) -> requests.Response:
+    response = mock.MagicMock(spec=requests.Response)
+    response.ok = ok
+    response.content = content
+    response.json.side_effect = lambda: json.loads(content)
+    return response
+
+
+def _action_response(*resources: tuple[str, int], status: str = "running") -> requests.Response:
+    action = {
+        "id": 1,
+        "command": "attach_to_network",
+        "status": status,
+        "resources": [{"type": type, "id": id} for type, id in resources],
+    }
+    return _response(json.dumps({"action": action, "actions": [action]}).encode())
+
+
+@pytest.fixture()
+def send():
+    with mock.patch.object(requests.Session, "send") as send_mock:
+        send_mock.side_effect = lambda *args, **kwargs: _response()
+        yield send_mock
+
+
+def test_cached_session_caches_get(send):
+    session = CachedSession(API_ENDPOINT)
+
+    first = session.send(_request("GET", "/servers/1"))
+    second = session.send(_request("GET", "/servers/1"))
+
+    assert first is second
+    assert send.call_count == 1
+
+
+def test_cached_session_skips_failed_responses(send):
+    send.side_effect = lambda *args, **kwargs: _response(ok=False)
+    session = CachedSession(API_ENDPOINT)
+
+    session.send(_request("GET", "/servers/1"))
+    session.send(_request("GET", "/servers/1"))
+
+    assert send.call_count == 2
+
+
+def test_cached_session_ttl(send):
+    session = CachedSession(API_ENDPOINT)
+
+    with mock.patch("time.monotonic", return_value=1000.0):
+        session.send(_request("GET", "/servers/1"))
+        session.send(_request("GET", "/server_types/1"))
+
+    with mock.patch("time.monotonic", return_value=1000.0 + session.default_ttl):
+        session.send(_request("GET", "/servers/1"))
+        session.send(_request("GET", "/server_types/1"))
+
+    assert [call.args[0].path_url for call in send.call_args_list] == [
+        "/v1/servers/1",
+        "/v1/server_types/1",
+        "/v1/servers/1",
+    ]
+
+
+def test_cached_session_lru_eviction(send):
+    session = CachedSession(API_ENDPOINT, max_entries=2)
+
+    session.send(_request("GET", "/servers/1"))
+    session.send(_request("GET", "/servers/2"))
+    session.send(_request("GET", "/servers/1"))
+    session.send(_request("GET", "/servers/3"))
+
+    assert list(session.cache) == [
+        API_ENDPOINT + "/servers/1",
+        API_ENDPOINT + "/servers/3",
+    ]
+
+
+def test_cached_session_bytes_budget(send):
+    send.side_effect = lambda *args, **kwargs: _response(b"x" * 10)
+    session = CachedSession(API_ENDPOINT, max_entries=None, max_bytes=25)
+
+    for i in range(5):
+        session.send(_request("GET", f"/servers/{i}"))
+
+    assert len(session.cache) == 2
+    assert session.cache_bytes == 20
+
+
+def test_cached_session_invalidates_on_write(send):
+    session = CachedSession(API_ENDPOINT)
+
+    session.send(_request("GET", "/servers?name=my-server"))
+    session.send(_request("GET", "/servers/1"))
+    session.send(_request("GET", "/networks/1"))
+    session.send(_request("GET", "/server_types/1"))
+    session.send(_request("POST", "/servers/1/actions/poweron"))
+
+    assert list(session.cache) == [API_ENDPOINT + "/server_types/1"]
+
+
+def test_client_invalidate(send):
+    session = CachedSession(API_ENDPOINT)
+    client = Client(token="dummy", api_endpoint=API_ENDPOINT, session=session)
+
+    session.send(_request("GET", "/servers/1"))
+    session.send(_request("GET", "/networks/1"))
+    client.invalidate("servers", 1)
+
+    assert list(session.cache) == [API_ENDPOINT + "/networks/1"]
+
+    # Without a cached session, there is nothing to invalidate
+    Client(token="dummy").invalidate("servers", 1)
+
+
+def test_cached_session_invalidates_catalog_resource(send):
+    session = CachedSession(API_ENDPOINT)
+
+    session.send(_request("GET", "/images?type=system"))
+    session.send(_request("GET", "/images/1"))
+    session.send(_request("GET", "/server_types/1"))
+    session.send(_request("PUT", "/servers/2"))
+
+    # Only the images filtered by the system type are catalog resources
+    assert list(session.cache) == [API_ENDPOINT + "/images?type=system", API_ENDPOINT + "/server_types/1"]
+
+    session.send(_request("DELETE", "/images/1"))
+
+    assert list(session.cache) == [API_ENDPOINT + "/server_types/1"]
+
+
+def test_cached_session_invalidates_actions_resources(send):
+    session = CachedSession(API_ENDPOINT)
+
+    session.send(_request("GET", "/images?type=system"))
+    session.send(_request("GET", "/server_types/1"))
+
+    send.side_effect = lambda *args, **kwargs: _action_response(("server", 1), ("image", 2))
+    session.send(_request("POST", "/servers/1/actions/create_image"))
+
+    assert list(session.cache) == [API_ENDPOINT + "/server_types/1"]
+
+
+def test_cached_session_never_caches_actions(send):
+    session = CachedSession(API_ENDPOINT)
+
+    session.send(_request("GET", "/servers/1"))
+
+    send.side_effect = lambda *args, **kwargs: _action_response(("server", 1), status="success")
+    session.send(_request("GET", "/actions?id=1"))
+    session.send(_request("GET", "/actions?id=1"))
+    session.send(_request("GET", "/servers/actions/1"))
+
+    assert send.call_count == 4
+    assert not session.cache
+
+
+@pytest.fixture()
+def ssh_keys_client():
+    client = mock.MagicMock()
+    ssh_keys = {i: BoundSSHKey(client.ssh_keys, {"id": i, "name": f"key-{i}"}) for i in range(1, 21)}
+
+    def get_by_id(id):
+        if int(id) not in ssh_keys:
+            raise APIException(code="not_found", message="not found", details={})
+        return ssh_keys[int(id)]
+
+    client.ssh_keys.get_by_name.side_effect = lambda name: next((k for k in ssh_keys.values() if k.name == name), None)
+    client.ssh_keys.get_by_id.side_effect = get_by_id
+    client.ssh_keys.get_list.side_effect = lambda **kwargs: (list(ssh_keys.values()), None)
+    return client
+
+
+def test_client_resolve_many(ssh_keys_client):
+    result = client_resolve_many(ssh_keys_client, "ssh_keys", ["key-2", 3, "key-2"])
+
+    assert [item.id for item in result] == [2, 3, 2]
+    assert ssh_keys_client.ssh_keys.get_by_name.call_count == 2
+    ssh_keys_client.ssh_keys.get_list.assert_not_called()
+
+
+def test_client_resolve_many_above_threshold(ssh_keys_client):
+    params = [f"key-{i}" for i in range(1, 11)] + ["15"]
+
+    result = client_resolve_many(ssh_keys_client, "ssh_keys", params, threshold=5)
+
+    assert [item.id for item in result] == list(range(1, 11)) + [15]
+    ssh_keys_client.ssh_keys.get_list.assert_called_once()
+    ssh_keys_client.ssh_keys.get_by_name.assert_not_called()
+
+
+@pytest.mark.parametrize("threshold", [10, 1])
+def test_client_resolve_many_missing(ssh_keys_client, threshold):
+    with pytest.raises(ClientException) as exc_info:
+        client_resolve_many(ssh_keys_client, "ssh_keys", ["key-1", "unknown", "42"], threshold=threshold)
+
+    assert str(exc_info.value) == "resources (ssh_key) do not exist: unknown, 42"
+
+
+@pytest.mark.parametrize("threshold", [10, 1])
+def test_client_find_many(ssh_keys_client, threshold):
+    result = client_find_many(ssh_keys_client, "ssh_keys", ["key-1", "unknown", 2], threshold=threshold)
+
+    assert {param: item.id for param, item in result.items()} == {"key-1": 1, "2": 2}
+
+
+@pytest.mark.parametrize("threshold", [10, 1])
+def test_client_find_many_by_name_only(ssh_keys_client, threshold):
+    result = client_find_many(ssh_keys_client, "ssh_keys", ["key-1", "2"], threshold=threshold, by_id=False)
+
+    assert {param: item.id for param, item in result.items()} == {"key-1": 1}
+    ssh_keys_client.ssh_keys.get_by_id.assert_not_called()
+
+
+def test_client_resource_index():
+    client = mock.MagicMock()
+    client.networks.get_list.side_effect = lambda **kwargs: (
+        [BoundNetwork(client.networks, {"id": i, "name": f"network-{i}"}) for i in (1, 2, 3)],
+        None,
+    )
+
+    index = ClientResourceIndex(client, "networks")
+    index.hydrate([BoundNetwork(client.networks, {"id": 1, "name": "network-1"})])
+    client.networks.get_list.assert_not_called()
+
+    references = [BoundNetwork(client.networks, {"id": i}, complete=False) for i in (1, 2, 4)]
+    index.hydrate(references[:2])
+    index.hydrate(references[2:])
+
+    client.networks.get_list.assert_called_once()
+    assert [network.complete for network in references] == [True, True, False]
+    assert [network.name for network in references[:2]] == ["network-1", "network-2"]
+    client.networks.get_by_id.assert_not_called()
+
+
+def test_client_resource_index_raw():
+    client = mock.MagicMock()
+    client.servers.max_per_page = 50
+    client.request.side_effect = [
+        {"servers": [{"id": i, "name": f"server-{i}"} for i in (1, 2)]},
+        {"server": {"id": 3, "name": "server-3"}},
+    ]
+
+    index = ClientResourceIndex(client, "servers", raw=True)
+    client.request.assert_not_called()
+
+    assert index.get(2)["name"] == "server-2"
+    assert index.get(1)["name"] == "server-1"
+    client.request.assert_called_once_with(url="/servers", method="GET", params={"page": 1, "per_page": 50})
+
+    # Created after the servers were listed
+    assert index.get(3)["name"] == "server-3"
+    assert index.get(3)["name"] == "server-3"
+    client.request.assert_called_with(url="/servers/3", method="GET")
+    assert client.request.call_count == 2
+
+
+@pytest.mark.parametrize("threshold", [10, 2])
+def test_client_resource_index_prefetch(threshold):
+    client = mock.MagicMock()
+    client.servers.max_per_page = 50
+
+    def request(url, method, params=None):  # pylint: disable=unused-argument
+        if url == "/servers":
+            return {"servers": [{"id": i, "name": f"server-{i}", "status": "running"} for i in range(1, 6)]}
+        server_id = int(url.rsplit("/", 1)[1])
+        return {"server": {"id": server_id, "name": f"server-{server_id}", "status": "running"}}
+
+    client.request.side_effect = request
+
+    index = ClientResourceIndex(client, "servers", fields=["id", "name"])
+    index.prefetch([1, 2, 2, 3], threshold=threshold)
+
+    assert [index.get(i) for i in (3, 2, 1)] == [(3, "server-3"), (2, "server-2"), (1, "server-1")]
+    assert index.get(1).name == "server-1"
+    if threshold == 10:
+        assert sorted(call.kwargs["url"] for call in client.request.call_args_list) == [
+            "/servers/1",
+            "/servers/2",
+            "/servers/3",
+        ]
+    else:
+        client.request.assert_called_once_with(url="/servers", method="GET", params={"page": 1, "per_page": 50})
+
+    # Already fetched
+    index.prefetch([1, 2, 3], threshold=threshold)
+    assert client.request.call_count == (3 if threshold == 10 else 1)
+
+
+def test_client_resource_index_add():
+    client = mock.MagicMock()
+
+    index = ClientResourceIndex(client, "servers", fields=["id", "name"])
+    index.add([BoundServer(client.servers, {"id": 1, "name": "server-1"}), {"id": 2, "name": "server-2"}])
+    index.prefetch([1, 2])
+
+    assert index.get(1).name == "server-1"
+    assert index.get(2)["name"] == "server-2"
+    client.request.assert_not_called()
+
+
+def test_client_defer_actions():
+    client = Client(token="dummy", poll_interval=0.0)
+    actions = [
+        BoundAction(client.actions, {"id": id, "command": "create_server", "status": "running"}) for id in (1, 2)
+    ]
+
+    def request(_self, method, url, **kwargs):
+        if url == "/actions":
+            return {"actions": [{"id": id, "command": "create_server", "status": "success"} for id in (1, 2)]}
+        return {}
+
+    with mock.patch.object(ClientBase, "request", autospec=True, side_effect=request) as request_mock:
+        client.defer_actions(actions, timeout=60)
+        assert [action.id for action in client.deferred_actions] == [1, 2]
+
+        # Reading does not wait for the deferred actions
+        client.request("GET", "/servers/1")
+        assert [call.args[1:3] for call in request_mock.call_args_list] == [("GET", "/servers/1")]
+
+        # Changing waits for the deferred actions first
+        client.request("POST", "/servers/1/actions/poweron")
+        assert [call.args[1:3] for call in request_mock.call_args_list[1:]] == [
+            ("GET", "/actions"),
+            ("POST", "/servers/1/actions/poweron"),
+        ]
+        assert client.deferred_actions == []
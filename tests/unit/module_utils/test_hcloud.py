@@ -2,8 +2,12 @@ from __future__ import annotations
 
 import traceback
 from datetime import datetime, timezone
+from unittest import mock
 
 import pytest
+from ansible_collections.hetzner.hcloud.plugins.module_utils.actions import (
+    ActionGroupException,
+)
 from ansible_collections.hetzner.hcloud.plugins.module_utils.hcloud import AnsibleHCloud
 from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud import (
     APIException,
@@ -13,6 +17,7 @@ from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud.actio
     ActionException,
     ActionFailedException,
     ActionTimeoutException,
+    BoundAction,
 )
 
 
@@ -143,3 +148,26 @@ def test_hcloud_fail_on_invalid_params(module, kwargs, msg):
         module.fail_json.assert_not_called()
     else:
         module.fail_json.assert_called_with(msg=msg)
+
+
+def test_hcloud_wait_for_actions(module):
+    AnsibleHCloud.represent = "hcloud_test"
+    hcloud = AnsibleHCloud(module)
+    hcloud.hcloud_test = None
+
+    action = BoundAction(hcloud.client.actions, {"id": 1, "status": "running"})
+    with mock.patch.object(hcloud.client, "wait_for_actions") as wait_mock:
+        hcloud._wait_for_actions(action, timeout=60)  # pylint: disable=protected-access
+    wait_mock.assert_called_once_with([action], timeout=60)
+    assert "action_ids" not in hcloud.get_result()
+
+    # A single failed action is reported on its own
+    exception = ActionFailedException(action=action)
+    with mock.patch.object(hcloud.client, "wait_for_actions", side_effect=ActionGroupException([exception])):
+        with pytest.raises(ActionFailedException):
+            hcloud._wait_for_actions(action)  # pylint: disable=protected-access
+
+    module.params["wait"] = False
+    actions = [BoundAction(hcloud.client.actions, {"id": id, "status": "running"}) for id in (1, 2)]
+    hcloud._wait_for_actions(*actions)  # pylint: disable=protected-access
+    assert hcloud.get_result()["action_ids"] == [1, 2]
@@ -0,0 +1,87 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from ansible_collections.hetzner.hcloud.plugins.module_utils.client import Client
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud.servers import (
+    BoundServer,
+)
+
+
+def _server(id: int, volumes: list[int], networks: list[int]) -> dict:
+    return {
+        "id": id,
+        "name": f"server-{id}",
+        "volumes": volumes,
+        "private_net": [
+            {"network": network, "ip": "10.0.0.2", "alias_ips": [], "mac_address": ""} for network in networks
+        ],
+    }
+
+
+def _volume(id: int, server: int) -> dict:
+    return {"id": id, "name": f"volume-{id}", "server": server}
+
+
+@pytest.fixture()
+def client():
+    obj = Client(token="dummy")
+    obj.request = mock.MagicMock()
+    return obj
+
+
+def test_hydrate_small_groups(client: Client):
+    servers = [BoundServer(client.servers, _server(i, [10 + i], [7])) for i in (1, 2)]
+
+    def request(method, url, **kwargs):
+        return {
+            "/volumes/11": {"volume": _volume(11, 1)},
+            "/volumes/12": {"volume": _volume(12, 2)},
+            "/networks/7": {"network": {"id": 7, "name": "network-7"}},
+        }[url]
+
+    client.request.side_effect = request
+
+    client.hydrate(servers)
+
+    assert sorted(call.kwargs["url"] for call in client.request.call_args_list) == [
+        "/networks/7",
+        "/volumes/11",
+        "/volumes/12",
+    ]
+    assert [server.volumes[0].name for server in servers] == ["volume-11", "volume-12"]
+    assert servers[0].private_net[0].network.name == "network-7"
+    assert servers[1].private_net[0].network.name == "network-7"
+    assert client.request.call_count == 3
+
+
+def test_hydrate_large_groups(client: Client):
+    servers = [BoundServer(client.servers, _server(i, [10 + i], [])) for i in range(1, 11)]
+    client.request.return_value = {
+        "volumes": [_volume(10 + i, i) for i in range(1, 11)],
+        "meta": {"pagination": {"page": 1, "per_page": 50, "next_page": None, "last_page": 1}},
+    }
+
+    client.hydrate(servers)
+
+    assert client.request.call_count == 1
+    assert client.request.call_args.kwargs["url"] == "/volumes"
+    assert [server.volumes[0].name for server in servers] == [f"volume-{10 + i}" for i in range(1, 11)]
+
+
+def test_hydrate_depth(client: Client):
+    servers = [BoundServer(client.servers, _server(1, [11], []))]
+    client.request.return_value = {"volume": _volume(11, 1)}
+
+    client.hydrate(servers, depth=0)
+    client.request.assert_not_called()
+
+    client.hydrate(servers, depth=1)
+    assert client.request.call_count == 1
+    assert not servers[0].volumes[0].server.complete
+
+    client.request.return_value = {"server": _server(1, [11], [])}
+    client.hydrate(servers, depth=2)
+    assert client.request.call_count == 2
+    assert servers[0].volumes[0].server.complete
@@ -0,0 +1,75 @@
+from __future__ import annotations
+
+import os
+import threading
+import time
+from unittest import mock
+
+import pytest
+from ansible_collections.hetzner.hcloud.plugins.module_utils.hcloud import AnsibleHCloud
+from ansible_collections.hetzner.hcloud.plugins.module_utils.lock import ResourceLock
+
+
+def test_resource_lock(tmp_path):
+    first = ResourceLock("token", str(tmp_path), "load_balancers", 42)
+    second = ResourceLock("token", str(tmp_path), "load_balancers", 42)
+    other = ResourceLock("token", str(tmp_path), "load_balancers", 43)
+    assert first.path == second.path != other.path
+
+    first.acquire()
+    with other:
+        assert other.wait_time < 0.1
+
+    thread = threading.Thread(target=second.acquire)
+    thread.start()
+    time.sleep(0.2)
+    assert thread.is_alive()
+
+    first.release()
+    thread.join(timeout=5)
+    assert not thread.is_alive()
+    assert second.wait_time >= 0.2
+    second.release()
+
+    # The lock files are removed once released
+    assert not os.listdir(tmp_path)
+
+
+def test_resource_lock_refuses_symlink(tmp_path):
+    lock = ResourceLock("token", str(tmp_path), "load_balancers", 42)
+    (tmp_path / "target").write_bytes(b"")
+    os.symlink(tmp_path / "target", lock.path)
+
+    with pytest.raises(OSError):
+        lock.acquire()
+
+
+def test_hcloud_resource_lock(module, tmp_path):
+    AnsibleHCloud.represent = "hcloud_test"
+    hcloud = AnsibleHCloud(module)
+
+    with hcloud._resource_lock("firewalls", 1) as locked:  # pylint: disable=protected-access
+        assert locked is False
+    assert "lock_wait_time" not in hcloud.result
+
+    module.params["resource_lock"] = True
+    with mock.patch(f"{AnsibleHCloud.__module__}.state_directory", return_value=str(tmp_path)):
+        with hcloud._resource_lock("firewalls", 1) as locked:  # pylint: disable=protected-access
+            assert locked is True
+    assert hcloud.result["lock_wait_time"] >= 0.0
+
+
+def test_hcloud_resource_lock_waits_for_deferred_actions(module, tmp_path):
+    AnsibleHCloud.represent = "hcloud_test"
+    module.params["resource_lock"] = True
+    module.params["wait"] = False
+    hcloud = AnsibleHCloud(module)
+    hcloud.client = mock.MagicMock()
+
+    with mock.patch(f"{AnsibleHCloud.__module__}.state_directory", return_value=str(tmp_path)):
+        with hcloud._resource_lock("firewalls", 1):  # pylint: disable=protected-access
+            hcloud._wait_for_actions(mock.MagicMock())  # pylint: disable=protected-access
+            hcloud.client.defer_actions.assert_called_once()
+            hcloud.client.wait_for_deferred_actions.assert_not_called()
+
+    hcloud.client.wait_for_deferred_actions.assert_called_once()
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+import threading
+import time
+from unittest import mock
+
+import pytest
+from ansible_collections.hetzner.hcloud.plugins.module_utils.client import (
+    Client,
+    client_iter_all,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud.core import (
+    Meta,
+    Pagination,
+)
+
+
+class PagedClient:
+    max_per_page = 2
+
+    def __init__(self, total: int, last_page_known: bool = True):
+        self.total = total
+        self.last_page_known = last_page_known
+        self.pages: list[int] = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._lock = threading.Lock()
+
+    def get_list(self, page: int, per_page: int, **kwargs):  # pylint: disable=unused-argument
+        with self._lock:
+            self.pages.append(page)
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+
+        # Let later pages complete before earlier ones
+        time.sleep(0.01 / page)
+
+        last_page = (self.total + per_page - 1) // per_page
+        result = list(range((page - 1) * per_page, min(page * per_page, self.total)))
+        pagination = Pagination(
+            page=page,
+            per_page=per_page,
+            next_page=page + 1 if page < last_page else None,
+            last_page=last_page if self.last_page_known else None,
+        )
+
+        with self._lock:
+            self.in_flight -= 1
+        return result, Meta(pagination=pagination)
+
+
+@pytest.fixture()
+def client():
+    return Client(token="dummy")
+
+
+@pytest.mark.parametrize("last_page_known", [True, False])
+def test_iter_all_keeps_order(client: Client, last_page_known: bool):
+    client.paged = PagedClient(total=21, last_page_known=last_page_known)
+
+    assert list(client_iter_all(client, "paged")) == list(range(21))
+    assert sorted(client.paged.pages) == list(range(1, 12))
+
+
+def test_iter_all_fetches_concurrently(client: Client):
+    client.paged = PagedClient(total=21)
+
+    list(client_iter_all(client, "paged", max_workers=4))
+    assert 1 < client.paged.max_in_flight <= 4
+
+
+def test_iter_all_backs_off_on_low_rate_limit(client: Client):
+    client.paged = PagedClient(total=21)
+    client.rate_limiter.update(
+        {
+            "RateLimit-Limit": "3600",
+            "RateLimit-Remaining": "99",
+            "RateLimit-Reset": str(int(time.time()) + 3600),
+        }
+    )
+
+    assert list(client_iter_all(client, "paged", rate_limit_reserve=100)) == list(range(21))
+    assert client.paged.max_in_flight == 1
+    assert client.paged.pages == list(range(1, 12))
+
+
+def test_iter_all_single_page(client: Client):
+    client.paged = PagedClient(total=2)
+    client.paged.get_list = mock.MagicMock(wraps=client.paged.get_list)
+
+    assert list(client_iter_all(client, "paged", label_selector="key=value")) == [0, 1]
+    client.paged.get_list.assert_called_once_with(page=1, per_page=2, label_selector="key=value")
+
+
+def test_iter_all_is_lazy(client: Client):
+    client.paged = PagedClient(total=21)
+
+    entities = client_iter_all(client, "paged", max_workers=1)
+    assert not client.paged.pages
+
+    assert [next(entities), next(entities), next(entities)] == [0, 1, 2]
+    assert client.paged.pages == [1, 2]
+
+    assert list(entities) == list(range(3, 21))
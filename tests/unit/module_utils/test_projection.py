@@ -0,0 +1,177 @@
+from __future__ import annotations
+
+import copy
+import pickle
+from unittest import mock
+
+import pytest
+from ansible_collections.hetzner.hcloud.plugins.inventory.hcloud import (
+    SERVER_FIELDS as INVENTORY_SERVER_FIELDS,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.client import (
+    Client,
+    client_get_by_id,
+    client_get_by_name,
+    client_iter_all,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.projection import (
+    Record,
+    get_path,
+    isoformat,
+    parse_timestamp,
+    project,
+    record_type,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud.servers import (
+    BoundServer,
+)
+from dateutil.parser import isoparse
+
+SERVER = {
+    "id": 1,
+    "name": "my-server",
+    "created": "2016-01-30T23:55:00Z",
+    "datacenter": {"id": 1, "name": "fsn1-dc14", "location": {"id": 1, "name": "fsn1"}},
+    "image": None,
+    "public_net": {
+        "ipv4": {"id": 10, "ip": "203.0.113.1", "blocked": False, "dns_ptr": "server.example.com"},
+        "ipv6": None,
+        "floating_ips": [],
+        "firewalls": [],
+    },
+    "private_net": [],
+    "rescue_enabled": False,
+}
+
+
+@pytest.mark.parametrize(
+    "path, expected",
+    [
+        ("name", "my-server"),
+        ("datacenter.location.name", "fsn1"),
+        ("public_net.ipv4.ip", "203.0.113.1"),
+        ("public_net.ipv6.ip", None),
+        ("image.name", None),
+        ("name.unknown", None),
+        ("unknown", None),
+        ("rescue_enabled", False),
+    ],
+)
+def test_get_path(path: str, expected):
+    assert get_path(SERVER, path) == expected
+
+
+def test_project():
+    assert project(SERVER, {"location": "datacenter.location.name", "ipv6": "public_net.ipv6.ip"}) == {
+        "location": "fsn1",
+        "ipv6": None,
+    }
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        "2016-01-30T23:55:00+00:00",
+        "2016-01-30T23:55:00Z",
+        "2016-01-30T23:55:00.123456+02:00",
+        "2016-01-30T23:55:00.123456789+00:00",
+    ],
+)
+def test_parse_timestamp(value: str):
+    assert parse_timestamp(value) == isoparse(value)
+
+
+def test_isoformat():
+    # Building the bound model modifies its data dict
+    server = BoundServer(mock.MagicMock(), copy.deepcopy(SERVER))
+
+    assert isoformat(SERVER["created"]) == server.created.isoformat()
+    assert isoformat(None) is None
+
+
+def test_get_list_raw():
+    client = Client(token="dummy")
+    client.request = mock.MagicMock(return_value={"servers": [SERVER]})
+
+    result = list(client_iter_all(client, "servers", raw=True, label_selector="key=value", name=None))
+
+    assert result == [SERVER]
+    assert result[0] is client.request.return_value["servers"][0]
+    client.request.assert_called_once_with(
+        url="/servers",
+        method="GET",
+        params={"label_selector": "key=value", "page": 1, "per_page": 50},
+    )
+
+
+def test_record():
+    record = record_type(["id", "name", "datacenter.location.name", "image.name", "private_net.ip"]).from_dict(
+        {
+            "id": 42,
+            "name": "my-server",
+            "datacenter": {"id": 1, "location": {"id": 1, "name": "fsn1"}},
+            "image": None,
+            "private_net": [{"ip": "10.0.0.2"}],
+        }
+    )
+
+    assert record.id == 42
+    assert record["name"] == "my-server"
+    assert record["datacenter.location.name"] == "fsn1"
+    assert record["image.name"] is None
+    assert record["private_net.ip"] is None
+    assert tuple(record) == (42, "my-server", "fsn1", None, None)
+    assert record._asdict()["datacenter.location.name"] == "fsn1"  # pylint: disable=protected-access
+    assert pickle.loads(pickle.dumps(record)) == record
+
+    with pytest.raises(AttributeError):
+        record.unknown  # pylint: disable=pointless-statement
+    with pytest.raises(KeyError):
+        record["unknown"]  # pylint: disable=pointless-statement
+
+
+def test_record_type_cached():
+    assert record_type(["id", "name"]) is record_type(("id", "name"))
+    assert record_type(["id", "name"]) is not record_type(["name", "id"])
+
+
+def test_project_record():
+    record = record_type(["id", "datacenter.location.name"]).from_dict(SERVER)
+    assert project(record, {"location": "datacenter.location.name"}) == {"location": "fsn1"}
+
+
+def test_get_fields():
+    client = Client(token="dummy")
+    client.request = mock.MagicMock(return_value={"servers": [SERVER]})
+
+    fields = ["id", "name", "datacenter.location.name"]
+    servers = list(client_iter_all(client, "servers", fields=fields))
+    assert servers == [(1, "my-server", "fsn1")]
+    assert isinstance(servers[0], Record)
+
+    assert client_get_by_name(client, "servers", "my-server", fields=fields).name == "my-server"
+    client.request.assert_called_with(
+        url="/servers", method="GET", params={"name": "my-server", "page": 1, "per_page": 1}
+    )
+
+    client.request.return_value = {"servers": []}
+    assert client_get_by_name(client, "servers", "unknown", fields=fields) is None
+
+    client.request.return_value = {"server": SERVER}
+    assert client_get_by_id(client, "servers", 1, fields=fields).name == "my-server"
+    client.request.assert_called_with(url="/servers/1", method="GET")
+
+
+def test_record_inventory_fields():
+    """
+    The inventory only projects the fields it uses, without building the servers.
+    """
+    record = record_type(INVENTORY_SERVER_FIELDS).from_dict(SERVER)
+
+    assert isinstance(record, Record)
+    assert len(record) == len(INVENTORY_SERVER_FIELDS)
+    assert record.id == 1
+    assert record["public_net.ipv4.ip"] == "203.0.113.1"
+    assert record["public_net.ipv6.ip"] is None
+    assert record["datacenter.location.name"] == "fsn1"
+    assert record["image.id"] is None
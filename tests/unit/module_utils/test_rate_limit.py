@@ -0,0 +1,206 @@
+from __future__ import annotations
+
+import json
+import os
+import time
+from unittest import mock
+
+import pytest
+import requests
+from ansible_collections.hetzner.hcloud.plugins.module_utils.client import (
+    CachedSession,
+    Client,
+    RateLimiter,
+    client_token_digest,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.hcloud import AnsibleHCloud
+from ansible_collections.hetzner.hcloud.plugins.module_utils.rate_limit import (
+    SharedRateLimiter,
+)
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud import (
+    APIException,
+)
+from requests.adapters import HTTPAdapter
+
+
+def _headers(limit: int, remaining: int, reset_in: int) -> dict:
+    return {
+        "RateLimit-Limit": str(limit),
+        "RateLimit-Remaining": str(remaining),
+        "RateLimit-Reset": str(int(time.time()) + reset_in),
+    }
+
+
+def test_rate_limiter_without_headers():
+    limiter = RateLimiter()
+    limiter.update({"X-Correlation-Id": "abc"})
+
+    assert limiter.rate_limit is None
+    assert limiter.acquire() == 0.0
+
+
+def test_rate_limiter_headroom():
+    limiter = RateLimiter()
+    limiter.update(_headers(3600, 3000, 600))
+
+    rate_limit = limiter.rate_limit
+    assert rate_limit.limit == 3600
+    assert rate_limit.remaining == 3000
+
+    assert limiter.acquire() == 0.0
+    assert limiter.rate_limit.remaining == 2999
+
+
+def test_rate_limiter_paces_when_empty():
+    limiter = RateLimiter()
+    # Requests are replenished at 1 request per second
+    limiter.update(_headers(3600, 0, 3600))
+
+    with mock.patch("time.sleep") as sleep_mock:
+        first = limiter.acquire()
+        second = limiter.acquire()
+
+    assert first == pytest.approx(1.0, abs=0.1)
+    assert second == pytest.approx(2.0, abs=0.1)
+    assert sleep_mock.call_count == 2
+
+
+def _response(status_code: int, body: dict, headers: dict) -> requests.Response:
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = json.dumps(body).encode()  # pylint: disable=protected-access
+    response.headers.update(headers)
+    return response
+
+
+def _rate_limited(headers: dict) -> requests.Response:
+    return _response(429, {"error": {"code": "rate_limit_exceeded", "message": "limit", "details": None}}, headers)
+
+
+def test_client_reads_rate_limit_headers():
+    client = Client(token="dummy")
+
+    with mock.patch.object(HTTPAdapter, "send") as send_mock:
+        send_mock.return_value = _response(200, {"locations": []}, _headers(3600, 3599, 1))
+
+        assert client.rate_limit is None
+        client.request("GET", "/locations")
+
+    assert client.rate_limit.limit == 3600
+    assert client.rate_limit.remaining == 3599
+
+
+def test_client_does_not_backoff_when_rate_limited():
+    client = Client(token="dummy")
+
+    with mock.patch.object(HTTPAdapter, "send") as send_mock, mock.patch("time.sleep") as sleep_mock:
+        send_mock.side_effect = [
+            _rate_limited(_headers(3600, 0, 3600)),
+            _response(200, {}, _headers(3600, 0, 3600)),
+        ]
+        assert client.request("GET", "/locations") == {}
+
+    # Only paced by the rate limiter, at 1 request per second, the retry does not back off
+    assert [call.args[0] for call in sleep_mock.call_args_list if call.args[0]] == [pytest.approx(1.0, abs=0.1)]
+
+
+def test_client_backoff_when_rate_limited_without_headers():
+    client = Client(token="dummy")
+
+    with mock.patch.object(HTTPAdapter, "send") as send_mock, mock.patch("time.sleep") as sleep_mock:
+        send_mock.side_effect = [
+            _response(200, {}, _headers(3600, 3000, 10)),
+            _rate_limited({}),
+            _response(200, {}, {}),
+        ]
+        client.request("GET", "/locations")
+        assert client.rate_limit is not None
+        assert client.request("GET", "/locations") == {}
+
+    # The rate limit state is known from the previous response, but the rate limited
+    # response did not return it, the client must back off.
+    sleep_mock.assert_called_once()
+    assert sleep_mock.call_args.args[0] >= 1.0
+
+
+def test_client_raises_when_rate_limited_too_often():
+    client = Client(token="dummy")
+    client._retry_max_retries = 0  # pylint: disable=protected-access
+
+    with mock.patch.object(HTTPAdapter, "send") as send_mock:
+        send_mock.return_value = _rate_limited(_headers(3600, 0, 3600))
+        with pytest.raises(APIException):
+            client.request("GET", "/locations")
+
+
+def test_client_cached_responses_are_not_paced():
+    rate_limiter = mock.MagicMock(spec=RateLimiter)
+    client = Client(token="dummy", rate_limiter=rate_limiter, session=CachedSession("https://api.hetzner.cloud/v1"))
+
+    with mock.patch.object(HTTPAdapter, "send") as send_mock:
+        send_mock.side_effect = lambda *args, **kwargs: _response(200, {"location": {"id": 1}}, _headers(3600, 3599, 1))
+        client.request("GET", "/locations/1")
+        client.request("GET", "/locations/1")
+
+    send_mock.assert_called_once()
+    rate_limiter.acquire.assert_called_once()
+    rate_limiter.update.assert_called_once()
+
+
+def test_shared_rate_limiter(tmp_path):
+    first = SharedRateLimiter("token", str(tmp_path))
+    second = SharedRateLimiter("token", str(tmp_path))
+    other = SharedRateLimiter("other-token", str(tmp_path))
+    try:
+        assert first.path == second.path != other.path
+        assert first.rate_limit is None
+
+        first.update(_headers(3600, 3000, 600))
+        assert second.rate_limit.remaining == 3000
+        assert other.rate_limit is None
+
+        # Tokens taken by any process are shared
+        first.acquire()
+        second.acquire()
+        assert first.rate_limit.remaining == 2998
+
+        # Requests are spread across the processes once the bucket is empty
+        second.update(_headers(3600, 0, 3600))
+        with mock.patch("time.sleep"):
+            assert first.acquire() == pytest.approx(1.0, abs=0.1)
+            assert second.acquire() == pytest.approx(2.0, abs=0.1)
+    finally:
+        first.close()
+        second.close()
+        other.close()
+
+
+def test_hcloud_shared_rate_limit(module, tmp_path):
+    module.params["shared_rate_limit"] = True
+    AnsibleHCloud.represent = "hcloud_test"
+    with mock.patch(f"{AnsibleHCloud.__module__}.state_directory", return_value=str(tmp_path)):
+        hcloud = AnsibleHCloud(module)
+
+    assert isinstance(hcloud.client.rate_limiter, SharedRateLimiter)
+    hcloud.client.rate_limiter.close()
+
+
+def test_shared_rate_limiter_refuses_symlink(tmp_path):
+    target = tmp_path / "target"
+    target.write_bytes(b"")
+    (tmp_path / f"hcloud-rate-limit-{client_token_digest('token')}").symlink_to(target)
+
+    with pytest.raises(OSError):
+        SharedRateLimiter("token", str(tmp_path))
+
+
+def test_shared_rate_limiter_removes_stale_states(tmp_path):
+    stale = tmp_path / "hcloud-rate-limit-stale"
+    stale.write_bytes(b"")
+    os.utime(stale, (0, 0))
+
+    limiter = SharedRateLimiter("token", str(tmp_path))
+    limiter.close()
+
+    assert not stale.exists()
+    assert os.path.exists(limiter.path)
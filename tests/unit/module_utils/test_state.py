@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import os
+
+import pytest
+from ansible_collections.hetzner.hcloud.plugins.module_utils.state import (
+    open_state_file,
+    state_directory,
+)
+
+
+def test_state_directory(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+
+    path = state_directory()
+    assert path == str(tmp_path / ".ansible" / "tmp" / "hcloud")
+    assert os.stat(path).st_mode & 0o777 == 0o700
+
+    os.chmod(path, 0o755)
+    with pytest.raises(OSError):
+        state_directory()
+
+
+def test_open_state_file(tmp_path):
+    fd = open_state_file(str(tmp_path / "state"))
+    os.close(fd)
+    assert os.stat(tmp_path / "state").st_mode & 0o777 == 0o600
+
+    (tmp_path / "link").symlink_to(tmp_path / "state")
+    with pytest.raises(OSError):
+        open_state_file(str(tmp_path / "link"))
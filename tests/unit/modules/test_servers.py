@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+from unittest import mock
+
+import pytest
+from ansible_collections.hetzner.hcloud.plugins.module_utils.vendor.hcloud import (
+    APIException,
+)
+from ansible_collections.hetzner.hcloud.plugins.modules.servers import (
+    AnsibleHCloudServers,
+    AnsibleHCloudServersItem,
+)
+
+
+class FailJson(Exception):
+    pass
+
+
+def _spec(name: str, **kwargs) -> dict:
+    spec = {
+        "name": name,
+        "server_type": None,
+        "image": None,
+        "image_allow_deprecated": False,
+        "location": None,
+        "datacenter": None,
+        "ssh_keys": None,
+        "volumes": None,
+        "firewalls": None,
+        "private_networks": None,
+        "placement_group": None,
+        "enable_ipv4": True,
+        "enable_ipv6": True,
+        "user_data": None,
+        "backups": None,
+        "labels": None,
+        "delete_protection": None,
+        "rebuild_protection": None,
+        "state": "present",
+    }
+    spec.update(kwargs)
+    return spec
+
+
+@pytest.fixture()
+def hcloud(module):
+    module.check_mode = False
+    module.fail_json.side_effect = FailJson
+    module.params.update({"servers": [], "max_concurrency": 10, "wait": True, "wait_timeout": None})
+
+    obj = AnsibleHCloudServers(module)
+    obj.client = mock.MagicMock()
+    obj.client.rate_limit = None
+    return obj
+
+
+def _server(id: int, name: str) -> mock.MagicMock:
+    server = mock.MagicMock()
+    server.id = id
+    server.name = name
+    return server
+
+
+def _patch_prepare_result():
+    return mock.patch.object(
+        AnsibleHCloudServersItem,
+        "prepare_result",
+        autospec=True,
+        side_effect=lambda item: {"id": item.hcloud_server.id},
+    )
+
+
+def test_servers_partial_failure(hcloud):
+    hcloud.module.params["servers"] = [_spec("server-1"), _spec("server-2"), _spec("server-3")]
+    hcloud.client.servers.get_by_name.return_value = None
+
+    def create(name, **kwargs):
+        if name == "server-2":
+            raise APIException(code="uniqueness_error", message="name is already used", details={})
+        response = mock.MagicMock()
+        response.server = _server(int(name[-1]), name)
+        response.root_password = f"password-{name}"
+        response.next_actions = []
+        return response
+
+    hcloud.client.servers.create.side_effect = create
+    hcloud.client.servers.get_by_id.side_effect = lambda id: _server(id, f"server-{id}")
+
+    with mock.patch.object(AnsibleHCloudServers, "_resolve_dependencies"), mock.patch.object(
+        AnsibleHCloudServersItem, "create_server_params", autospec=True, side_effect=lambda item: {"name": item.name}
+    ), mock.patch.object(
+        AnsibleHCloudServersItem, "setup_created_server", autospec=True
+    ) as setup_mock, _patch_prepare_result():
+        with pytest.raises(FailJson):
+            hcloud.manage_servers()
+
+    # The created servers are set up, even if another server failed
+    assert sorted(call.args[0].name for call in setup_mock.call_args_list) == ["server-1", "server-3"]
+
+    kwargs = hcloud.module.fail_json.call_args.kwargs
+    assert kwargs["msg"] == "failed to create or delete servers: server-2: name is already used (uniqueness_error)"
+    assert "APIException" in kwargs["exception"]
+    assert kwargs["changed"] is True
+    assert kwargs["hcloud_servers"] == [
+        {"name": "server-1", "changed": True, "hcloud_server": {"id": 1}, "root_password": "password-server-1"},
+        {
+            "name": "server-2",
+            "changed": False,
+            "hcloud_server": None,
+            "msg": "name is already used (uniqueness_error)",
+        },
+        {"name": "server-3", "changed": True, "hcloud_server": {"id": 3}, "root_password": "password-server-3"},
+    ]
+
+
+@pytest.mark.parametrize(
+    ("max_concurrency", "remaining", "expected"),
+    [
+        (10, None, 3),
+        (2, None, 2),
+        (10, 4, 2),
+        (10, 0, 1),
+    ],
+)
+def test_servers_max_workers(hcloud, max_concurrency, remaining, expected):
+    hcloud.module.params["max_concurrency"] = max_concurrency
+    if remaining is not None:
+        hcloud.client.rate_limit = mock.MagicMock(remaining=remaining)
+
+    assert hcloud._max_workers(3) == expected  # pylint: disable=protected-access
+
+
+def test_servers_run_concurrently(hcloud):
+    items = [AnsibleHCloudServersItem(hcloud, _spec(f"server-{i}")) for i in range(1, 4)]
+    exception = APIException(code="conflict", message="conflict", details={})
+
+    def call(i: int):
+        if i == 2:
+            raise exception
+        return [f"action-{i}"]
+
+    # pylint: disable=protected-access
+    actions, failures = hcloud._run_concurrently([(item, lambda i=i: call(i)) for i, item in enumerate(items, 1)])
+
+    assert actions == ["action-1", "action-3"]
+    assert failures == [(items[1], exception)]
+    assert hcloud._run_concurrently([]) == ([], [])
+
+
+def test_servers_resolve_dependencies(hcloud):
+    hcloud.resolved = {}
+    created = [
+        AnsibleHCloudServersItem(hcloud, _spec(f"server-{i}", server_type="cpx22", location="fsn1", ssh_keys=["key"]))
+        for i in (1, 2)
+    ]
+    updated = AnsibleHCloudServersItem(
+        hcloud, _spec("server-3", server_type="cpx32", location="nbg1", ssh_keys=["other"], firewalls=["fw"])
+    )
+    updated.hcloud_server = _server(3, "server-3")
+
+    with mock.patch.object(
+        hcloud, "_client_resolve_many", side_effect=lambda resource, params: [f"{resource}:{p}" for p in params]
+    ) as resolve_mock, mock.patch.object(AnsibleHCloudServersItem, "check_and_warn_deprecated_server") as warn_mock:
+        hcloud._resolve_dependencies([*created, updated])  # pylint: disable=protected-access
+
+    # Each resource is resolved once for all the servers, the create only params of the
+    # existing servers are not resolved.
+    assert {call.args[0]: call.args[1] for call in resolve_mock.call_args_list} == {
+        "server_types": ["cpx22", "cpx32"],
+        "locations": ["fsn1"],
+        "ssh_keys": ["key"],
+        "firewalls": ["fw"],
+    }
+    # Only the server types of the created servers are checked
+    warn_mock.assert_called_once_with("server_types:cpx22")
+
+
+def test_servers_match_existing_by_name_only(hcloud):
+    hcloud.module.check_mode = True
+    hcloud.module.params["servers"] = [_spec("123", state="absent"), _spec("server-1", state="absent")]
+    hcloud.client.servers.get_by_name.side_effect = lambda name: _server(1, name) if name == "server-1" else None
+
+    with _patch_prepare_result():
+        hcloud.manage_servers()
+
+    hcloud.client.servers.get_by_id.assert_not_called()
+    assert [item.result["changed"] for item in hcloud.hcloud_servers] == [False, True]
+    assert hcloud.result["changed"] is True